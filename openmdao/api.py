@@ -18,6 +18,7 @@ from openmdao.core.parallel_fd_group import ParallelFDGroup
 from openmdao.core.problem import Problem
 from openmdao.core.system import System, AnalysisError
 from openmdao.core.driver import Driver
+from openmdao.core.eval_cache import StateCache
 from openmdao.core.basic_impl import BasicImpl
 try:
     from openmdao.core.petsc_impl import PetscImpl
@@ -47,6 +48,7 @@ from openmdao.recorders.case_reader import CaseReader
 
 #solvers
 from openmdao.solvers.ln_direct import DirectSolver
+from openmdao.solvers.ln_block_direct import BlockDirectSolver
 from openmdao.solvers.ln_gauss_seidel import LinearGaussSeidel
 from openmdao.solvers.newton import Newton
 from openmdao.solvers.nl_gauss_seidel import NLGaussSeidel
@@ -54,6 +56,7 @@ from openmdao.solvers.run_once import RunOnce
 from openmdao.solvers.scipy_gmres import ScipyGMRES
 from openmdao.solvers.solver_base import LinearSolver, NonLinearSolver
 from openmdao.solvers.brent import Brent
+from openmdao.solvers.broyden import Broyden
 try:
     from openmdao.solvers.petsc_ksp import PetscKSP
 except ImportError:
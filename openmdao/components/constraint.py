@@ -53,6 +53,13 @@ class ConstraintComp(ExecComp):
         in check_partial_derivatives"
     deriv_options['linearize'] : bool(False)
         Set to True if you want linearize to be called even though you are using FD.
+    deriv_options['fd_workers'] :  int(1)
+        Number of local worker processes, forked from this one, used to compute
+        finite difference columns concurrently. The model must be safe to run in
+        several processes at once, so it can't be used for systems containing
+        an ExternalCode. The workers are kept until cleanup and are sent the
+        current variable values for each finite difference. Columns are
+        computed serially where the 'fork' start method isn't available.
     """
 
     def __init__(self, expr, out='out'):
@@ -11,6 +11,7 @@ from six import string_types
 
 from openmdao.core.component import Component
 from openmdao.util.array_util import array_idx_iter
+from openmdao.util.options import OptionsDictionary
 from collections import OrderedDict
 
 # regex to check for variable names.
@@ -89,6 +90,32 @@ class ExecComp(Component):
         in check_partial_derivatives"
     deriv_options['linearize'] : bool(False)
         Set to True if you want linearize to be called even though you are using FD.
+    deriv_options['fd_workers'] :  int(1)
+        Number of local worker processes, forked from this one, used to compute
+        finite difference columns concurrently. The model must be safe to run in
+        several processes at once, so it can't be used for systems containing
+        an ExternalCode. The workers are kept until cleanup and are sent the
+        current variable values for each finite difference. Columns are
+        computed serially where the 'fork' start method isn't available.
+    options['linearize_mode'] :  str('loop')
+        How the complex step Jacobian is computed. 'loop' evaluates the
+        expressions once per param entry. 'vectorized' evaluates them once
+        per block of param entries, with the perturbations laid out along an
+        extra trailing axis of every array param. Each param is first checked
+        against 'loop' at a randomly perturbed point, and falls back to 'loop'
+        if the results differ (e.g. the expressions reduce over the param) or
+        the expressions don't support the extra axis. 'diagonal' evaluates
+        each param whose entries each affect at most one entry of every
+        output (e.g. elementwise expressions) with a single complex step, and
+        the other params as in 'vectorized'. The sparsity it relies on is
+        sampled once per setup, from 'loop' Jacobians at two randomly
+        perturbed points, rather than derived from the expressions. Entries
+        that are zero at both points are taken to be always zero, so use
+        'vectorized' for expressions whose sparsity depends on the values,
+        e.g. those using numpy.where or comparisons.
+    options['vectorize_block_size'] :  int(0)
+        Number of param entries perturbed together in 'vectorized' mode. Zero
+        means all entries of a param at once.
 
     Notes
     -----
@@ -114,6 +141,29 @@ class ExecComp(Component):
         # if complex step is used for derivatives, this is the stepsize
         self.complex_stepsize = 1.e-6
 
+        self.options = OptionsDictionary()
+        self.options.add_option('linearize_mode', 'loop',
+                                values=['loop', 'vectorized', 'diagonal'],
+                                desc="How the complex step Jacobian is computed: "
+                                     "'loop' (one evaluation per param entry), "
+                                     "'vectorized' (one evaluation per block of "
+                                     "entries) or 'diagonal' (one evaluation per "
+                                     "param for elementwise expressions).")
+        self.options.add_option('vectorize_block_size', 0, lower=0,
+                                desc="Number of param entries perturbed together "
+                                     "in 'vectorized' mode. Zero means all of them.")
+
+        # params that can't be evaluated with an extra trailing axis
+        self._loop_params = set()
+
+        # params whose vectorized derivatives have been checked against the
+        # loop
+        self._vector_params = set()
+
+        # for each (unknown, param) pair that can be found with a single
+        # complex step, the column that each unknown entry depends on
+        self._single_step_cols = None
+
         if isinstance(exprs, string_types):
             exprs = [exprs]
 
@@ -183,9 +233,23 @@ class ExecComp(Component):
 
         return [compile(expr, expr, 'exec') for expr in exprs]
 
+    def pre_setup(self, problem):
+        """
+        Forgets which params can be vectorized and the sparsity found by
+        'diagonal' mode, since the variables may change in this setup.
+
+        Args
+        ----------
+        problem : OpenMDAO.Problem
+            The Problem instance to which this component belongs.
+        """
+        self._loop_params = set()
+        self._vector_params = set()
+        self._single_step_cols = None
+
     def __getstate__(self):
         """ Returns state as a dict. """
-        state = self.__dict__.copy()
+        state = super(ExecComp, self).__getstate__()
         del state['_codes']
         return state
 
@@ -234,54 +298,317 @@ class ExecComp(Component):
             and whose values are ndarrays.
         """
 
+        J = OrderedDict()
+        mode = self.options['linearize_mode']
+
+        if mode == 'diagonal':
+            if self._single_step_cols is None:
+                self._single_step_cols = self._find_single_step_cols(params,
+                                                                     unknowns,
+                                                                     resids)
+            single = self._single_step_cols
+        else:
+            single = {}
+
+        for param in params:
+            if param in single and \
+               self._linearize_single_step(param, single[param], params,
+                                           unknowns, resids, J):
+                continue
+
+            if mode == 'loop' or param in self._loop_params:
+                self._linearize_loop(param, params, unknowns, resids, J)
+            elif not self._linearize_vectorized(param, params, unknowns,
+                                                resids, J):
+                self._loop_params.add(param)
+                self._linearize_loop(param, params, unknowns, resids, J)
+
+        return J
+
+    def _linearize_loop(self, param, params, unknowns, resids, J):
+        """
+        Complex step the given param one entry at a time, storing the
+        resulting sub-Jacobians in J.
+        """
+
         # our complex step
         step = self.complex_stepsize * 1j
 
-        J = OrderedDict()
         non_pbo_unknowns = self._non_pbo_unknowns
 
-        for param in params:
+        pwrap = _TmpDict(params)
+
+        pval = params[param]
+        if isinstance(pval, ndarray):
+            # replace the param array with a complex copy
+            pwrap[param] = numpy.asarray(pval, complex)
+            idx_iter = array_idx_iter(pwrap[param].shape)
+            psize = pval.size
+        else:
+            pwrap[param] = complex(pval)
+            idx_iter = (None,)
+            psize = 1
+
+        for i, idx in enumerate(idx_iter):
+            # set a complex param value
+            if idx is None:
+                pwrap[param] += step
+            else:
+                pwrap[param][idx] += step
+
+            uwrap = _TmpDict(unknowns, complex=True)
 
-            pwrap = _TmpDict(params)
+            # solve with complex param value
+            self.solve_nonlinear(pwrap, uwrap, resids)
 
-            pval = params[param]
-            if isinstance(pval, ndarray):
-                # replace the param array with a complex copy
-                pwrap[param] = numpy.asarray(pval, complex)
-                idx_iter = array_idx_iter(pwrap[param].shape)
-                psize = pval.size
+            for u in non_pbo_unknowns:
+                jval = numpy.atleast_1d(imag(uwrap[u] / self.complex_stepsize))
+                if (u, param) not in J: # create the dict entry
+                    J[(u, param)] = numpy.zeros((jval.size, psize))
+
+                # set the column in the Jacobian entry
+                J[(u, param)][:, i] = jval.flat
+
+            # restore old param value
+            if idx is None:
+                pwrap[param] -= step
             else:
-                pwrap[param] = complex(pval)
-                idx_iter = (None,)
-                psize = 1
+                pwrap[param][idx] -= step
 
-            for i, idx in enumerate(idx_iter):
-                # set a complex param value
-                if idx is None:
-                    pwrap[param] += step
-                else:
-                    pwrap[param][idx] += step
+    def _batch_params(self, params):
+        """
+        Returns a wrapper for params where every array param has an extra
+        trailing axis of length 1, so it broadcasts against a batch of
+        perturbations.
+        """
+        pwrap = _TmpDict(params)
+        for name in params:
+            val = params[name]
+            if isinstance(val, ndarray):
+                pwrap[name] = val[..., numpy.newaxis]
+        return pwrap
 
-                uwrap = _TmpDict(unknowns, complex=True)
+    def _eval_batch(self, param, pwrap, pval, seeds, unknowns, resids):
+        """
+        Evaluate the expressions with `param` perturbed by each column of
+        `seeds`, and return the imaginary part of each unknown divided by
+        the step size, shaped (unknown size, number of seeds).  Returns None
+        if the expressions don't broadcast along the trailing axis. Other
+        errors are raised, as they would be in 'loop' mode.
+        """
+        nseeds = seeds.shape[1]
+        shape = numpy.shape(pval)
 
-                # solve with complex param value
-                self.solve_nonlinear(pwrap, uwrap, resids)
+        pwrap[param] = (numpy.asarray(pval, complex).reshape(shape + (1,)) +
+                        seeds.reshape(shape + (nseeds,)) * self.complex_stepsize * 1j)
+        uwrap = _TmpDict(unknowns, complex=True)
 
-                for u in non_pbo_unknowns:
-                    jval = numpy.atleast_1d(imag(uwrap[u] / self.complex_stepsize))
-                    if (u, param) not in J: # create the dict entry
-                        J[(u, param)] = numpy.zeros((jval.size, psize))
+        try:
+            self.solve_nonlinear(pwrap, uwrap, resids)
+        except (ValueError, IndexError):
+            # shapes that don't broadcast, or indexing that assumes the
+            # original number of dimensions
+            return None
+
+        derivs = {}
+        for u in self._non_pbo_unknowns:
+            ushape = numpy.shape(unknowns[u])
+            jval = imag(numpy.asarray(uwrap[u])) / self.complex_stepsize
+            if jval.shape == ushape + (nseeds,):
+                derivs[u] = jval.reshape((-1, nseeds))
+            elif not jval.any():
+                # unknown doesn't depend on this param
+                derivs[u] = numpy.zeros((int(numpy.prod(ushape)), nseeds))
+            else:
+                return None
 
-                    # set the column in the Jacobian entry
-                    J[(u, param)][:, i] = jval.flat
+        return derivs
 
-                # restore old param value
-                if idx is None:
-                    pwrap[param] -= step
-                else:
-                    pwrap[param][idx] -= step
+    def _perturbed_params(self, params, rng):
+        """
+        Returns a wrapper for params where every float param is moved to a
+        random point near its current value, so that no entry of a Jacobian
+        evaluated there is zero by coincidence.
+        """
+        pwrap = _TmpDict(params)
+        for name in params:
+            val = params[name]
+            if isinstance(val, ndarray):
+                if numpy.issubdtype(val.dtype, numpy.floating):
+                    pwrap[name] = val + rng.uniform(0.1, 1.0, val.shape) * \
+                                        (1.0 + numpy.abs(val))
+            elif isinstance(val, float):
+                pwrap[name] = val + rng.uniform(0.1, 1.0) * (1.0 + abs(val))
+        return pwrap
+
+    def _vectorized_blocks(self, param, params, unknowns, resids):
+        """
+        Complex step the given param one block of entries at a time.
 
-        return J
+        Returns
+        -------
+        dict or None
+            The sub-Jacobian of each unknown with respect to the param, or
+            None if the expressions can't be evaluated with an extra trailing
+            axis.
+        """
+        pwrap = self._batch_params(params)
+        pval = params[param]
+        psize = numpy.size(pval)
+
+        block = self.options['vectorize_block_size']
+        if block == 0:
+            block = psize
+
+        blocks = {}
+        for start in range(0, psize, block):
+            end = min(start + block, psize)
+
+            seeds = numpy.zeros((psize, end - start))
+            seeds[numpy.arange(start, end), numpy.arange(end - start)] = 1.0
+
+            derivs = self._eval_batch(param, pwrap, pval, seeds,
+                                      unknowns, resids)
+            if derivs is None:
+                return None
+
+            for u, jval in derivs.items():
+                if u not in blocks:
+                    blocks[u] = numpy.zeros((jval.shape[0], psize))
+                blocks[u][:, start:end] = jval
+
+        return blocks
+
+    def _check_vectorized(self, param, params, unknowns, resids):
+        """
+        Compare the vectorized derivatives of the given param with the loop
+        at a randomly perturbed point. Expressions that reduce over the
+        param (e.g. 'y=x*numpy.sum(x)') mix the perturbations along the
+        trailing axis but can keep the right shape, so only the values show
+        that the vectorized derivatives are wrong.
+
+        Returns
+        -------
+        bool
+            True if the vectorized derivatives match the loop.
+        """
+        pwrap = self._perturbed_params(params, numpy.random.RandomState(0))
+
+        blocks = self._vectorized_blocks(param, pwrap, unknowns, resids)
+        if blocks is None:
+            return False
+
+        J = {}
+        self._linearize_loop(param, pwrap, unknowns, resids, J)
+
+        for u in self._non_pbo_unknowns:
+            if not numpy.allclose(blocks[u], J[(u, param)],
+                                  rtol=1e-8, atol=1e-12):
+                return False
+
+        return True
+
+    def _linearize_vectorized(self, param, params, unknowns, resids, J):
+        """
+        Complex step the given param one block of entries at a time, storing
+        the resulting sub-Jacobians in J.
+
+        Returns
+        -------
+        bool
+            False if the expressions can't be evaluated with an extra
+            trailing axis, or give different derivatives than the loop.
+        """
+        if param not in self._vector_params:
+            if not self._check_vectorized(param, params, unknowns, resids):
+                return False
+            self._vector_params.add(param)
+
+        blocks = self._vectorized_blocks(param, params, unknowns, resids)
+        if blocks is None:
+            return False
+
+        for u in self._non_pbo_unknowns:
+            J[(u, param)] = blocks[u]
+
+        return True
+
+    def _linearize_single_step(self, param, cols, params, unknowns, resids, J):
+        """
+        Complex step all entries of the given param at once. Each entry of
+        every unknown depends on at most one entry of the param, given by
+        `cols`.
+
+        Returns
+        -------
+        bool
+            False if the expressions can't be evaluated with an extra
+            trailing axis.
+        """
+        pwrap = self._batch_params(params)
+        pval = params[param]
+        psize = numpy.size(pval)
+
+        derivs = self._eval_batch(param, pwrap, pval, numpy.ones((psize, 1)),
+                                  unknowns, resids)
+        if derivs is None:
+            return False
+
+        for u in self._non_pbo_unknowns:
+            ucols = cols[u]
+            rows = numpy.nonzero(ucols >= 0)[0]
+            jac = numpy.zeros((len(ucols), psize))
+            jac[rows, ucols[rows]] = derivs[u][rows, 0]
+            J[(u, param)] = jac
+
+        return True
+
+    def _find_single_step_cols(self, params, unknowns, resids, npoints=2):
+        """
+        Find the params that can be complex stepped with a single evaluation.
+        The sparsity of each sub-Jacobian is the union of the nonzero entries
+        of loop Jacobians at `npoints` randomly perturbed points, so it
+        doesn't depend on entries that happen to be zero at the current
+        point. It is sampled, not derived from the expressions, so an entry
+        that is zero at all of those points is assumed to always be zero.
+
+        Returns
+        -------
+        dict
+            For each such param, a dict that maps each unknown to the param
+            entry that each of its entries depends on (-1 for none).
+        """
+        rng = numpy.random.RandomState(0)
+        pwraps = [self._perturbed_params(params, rng) for i in range(npoints)]
+
+        single = {}
+        for param in params:
+            if param in self._loop_params:
+                continue
+
+            nonzero = {}
+            for pwrap in pwraps:
+                J = {}
+                self._linearize_loop(param, pwrap, unknowns, resids, J)
+                for u in self._non_pbo_unknowns:
+                    nz = J[(u, param)] != 0.0
+                    if u in nonzero:
+                        nonzero[u] |= nz
+                    else:
+                        nonzero[u] = nz
+
+            pcols = {}
+            for u in self._non_pbo_unknowns:
+                nz = nonzero[u]
+                if numpy.any(nz.sum(axis=1) > 1):
+                    break
+                ucols = numpy.argmax(nz, axis=1)
+                ucols[~nz.any(axis=1)] = -1
+                pcols[u] = ucols
+            else:
+                single[param] = pcols
+
+        return single
 
 
 class _TmpDict(object):
@@ -324,6 +651,9 @@ class _TmpDict(object):
     def __contains__(self, name):
         return name in self._inner or name in self._changed
 
+    def __iter__(self):
+        return iter(self._inner)
+
     def __getattr__(self, name):
         return getattr(self._inner, name)
 
@@ -47,6 +47,13 @@ class MetaModel(Component):
         in check_partial_derivatives"
     deriv_options['linearize'] : bool(False)
         Set to True if you want linearize to be called even though you are using FD.
+    deriv_options['fd_workers'] :  int(1)
+        Number of local worker processes, forked from this one, used to compute
+        finite difference columns concurrently. The model must be safe to run in
+        several processes at once, so it can't be used for systems containing
+        an ExternalCode. The workers are kept until cleanup and are sent the
+        current variable values for each finite difference. Columns are
+        computed serially where the 'fork' start method isn't available.
     """
 
     def __init__(self):
@@ -62,6 +69,9 @@ class MetaModel(Component):
 
         # training will occur on first execution
         self.train = True
+
+        # _setup_variables resets our surrogates, so always do a full setup
+        self._incremental_setup = False
         self._training_input = np.zeros(0)
         self._training_output = {}
 
@@ -50,6 +50,10 @@ class SubProblem(Component):
         self._prob_params = list(params)
         self._prob_unknowns = list(unknowns)
 
+        # our subproblem is set up from _setup_communicators, so it can't be
+        # skipped.
+        self._incremental_setup = False
+
     def check_setup(self, out_stream=sys.stdout):
         """Write a report to the given stream indicating any potential problems
         found with the current configuration of this ``System``.
@@ -70,6 +74,7 @@ class SubProblem(Component):
             self._problem.cleanup()
         except:
             _reraise(self.pathname,  sys.exc_info())
+        super(SubProblem, self).cleanup()
 
     def get_req_procs(self):
         """
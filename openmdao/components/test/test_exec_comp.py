@@ -233,6 +233,126 @@ class TestExecComp(unittest.TestCase):
 
         assert_rel_error(self, J[('y','x')], expect, 0.00001)
 
+    def _count_evals(self, comp):
+        count = [0]
+        solve = comp.solve_nonlinear
+        def counting_solve(params, unknowns, resids):
+            count[0] += 1
+            solve(params, unknowns, resids)
+        comp.solve_nonlinear = counting_solve
+        return count
+
+    def test_vectorized_complex_step(self):
+        prob = Problem(root=Group())
+        C1 = prob.root.add('C1', ExecComp(['y=3.0*x**2 + z*w', 'v=numpy.sum(x)'],
+                                          x=np.arange(1., 6.), z=np.ones(5),
+                                          w=2.0, y=np.zeros(5)))
+        prob.setup(check=False)
+        prob.run()
+
+        Jloop = C1.linearize(C1.params, C1.unknowns, C1.resids)
+        count = self._count_evals(C1)
+
+        C1.options['linearize_mode'] = 'vectorized'
+        J = C1.linearize(C1.params, C1.unknowns, C1.resids)
+
+        # numpy.sum mixes the perturbations, so x falls back to the loop.
+        # z and w are checked once against the loop at a perturbed point.
+        self.assertEqual(C1._loop_params, set(['x']))
+        self.assertEqual(count[0], (1 + 5) + (1 + 5 + 1) + (1 + 1 + 1))
+        for key in Jloop:
+            assert_rel_error(self, J[key], Jloop[key], 1e-10)
+
+        C1.options['vectorize_block_size'] = 2
+        count[0] = 0
+        J = C1.linearize(C1.params, C1.unknowns, C1.resids)
+        self.assertEqual(count[0], 5 + 3 + 1)
+        for key in Jloop:
+            assert_rel_error(self, J[key], Jloop[key], 1e-10)
+
+    def test_vectorized_complex_step_reduction(self):
+        prob = Problem(root=Group())
+        C1 = prob.root.add('C1', ExecComp('y=x*numpy.sum(x)',
+                                          x=np.arange(1., 5.), y=np.zeros(4)))
+        prob.setup(check=False)
+        prob.run()
+
+        C1.options['linearize_mode'] = 'vectorized'
+        J = C1.linearize(C1.params, C1.unknowns, C1.resids)
+
+        # the output keeps its shape, but the sum mixes the perturbations
+        x = np.arange(1., 5.)
+        self.assertEqual(C1._loop_params, set(['x']))
+        assert_rel_error(self, J[('y', 'x')],
+                         np.diag(np.ones(4)*np.sum(x)) + x[:, np.newaxis], 1e-10)
+
+    def test_vectorized_complex_step_error(self):
+        prob = Problem(root=Group())
+        C1 = prob.root.add('C1', ExecComp('y=2.0*x', x=np.ones(3),
+                                          y=np.zeros(3)))
+        prob.setup(check=False)
+        prob.run()
+
+        def failing_solve(params, unknowns, resids):
+            raise RuntimeError('failed')
+        C1.solve_nonlinear = failing_solve
+
+        # only shape errors make a param fall back to the loop
+        C1.options['linearize_mode'] = 'vectorized'
+        with self.assertRaises(RuntimeError) as cm:
+            C1.linearize(C1.params, C1.unknowns, C1.resids)
+
+        self.assertEqual(str(cm.exception), 'failed')
+        self.assertEqual(C1._loop_params, set())
+
+    def test_diagonal_complex_step(self):
+        prob = Problem(root=Group())
+        C1 = prob.root.add('C1', ExecComp('y=3.0*x**2 + z[1:]*w',
+                                          x=np.arange(1., 5.), z=np.ones(5),
+                                          w=2.0, y=np.zeros(4)))
+        prob.setup(check=False)
+        prob.run()
+
+        # the first linearization finds which params need a single step
+        C1.options['linearize_mode'] = 'diagonal'
+        C1.linearize(C1.params, C1.unknowns, C1.resids)
+
+        prob['C1.x'] = np.array([.5, -2., 3., 1.5])
+        count = self._count_evals(C1)
+        J = C1.linearize(C1.params, C1.unknowns, C1.resids)
+
+        # one evaluation per param
+        self.assertEqual(count[0], 3)
+        assert_rel_error(self, J[('y', 'x')], np.diag(6.0*np.array([.5, -2., 3., 1.5])), 1e-10)
+        assert_rel_error(self, J[('y', 'z')], np.eye(4, 5, 1)*2.0, 1e-10)
+        assert_rel_error(self, J[('y', 'w')], np.ones((4, 1)), 1e-10)
+
+    def test_diagonal_complex_step_zero_start(self):
+        prob = Problem(root=Group())
+        C1 = prob.root.add('C1', ExecComp('y=x**2 + numpy.sum(z)*x',
+                                          x=np.zeros(3), z=np.zeros(3),
+                                          y=np.zeros(3)))
+        prob.setup(check=False)
+        prob.run()
+
+        # all derivatives are zero here, but not structurally zero
+        C1.options['linearize_mode'] = 'diagonal'
+        J = C1.linearize(C1.params, C1.unknowns, C1.resids)
+        assert_rel_error(self, J[('y', 'x')], np.zeros((3, 3)), 1e-10)
+
+        x = np.array([1., -2., 3.])
+        z = np.array([.5, .5, 1.])
+        prob['C1.x'] = x
+        prob['C1.z'] = z
+        J = C1.linearize(C1.params, C1.unknowns, C1.resids)
+        assert_rel_error(self, J[('y', 'x')], np.diag(2.0*x + np.sum(z)), 1e-10)
+        assert_rel_error(self, J[('y', 'z')], np.outer(x, np.ones(3)), 1e-10)
+
+        # the sparsity is found again after another setup
+        self.assertEqual(set(C1._single_step_cols), set(['x']))
+        prob.setup(check=False)
+        self.assertEqual(C1._single_step_cols, None)
+
     def test_colon_names(self):
         prob = Problem(root=Group())
         C1 = prob.root.add('C1', ExecComp('a:y=a:x+1.+b', inits={'a:x':2.0}, b=0.5))
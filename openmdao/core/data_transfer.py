@@ -3,11 +3,16 @@
 from six.moves import zip
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from openmdao.util.array_util import to_slice
 from openmdao.core.mpi_wrap import MPI
 from openmdao.core.fileref import FileRef
 
+# Slice runs shorter than this are merged into a single index array, because
+# the python loop overhead per slice outweighs the cost of fancy indexing.
+_MIN_SLICE_SIZE = 16
+
 class DataTransfer(object):
     """
     An object that performs data transfer between a source vector and a
@@ -84,6 +89,53 @@ class DataTransfer(object):
                 scatters.append((srcs, tgts, src_unique))
 
         self.scatters = scatters
+        self._compile(scatters)
+
+    def _compile(self, scatters):
+        """ Compiles the scatters into a transfer plan. Long slice runs are
+        kept as slices, which copy without temporaries. Everything else is
+        merged into one pair of index arrays that is moved with a single
+        np.take/np.put into a preallocated buffer. If the merged source
+        indices are not unique, the reverse accumulation is precomputed as a
+        sparse matrix product.
+
+        Args
+        ----
+        scatters : list of tuples
+            List of (src, tgt, src_unique) for each scatter.
+        """
+        self._slices = []
+        src_idxs = []
+        tgt_idxs = []
+
+        for srcs, tgts, _ in scatters:
+            if isinstance(srcs, slice) and isinstance(tgts, slice) and \
+               len(range(srcs.start, srcs.stop, srcs.step or 1)) >= _MIN_SLICE_SIZE:
+                self._slices.append((srcs, tgts))
+            else:
+                src_idxs.append(_to_idx_array(srcs))
+                tgt_idxs.append(_to_idx_array(tgts))
+
+        if src_idxs:
+            self._src_idxs = np.concatenate(src_idxs)
+            self._tgt_idxs = np.concatenate(tgt_idxs)
+        else:
+            self._src_idxs = self._tgt_idxs = np.zeros(0, dtype=int)
+
+        self._buf = np.empty(len(self._src_idxs))
+
+        # In reverse, duplicate sources accumulate contributions from several
+        # targets. Rows of the matrix are the unique sources, and columns are
+        # the merged entries.
+        uniq, inv = np.unique(self._src_idxs, return_inverse=True)
+        if len(uniq) < len(self._src_idxs):
+            nidx = len(self._src_idxs)
+            self._rev_idxs = uniq
+            self._rev_mat = csr_matrix((np.ones(nidx), (inv, np.arange(nidx))),
+                                       shape=(len(uniq), nidx))
+        else:
+            self._rev_idxs = self._src_idxs
+            self._rev_mat = None
 
     def transfer(self, srcvec, tgtvec, mode='fwd', deriv=False):
         """
@@ -107,23 +159,38 @@ class DataTransfer(object):
             If True, this is a derivative data transfer, so no pass_by_obj
             variables will be transferred.
         """
+        buf = self._buf
+        src_idxs = self._src_idxs
+        tgt_idxs = self._tgt_idxs
+
         if mode == 'rev':
             # in reverse mode, srcvec and tgtvec are switched. Note, we only
             # run in reverse for derivatives, and derivatives accumulate from
             # all targets. byobjs are never scattered in reverse
-            for isrcs, itgts, src_unique in self.scatters:
-                if src_unique:
-                    srcvec.vec[isrcs] += tgtvec.vec[itgts]
+            for isrcs, itgts in self._slices:
+                srcvec.vec[isrcs] += tgtvec.vec[itgts]
+
+            if len(src_idxs):
+                np.take(tgtvec.vec, tgt_idxs, out=buf)
+                if self._rev_mat is None:
+                    srcvec.vec[src_idxs] += buf
                 else:
-                    np.add.at(srcvec.vec, isrcs, tgtvec.vec[itgts])
+                    srcvec.vec[self._rev_idxs] += self._rev_mat.dot(buf)
         else:
+            for isrcs, itgts in self._slices:
+                tgtvec.vec[itgts] = srcvec.vec[isrcs]
+
+            if len(src_idxs):
+                np.take(srcvec.vec, src_idxs, out=buf)
+                np.put(tgtvec.vec, tgt_idxs, buf)
+
             if tgtvec._probdata.in_complex_step:
-                for isrcs, itgts, _ in self.scatters:
-                    tgtvec.vec[itgts] = srcvec.vec[isrcs]
+                for isrcs, itgts in self._slices:
                     tgtvec.imag_vec[itgts] = srcvec.imag_vec[isrcs]
-            else:
-                for isrcs, itgts, _ in self.scatters:
-                    tgtvec.vec[itgts] = srcvec.vec[isrcs]
+
+                if len(src_idxs):
+                    np.take(srcvec.imag_vec, src_idxs, out=buf)
+                    np.put(tgtvec.imag_vec, tgt_idxs, buf)
 
             # forward, include byobjs if not a deriv scatter
             if not deriv:
@@ -132,3 +199,10 @@ class DataTransfer(object):
                         tgtvec[tgt]._assign_to(srcvec[src])
                     else:
                         tgtvec[tgt] = srcvec[src]
+
+
+def _to_idx_array(idxs):
+    """ Returns the index array equivalent to a slice or index array. """
+    if isinstance(idxs, slice):
+        return np.arange(idxs.start, idxs.stop, idxs.step or 1, dtype=int)
+    return np.asarray(idxs, dtype=int)
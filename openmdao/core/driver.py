@@ -62,6 +62,12 @@ class Driver(object):
         self.dv_conversions = {}
         self.fn_conversions = {}
 
+        # The user can assign a `StateCache` here to seed the unknowns of the
+        # model from the nearest previously converged design point before
+        # each run.
+        self.state_cache = None
+        self._state_idxs = None
+
     def _setup(self):
         """ Updates metadata for params, constraints and objectives, and
         check for errors. Also determines all variables that need to be
@@ -155,6 +161,18 @@ class Driver(object):
 
             self.fn_conversions[name] = scaler
 
+        # Entries of unknowns.vec that are seeded from the state cache. The
+        # outputs of IndepVarComps, including the design variables, are left
+        # alone.
+        idxs = []
+        for name, acc in iteritems(root.unknowns._dat):
+            if acc.slice is not None and not acc.meta.get('_canset_'):
+                idxs.append(np.arange(*acc.slice))
+        if idxs:
+            self._state_idxs = np.concatenate(idxs)
+        else:
+            self._state_idxs = np.zeros(0, dtype=int)
+
     def _setup_communicators(self, comm, parent_dir):
         """
         Assign a communicator to the root `System`.
@@ -783,10 +801,43 @@ class Driver(object):
 
         # Solve the system once and record results.
         with system._dircontext:
-            system.solve_nonlinear(metadata=metadata)
+            self._solve_model(metadata)
 
         self.recorders.record_iteration(system, metadata)
 
+    def _solve_model(self, metadata):
+        """ Runs solve_nonlinear on root. If there is a state cache, the
+        unknowns are first seeded from the nearest cached design point, and
+        the converged unknowns are added to the cache afterwards.
+
+        Args
+        ----
+        metadata : dict
+            Dictionary containing execution metadata (e.g. iteration coordinate).
+        """
+        system = self.root
+        cache = self.state_cache
+
+        if cache is None:
+            system.solve_nonlinear(metadata=metadata)
+            return
+
+        desvars = self.get_desvars()
+        if desvars:
+            x = np.concatenate([np.asarray(val, dtype=float).ravel()
+                                for val in desvars.values()])
+        else:
+            x = np.zeros(0)
+
+        vec = system.unknowns.vec
+        states = cache.nearest(x)
+        if states is not None:
+            vec[self._state_idxs] = states
+
+        system.solve_nonlinear(metadata=metadata)
+
+        cache.add(x, vec[self._state_idxs])
+
     def calc_gradient(self, indep_list, unknown_list, mode='auto',
                       return_format='array', sparsity=None, inactives=None):
         """ Returns the scaled gradient for the system that is contained in
@@ -0,0 +1,198 @@
+""" Caches of the model evaluations and states used by a Driver."""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class EvalCache(object):
+    """ A least recently used cache of the functions (and optionally the
+    gradients) evaluated by a driver, keyed on a hash of the bytes of the
+    design vector. Optimizers often request the same design point more than
+    once, and a hit lets the driver skip running the model.
+
+    Args
+    ----
+    size : int
+        Maximum number of design points kept. The least recently used entry
+        is dropped when a new point would exceed it.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, x):
+        return self.key(x) in self._entries
+
+    def key(self, x):
+        """
+        Args
+        ----
+        x : ndarray
+            Design vector.
+
+        Returns
+        -------
+        bytes
+            Hash of the bytes of the design vector.
+        """
+        x = np.ascontiguousarray(x, dtype=float)
+        return hashlib.sha1(x.tobytes()).digest()
+
+    def get(self, x, field):
+        """ Looks up one stored field of a design point and counts the hit
+        or miss.
+
+        Args
+        ----
+        x : ndarray
+            Design vector.
+
+        field : str
+            Name of the stored quantity, e.g. 'funcs' or 'grad'.
+
+        Returns
+        -------
+        object or None
+            The stored value, or None if it isn't cached for `x`.
+        """
+        key = self.key(x)
+        entry = self._entries.get(key)
+        if entry is None or field not in entry:
+            self.misses += 1
+            return None
+
+        # Mark as most recently used.
+        del self._entries[key]
+        self._entries[key] = entry
+
+        self.hits += 1
+        return entry[field]
+
+    def set(self, x, field, val):
+        """ Stores one field of a design point.
+
+        Args
+        ----
+        x : ndarray
+            Design vector.
+
+        field : str
+            Name of the stored quantity.
+
+        val : object
+            Value to store. It is kept by reference, so pass a copy of
+            anything that will be modified later.
+        """
+        key = self.key(x)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            entry = {}
+            while len(self._entries) >= self.size > 0:
+                self._entries.popitem(last=False)
+
+        entry[field] = val
+        self._entries[key] = entry
+
+    def clear(self):
+        """ Removes all entries and resets the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class StateCache(object):
+    """ A store of the converged unknowns of a model keyed on the design
+    vector. Before each run, a driver seeds the states of the model from the
+    nearest stored design point, found with a kd-tree, so that the coupled
+    solvers start from a good initial guess when an optimizer returns to a
+    neighborhood it has already visited.
+
+    Args
+    ----
+    size : int(100)
+        Maximum number of design points kept. When full, the oldest point
+        is replaced.
+    """
+
+    def __init__(self, size=100):
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._x = None
+        self._states = None
+        self._count = 0
+        self._tree = None
+
+    def __len__(self):
+        return min(self._count, self.size)
+
+    def add(self, x, states):
+        """ Stores the converged states of a design point.
+
+        Args
+        ----
+        x : ndarray
+            Design vector.
+
+        states : ndarray
+            Converged states.
+        """
+        x = np.asarray(x, dtype=float).ravel()
+
+        if self._x is None or self._x.shape[1] != x.size or \
+           self._states.shape[1] != len(states):
+            self._x = np.empty((self.size, x.size))
+            self._states = np.empty((self.size, len(states)))
+            self._count = 0
+
+        i = self._count % self.size
+        self._x[i] = x
+        self._states[i] = states
+        self._count += 1
+        self._tree = None
+
+    def nearest(self, x):
+        """
+        Args
+        ----
+        x : ndarray
+            Design vector.
+
+        Returns
+        -------
+        ndarray or None
+            States of the nearest stored design point, or None if the cache
+            is empty.
+        """
+        n = len(self)
+        if n == 0:
+            self.misses += 1
+            return None
+
+        # The tree is only rebuilt when points were added since the last
+        # lookup.
+        if self._tree is None:
+            self._tree = cKDTree(self._x[:n])
+
+        dist, i = self._tree.query(np.asarray(x, dtype=float).ravel())
+
+        self.hits += 1
+        return self._states[i]
+
+    def clear(self):
+        """ Removes all entries and resets the counters."""
+        self._x = None
+        self._states = None
+        self._count = 0
+        self._tree = None
+        self.hits = 0
+        self.misses = 0
@@ -13,6 +13,7 @@ from collections import Iterable
 
 import numpy as np
 import networkx as nx
+from scipy.sparse import csc_matrix, issparse
 
 from openmdao.components.indep_var_comp import IndepVarComp
 from openmdao.core.component import Component
@@ -63,11 +64,31 @@ class Group(System):
         in check_partial_derivatives"
     deriv_options['linearize'] : bool(False)
         Set to True if you want linearize to be called even though you are using FD.
+    deriv_options['fd_workers'] :  int(1)
+        Number of local worker processes, forked from this one, used to compute
+        finite difference columns concurrently. The model must be safe to run in
+        several processes at once, so it can't be used for systems containing
+        an ExternalCode. The workers are kept until cleanup and are sent the
+        current variable values for each finite difference. Columns are
+        computed serially where the 'fork' start method isn't available.
+    deriv_options['fuse_jacobian'] : bool(False)
+        Set to True to have the matrix-vector products of this Group's linear
+        solver computed with one sparse matrix that combines the sub-Jacobians
+        of all of its components and the data transfers between them. The
+        matrix is built the first time it is needed after each linearization.
+        The usual recursive apply_linear is used instead when a component
+        defines its own apply_linear or when the Group is distributed.
     """
 
     def __init__(self):
         super(Group, self).__init__()
 
+        self.deriv_options.add_option('fuse_jacobian', False,
+                                      desc="Set to True to compute the matrix-vector "
+                                      "products of this Group's linear solver with "
+                                      "one sparse matrix assembled from the "
+                                      "sub-Jacobians of its components.")
+
         self._src = OrderedDict()
         self._data_xfer = OrderedDict()
 
@@ -88,6 +109,10 @@ class Group(System):
         self._gs_outputs = None
         self._run_apply = True
         self._icache = {}
+        self._jac_pattern = None
+        self._fused_jac = None
+        self._fused_pattern = None
+        self._fused_stale = True
 
     def find_subsystem(self, name):
         """
@@ -116,6 +141,7 @@ class Group(System):
         self.nl_solver.cleanup()
         for s in self.subsystems():
             s.cleanup()
+        super(Group, self).cleanup()
 
     def add(self, name, system, promotes=None):
         """Add a subsystem to this group, specifying its name and any variables
@@ -272,6 +298,7 @@ class Group(System):
         """
         super(Group, self)._init_sys_data(parent_path, probdata)
         self._sys_graph = None
+        self._sys_levels = None
         self._gs_outputs = None
         self.ln_solver.pathname = self.pathname + '.' + self.ln_solver.__class__.__name__
         self.nl_solver.pathname = self.pathname + '.' + self.nl_solver.__class__.__name__
@@ -518,6 +545,11 @@ class Group(System):
 
         self._relname_map = None  # reclaim some memory
 
+        # variable locations may have moved
+        self._icache = {}
+        self._fused_pattern = None
+        self._fused_stale = True
+
     def _create_vecs(self, my_params, voi, impl):
         """ This creates our vecs and mats. This is only called on
         the top level Group.
@@ -752,11 +784,26 @@ class Group(System):
         for sub in itervalues(self._subsystems):
             self._transfer_data(sub.name)
             if sub.is_active():
-                with sub._dircontext:
-                    if isinstance(sub, Component):
-                        sub._sys_solve_nonlinear(sub.params, sub.unknowns, sub.resids)
-                    else:
-                        sub.solve_nonlinear(sub.params, sub.unknowns, sub.resids, metadata)
+                self._solve_subsystem(sub, metadata)
+
+    def _solve_subsystem(self, sub, metadata):
+        """
+        Asks one of our children systems to solve. Its params must already
+        have been transferred.
+
+        Args
+        ----
+        sub : `System`
+            Subsystem to solve.
+
+        metadata : dict
+            Dictionary containing execution metadata (e.g. iteration coordinate).
+        """
+        with sub._dircontext:
+            if isinstance(sub, Component):
+                sub._sys_solve_nonlinear(sub.params, sub.unknowns, sub.resids)
+            else:
+                sub.solve_nonlinear(sub.params, sub.unknowns, sub.resids, metadata)
 
     def _sys_apply_nonlinear(self, params, unknowns, resids, metadata=None):
         """
@@ -817,6 +864,31 @@ class Group(System):
                 else:
                     sub.apply_nonlinear(sub.params, sub.unknowns, sub.resids, metadata)
 
+    def _sys_linearize(self, params, unknowns, resids, total_derivs=None):
+        """
+        Entry point for all callers to cause linearization
+        of system and all children of system. Also marks the fused
+        Jacobian, if any, as out of date.
+
+        Args
+        ----
+        params : `VecWrapper`
+            `VecWrapper` containing parameters. (p)
+
+        unknowns : `VecWrapper`
+            `VecWrapper` containing outputs and states. (u)
+
+        resids : `VecWrapper`
+            `VecWrapper` containing residuals. (r)
+
+        total_derivs: bool
+            flag indicating if total or partial derivatives are being forced.
+            None allows the system to choose whats appropriate for itself
+        """
+        self._fused_stale = True
+        return super(Group, self)._sys_linearize(params, unknowns, resids,
+                                                 total_derivs=total_derivs)
+
     def linearize(self, params, unknowns, resids):
         """
         Linearize all our subsystems.
@@ -977,15 +1049,12 @@ class Group(System):
             if isinstance(system, Group):
                 system.clear_dparams()  # only call on Groups
 
-    def assemble_jacobian(self, mode='fwd', method='assemble', mult=None):
-        """ Assemble and return an ndarray containing the Jacobian for this
-        Group.
+    def assemble_jacobian(self, mode='fwd', method='assemble', mult=None,
+                          jacobian_format='dense'):
+        """ Assemble and return the Jacobian for this Group.
 
         Args
         ----
-        system : `System`
-            Parent `System` object.
-
         mode : string('fwd')
             Derivative mode, can be 'fwd' or 'rev'.
 
@@ -998,10 +1067,15 @@ class Group(System):
         mult : function(None)
             Solver mult function to coordinate the matrix vector product
 
+        jacobian_format : string('dense')
+            Storage format of the returned Jacobian. Select 'dense' for an
+            ndarray or 'csc' for a scipy.sparse csc_matrix that is built
+            without ever allocating the dense matrix.
+
         Returns
         -------
-        ndarray : Jacobian Matrix. Note: if mode is 'rev', then the transpose
-        Jacobian is returned.
+        ndarray or csc_matrix : Jacobian Matrix. Note: if mode is 'rev', then
+        the transpose Jacobian is returned.
 
         dict of tuples : Contains the location of each derivative in the Jacobian. The
         key is a tuple containing the component name string, and a tuple with the output
@@ -1010,82 +1084,329 @@ class Group(System):
         Note, if mode is 'rev', then rows and columns are swapped.
 
         """
-        u_vec = self.unknowns
-        n_edge = u_vec.vec.size
+        n_edge = self.unknowns.vec.size
 
         # OpenMDAO does matrix vector product.
         if method == 'MVP':
 
-            ident = np.eye(n_edge)
-            icache = None
+            if jacobian_format == 'csc':
+                return self._assemble_sparse_mvp(n_edge, mult), None
 
+            ident = np.eye(n_edge)
             partials = np.empty((n_edge, n_edge))
 
             for i in range(n_edge):
                 partials[:, i] = mult(ident[:, i])
 
+            return partials, None
+
         # Assemble the Jacobian
-        else:
+        if jacobian_format == 'csc':
+            return self._assemble_sparse(n_edge, mode), self._icache
 
-            partials = -np.eye(n_edge)
-            icache = self._icache
-            conn = self.connections
-            sys_prom_name = self._sysdata.to_prom_name
+        partials = -np.eye(n_edge)
 
-            for sub in self.components(recurse=True):
+        for sub, key2, loc, J in self._jacobian_blocks():
+            o_start, o_end, i_start, i_end = loc
+            if mode=='fwd':
+                partials[o_start:o_end, i_start:i_end] = J
+            else:
+                partials[i_start:i_end, o_start:o_end] = J.T
 
-                jac = sub._jacobian_cache
+        return partials, self._icache
 
-                # This method won't work on components where apply_linear
-                # is overridden.
-                if jac is None:
-                    msg = "The 'assemble' jacobian_method is not supported when " + \
-                         "'apply_linear' is used on a component (%s)." % sub.pathname
-                    raise RuntimeError(msg)
+    def _jacobian_blocks(self):
+        """ Iterates over the cached sub-Jacobian of every component in this
+        Group, yielding the component, the block key, its location in the
+        assembled Jacobian as (o_start, o_end, i_start, i_end), and the block
+        itself. Block locations are cached in self._icache.
+        """
+        u_vec = self.unknowns
+        icache = self._icache
+        conn = self.connections
+        sys_prom_name = self._sysdata.to_prom_name
 
-                sub_u = sub.unknowns
-                sub_name = sub.pathname
+        for sub in self.components(recurse=True):
 
-                for key in jac:
-                    o_var, i_var = key
-                    key2 = (sub_name, key)
+            jac = sub._jacobian_cache
 
-                    # We cache the location of each variable in our jacobian
-                    if key2 not in icache:
+            # This method won't work on components where apply_linear
+            # is overridden.
+            if jac is None:
+                msg = "The 'assemble' jacobian_method is not supported when " + \
+                     "'apply_linear' is used on a component (%s)." % sub.pathname
+                raise RuntimeError(msg)
 
-                        o_var_abs = '.'.join((sub_name, o_var))
-                        i_var_abs = '.'.join((sub_name, i_var))
-                        i_var_pro = sys_prom_name[i_var_abs]
-                        o_var_pro = sys_prom_name[o_var_abs]
+            sub_name = sub.pathname
 
-                        # States are fine ...
-                        if i_var in sub.states:
-                            pass
+            for key in jac:
+                o_var, i_var = key
+                key2 = (sub_name, key)
 
-                        #... but inputs need to find their source.
-                        elif i_var_pro not in u_vec:
+                # We cache the location of each variable in our jacobian
+                if key2 not in icache:
 
-                            # Param is not relevant
-                            if i_var_abs not in conn:
-                                continue
+                    o_var_abs = '.'.join((sub_name, o_var))
+                    i_var_abs = '.'.join((sub_name, i_var))
+                    i_var_pro = sys_prom_name[i_var_abs]
+                    o_var_pro = sys_prom_name[o_var_abs]
 
-                            i_var_src = conn[i_var_abs][0]
-                            i_var_pro = sys_prom_name[i_var_src]
+                    # States are fine ...
+                    if i_var in sub.states:
+                        pass
 
-                        o_start, o_end = u_vec._dat[o_var_pro].slice
-                        i_start, i_end = u_vec._dat[i_var_pro].slice
+                    #... but inputs need to find their source.
+                    elif i_var_pro not in u_vec:
 
-                        icache[key2] = (o_start, o_end, i_start, i_end)
+                        # Param is not relevant
+                        if i_var_abs not in conn:
+                            continue
 
-                    else:
-                        (o_start, o_end, i_start, i_end) = icache[key2]
+                        # Source is outside of this Group
+                        i_var_src = conn[i_var_abs][0]
+                        if i_var_src not in sys_prom_name:
+                            continue
+
+                        i_var_pro = sys_prom_name[i_var_src]
+
+                    o_start, o_end = u_vec._dat[o_var_pro].slice
+                    i_start, i_end = u_vec._dat[i_var_pro].slice
 
-                    if mode=='fwd':
-                        partials[o_start:o_end, i_start:i_end] = jac[o_var, i_var]
+                    icache[key2] = (o_start, o_end, i_start, i_end)
+
+                yield sub, key2, icache[key2], jac[key]
+
+    def _assemble_sparse(self, n_edge, mode):
+        """ Assembles the Jacobian as a csc_matrix directly from the cached
+        component sub-Jacobians. The nonzero layout is computed once and kept
+        in self._jac_pattern, so that subsequent assemblies only rewrite the
+        data array.
+        """
+        subs = []
+        keys = []
+        blocks = []
+        for sub, key2, loc, J in self._jacobian_blocks():
+            subs.append(sub)
+            keys.append(key2)
+            if issparse(J):
+                J = J.toarray()
+            blocks.append(J)
+
+        pattern = self._jac_pattern
+        if pattern is None or pattern.mode != mode or pattern.keys != keys:
+            pattern = _SparsePattern(n_edge, mode, keys,
+                                     self._block_locs(subs, keys))
+            self._jac_pattern = pattern
+
+        return pattern.fill(blocks)
+
+    def _block_locs(self, subs, keys):
+        """ Returns the location of each sub-Jacobian block as
+        (o_start, o_end, i_cols), where i_cols is the array of Jacobian
+        columns spanned by the block."""
+        locs = []
+        for sub, key2 in zip(subs, keys):
+            o_start, o_end, i_start, i_end = self._icache[key2]
+            i_var = key2[1][1]
+            src_idxs = None
+            if i_var not in sub.states:
+                src_idxs = sub.params.metadata(i_var).get('src_indices')
+
+            # Params connected with src_indices only touch those columns.
+            if src_idxs is None:
+                i_cols = np.arange(i_start, i_end)
+            else:
+                i_cols = i_start + np.asarray(src_idxs, dtype=int).ravel()
+
+            locs.append((o_start, o_end, i_cols))
+
+        return locs
+
+    def _fused_jacobian(self):
+        """ Returns the csc_matrix that maps dunknowns to dresids for this
+        Group, i.e., the product computed by a forward _sys_apply_linear on
+        the full derivative vectors, or None if that product can't be fused.
+        The matrix is rebuilt once after each linearization.
+        """
+        if self._fused_stale:
+            self._fused_jac = None
+            self._fused_stale = False
+            if self._can_fuse():
+                self._fused_jac = self._fuse_jacobian()
+
+        return self._fused_jac
+
+    def _can_fuse(self):
+        """ Returns True if the products of this Group's Jacobian can be
+        computed from the cached component sub-Jacobians alone."""
+        if not self.deriv_options['fuse_jacobian'] or \
+           self.deriv_options['type'] is not 'user' or \
+           (MPI and self.comm.size > 1):
+            return False
+
+        for sub in self.subsystems(recurse=True):
+            if isinstance(sub, Component):
+                if sub.deriv_options['type'] is not 'user':
+                    continue
+                if sub._jacobian_cache is None or _overrides_apply_linear(sub):
+                    return False
+            elif sub.deriv_options['type'] is not 'user':
+                return False
+
+        return True
+
+    def _jacobian_pattern(self):
+        """ Returns a boolean csc_matrix, laid out like the forward Jacobian
+        of this Group, that is True wherever a residual may depend on an
+        unknown. It comes from the structure of the model rather than from
+        the values of the derivatives: sparse sub-Jacobians contribute their
+        stored entries and dense ones all of their entries. Finite
+        differenced Groups, and components whose sub-Jacobians aren't
+        cached, are taken to couple all of their unknowns to all of their
+        inputs.
+        """
+        u_vec = self.unknowns
+        to_prom_name = self._sysdata.to_prom_name
+        conn = self.connections
+        n_edge = u_vec.vec.size
+
+        def var_idxs(abs_name):
+            # Jacobian columns of an unknown, or of the source of a param,
+            # or None if it isn't in this Group.
+            if abs_name in self._unknowns_dict:
+                src = abs_name
+                src_idxs = None
+            elif abs_name in conn and conn[abs_name][0] in self._unknowns_dict:
+                src = conn[abs_name][0]
+                src_idxs = self._params_dict[abs_name].get('src_indices')
+            else:
+                return None
+
+            slc = u_vec._dat[to_prom_name[src]].slice
+            if slc is None:
+                return None
+            if src_idxs is None:
+                return np.arange(slc[0], slc[1])
+            return slc[0] + np.asarray(src_idxs, dtype=int).ravel()
+
+        rows = [np.arange(n_edge)]
+        cols = [np.arange(n_edge)]
+
+        def add_block(o_idxs, i_idxs):
+            rows.append(np.repeat(o_idxs, len(i_idxs)))
+            cols.append(np.tile(i_idxs, len(o_idxs)))
+
+        stack = list(self.subsystems(local=True))
+        while stack:
+            sub = stack.pop()
+
+            if isinstance(sub, Component) and \
+               sub.deriv_options['type'] is 'user' and \
+               sub._jacobian_cache is not None and \
+               not _overrides_apply_linear(sub):
+                for (o_var, i_var), J in iteritems(sub._jacobian_cache):
+                    o_idxs = var_idxs('.'.join((sub.pathname, o_var)))
+                    i_idxs = var_idxs('.'.join((sub.pathname, i_var)))
+                    if o_idxs is None or i_idxs is None:
+                        continue
+                    if issparse(J):
+                        J = J.tocoo()
+                        rows.append(o_idxs[J.row])
+                        cols.append(i_idxs[J.col])
                     else:
-                        partials[i_start:i_end, o_start:o_end] = jac[o_var, i_var].T
+                        add_block(o_idxs, i_idxs)
 
-        return partials, icache
+            elif isinstance(sub, Group) and sub.deriv_options['type'] is 'user':
+                stack.extend(sub.subsystems(local=True))
+
+            else:
+                idxs = [var_idxs(name) for name in
+                        chain(sub._unknowns_dict, sub._params_dict)]
+                o_idxs = [i for i in idxs[:len(sub._unknowns_dict)]
+                          if i is not None]
+                i_idxs = [i for i in idxs if i is not None]
+                if o_idxs:
+                    add_block(np.concatenate(o_idxs), np.concatenate(i_idxs))
+
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        pattern = csc_matrix((np.ones(len(rows)), (rows, cols)),
+                             shape=(n_edge, n_edge))
+        pattern.data[:] = 1.0
+
+        return pattern.astype(bool)
+
+    def _fuse_jacobian(self):
+        """ Assembles the fused Jacobian, including the unit conversion of
+        params and the scaling of residuals that apply_linear would apply.
+        """
+        n_edge = self.unknowns.vec.size
+        do_apply = self._do_apply
+        subs = []
+        keys = []
+        blocks = []
+        for sub, key2, loc, J in self._jacobian_blocks():
+
+            # apply_linear isn't called on components without params.
+            if not do_apply[(sub.pathname, None)]:
+                continue
+
+            subs.append(sub)
+            keys.append(key2)
+            if issparse(J):
+                J = J.toarray()
+
+            if sub.deriv_options['type'] is 'user':
+                o_var, i_var = key2[1]
+                resid_scaler = sub.unknowns.metadata(o_var).get('resid_scaler')
+                if resid_scaler:
+                    J = J * (1.0 / resid_scaler)
+                if i_var not in sub.states:
+                    unit_conv = sub.params.metadata(i_var).get('unit_conv')
+                    if unit_conv is not None:
+                        J = J * unit_conv[0]
+
+            blocks.append(J)
+
+        pattern = self._fused_pattern
+        if pattern is None or pattern.keys != keys:
+
+            # States don't get the -1.0 on the diagonal.
+            diag = np.ones(n_edge, dtype=bool)
+            u_vec = self.unknowns
+            to_prom_name = self._sysdata.to_prom_name
+            for sub in self.components(recurse=True):
+                for state in sub.states:
+                    prom = to_prom_name['.'.join((sub.pathname, state))]
+                    start, end = u_vec._dat[prom].slice
+                    diag[start:end] = False
+
+            pattern = _SparsePattern(n_edge, 'fwd', keys,
+                                     self._block_locs(subs, keys), diag=diag)
+            self._fused_pattern = pattern
+
+        return pattern.fill(blocks)
+
+    def _assemble_sparse_mvp(self, n_edge, mult):
+        """ Builds the Jacobian as a csc_matrix one column at a time through
+        matrix vector products, keeping only the nonzero entries."""
+        arg = np.zeros(n_edge)
+        data = []
+        indices = []
+        indptr = np.zeros(n_edge + 1, dtype=int)
+
+        for i in range(n_edge):
+            arg[i] = 1.0
+            col = mult(arg)
+            arg[i] = 0.0
+
+            nz = np.flatnonzero(col)
+            indices.append(nz)
+            data.append(col[nz])
+            indptr[i+1] = indptr[i] + len(nz)
+
+        return csc_matrix((np.concatenate(data), np.concatenate(indices), indptr),
+                          shape=(n_edge, n_edge))
 
     def set_order(self, new_order):
         """ Specifies a new execution order for this system. This should only
@@ -1190,6 +1511,44 @@ class Group(System):
 
         return self._sys_graph
 
+    def _get_sys_levels(self):
+        """
+        Split our subsystems into levels that can each be solved at the same
+        time without changing the result of solving them in order. A
+        subsystem is placed after every earlier subsystem that it takes
+        inputs from, and no earlier than any earlier subsystem that reads
+        its outputs, so those still see the values from the previous
+        iteration once the params of a whole level have been transferred.
+
+        Returns
+        -------
+        list of lists of `System`
+            Subsystems of each level, in execution order.
+        """
+        if self._sys_levels is None:
+            graph = self._get_sys_graph()
+            level = {}
+            levels = []
+            for sub in itervalues(self._subsystems):
+                path = sub.pathname
+                lev = 0
+                if path in graph:
+                    for src in graph.predecessors(path):
+                        if src in level:
+                            lev = max(lev, level[src] + 1)
+                    for tgt in graph.successors(path):
+                        if tgt in level:
+                            lev = max(lev, level[tgt])
+
+                level[path] = lev
+                if lev == len(levels):
+                    levels.append([])
+                levels[lev].append(sub)
+
+            self._sys_levels = levels
+
+        return self._sys_levels
+
     def _break_cycles(self, order, graph):
         """Keep breaking cycles until the graph is a DAG.
         """
@@ -1208,6 +1567,53 @@ class Group(System):
 
         return graph, broken_edges
 
+    def record_solver_history(self, size=1000):
+        """
+        Keeps the iteration number, residual norm, wall time and number of
+        matrix-vector products of the last `size` iterations of the
+        nonlinear and linear solvers of this `Group` and every `Group` below
+        it, in preallocated ring buffers.
+
+        Args
+        ----
+        size : int(1000)
+            Number of iterations kept for each solver.
+        """
+        for grp in self.subgroups(recurse=True, include_self=True):
+            grp.nl_solver.record_history(size)
+            grp.ln_solver.record_history(size)
+
+    def get_solver_history(self):
+        """
+        Returns
+        -------
+        OrderedDict
+            Structured array of the recorded iterations, oldest first, keyed
+            on the name of each `Group` followed by '.nl_solver' or
+            '.ln_solver'.
+        """
+        history = OrderedDict()
+        for grp in self.subgroups(recurse=True, include_self=True):
+            name = 'root.' + grp.pathname if grp.pathname else 'root'
+            for key in ('nl_solver', 'ln_solver'):
+                solver = getattr(grp, key)
+                if solver.history is not None:
+                    history['%s.%s' % (name, key)] = solver.history.get()
+
+        return history
+
+    def save_solver_history(self, filename):
+        """
+        Writes the recorded solver iterations to a numpy .npz file, with one
+        array per solver as returned by `get_solver_history`.
+
+        Args
+        ----
+        filename : str
+            Name of the file.
+        """
+        np.savez(filename, **self.get_solver_history())
+
     def dump(self, nest=0, out_stream=sys.stdout, verbose=False, dvecs=False,
              sizes=False):
         """
@@ -1522,6 +1928,16 @@ class Group(System):
                                dtype=self._impl.idx_arr_type)
         self._local_param_sizes[var_of_interest] = param_sizes
 
+        # global index arrays computed by a previous setup of the same model
+        cache = self._probdata.setup_cache
+        if cache is not None:
+            cache_name = 'xfer:%s:%s' % (self.pathname, var_of_interest)
+            cached_idxs = cache.get_index_pairs(cache_name)
+            if cached_idxs is None:
+                new_idxs = []
+            else:
+                cached_idxs = iter(cached_idxs)
+
         fwd = 0
         rev = 1
         modename = ['fwd', 'rev']
@@ -1557,14 +1973,22 @@ class Group(System):
                     if mode == fwd:
                         byobj_conns.append((prelname, urelname))
                 else:  # pass by vector
-                    sidxs, didxs = self._get_global_idxs(urelname, prelname,
-                                                         vec_unames, unknown_sizes,
-                                                         vec_pnames, param_sizes,
-                                                         modename[mode])
+                    if cache is not None and cached_idxs is not None:
+                        sidxs, didxs = next(cached_idxs)
+                    else:
+                        sidxs, didxs = self._get_global_idxs(urelname, prelname,
+                                                             vec_unames, unknown_sizes,
+                                                             vec_pnames, param_sizes,
+                                                             modename[mode])
+                        if cache is not None:
+                            new_idxs.append((sidxs, didxs))
                     vec_conns.append((prelname, urelname))
                     src_idx_list.append(sidxs)
                     dest_idx_list.append(didxs)
 
+        if cache is not None and cached_idxs is None:
+            cache.set_index_pairs(cache_name, new_idxs, self._impl.idx_arr_type)
+
         if alloc_derivs:
             uvec = self.dumat[var_of_interest]
             pvec = self.dpmat[var_of_interest]
@@ -1773,3 +2197,135 @@ class Group(System):
                     _dump(s, stream)
         else:
             _dump(self, stream)
+
+
+def _overrides_apply_linear(comp):
+    """ Returns True if the class of the given component, or a base class
+    below Component, defines apply_linear."""
+    for klass in comp.__class__.__mro__:
+        if klass is Component:
+            return False
+        if 'apply_linear' in klass.__dict__:
+            return True
+    return False
+
+
+class _SparsePattern(object):
+    """ Nonzero layout of an assembled sparse Jacobian.
+
+    Every entry of every component sub-Jacobian block is treated as a
+    structural nonzero, so the layout stays fixed across linearizations and
+    only the data array has to be refilled.
+
+    Args
+    ----
+    n_edge : int
+        Size of the (square) Jacobian.
+
+    mode : string
+        Derivative mode, can be 'fwd' or 'rev'. In 'rev', the layout of the
+        transpose Jacobian is built.
+
+    keys : list of tuples
+        Key of each sub-Jacobian block, in assembly order.
+
+    locs : list of tuples
+        Location of each block as (o_start, o_end, i_cols), where i_cols is
+        the array of Jacobian columns spanned by the block.
+
+    diag : ndarray of bool, optional
+        Marks the rows that get -1.0 on the diagonal. By default, every row
+        does except those where a block sits on the diagonal.
+    """
+
+    def __init__(self, n_edge, mode, keys, locs, diag=None):
+        self.mode = mode
+        self.keys = keys
+
+        # -1 on the diagonal, except where a state block overwrites it.
+        find_diag = diag is None
+        if find_diag:
+            diag = np.ones(n_edge, dtype=bool)
+        rows = []
+        cols = []
+        for o_start, o_end, i_cols in locs:
+            if find_diag and len(i_cols) and o_start == i_cols[0]:
+                diag[o_start:o_end] = False
+            rows.append(np.repeat(np.arange(o_start, o_end), len(i_cols)))
+            cols.append(np.tile(i_cols, o_end - o_start))
+
+        self.diag = np.flatnonzero(diag)
+        self.n_diag = len(self.diag)
+        rows.insert(0, self.diag)
+        cols.insert(0, self.diag)
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+
+        # Transposing only swaps the row and column of each entry.
+        if mode == 'rev':
+            rows, cols = cols, rows
+
+        # Map each entry to its slot in the csc data array. Duplicate entries
+        # (several inputs connected to the same source) are summed.
+        flat = cols.astype(np.int64) * n_edge + rows
+        uniq, self.slots = np.unique(flat, return_inverse=True)
+        self.nnz = len(uniq)
+        self.indices = uniq % n_edge
+        self.indptr = np.zeros(n_edge + 1, dtype=int)
+        np.cumsum(np.bincount(uniq // n_edge, minlength=n_edge),
+                  out=self.indptr[1:])
+        self.shape = (n_edge, n_edge)
+        self.entries = np.empty(len(flat))
+
+        # Fill-reducing column ordering, set once by the solver that
+        # factors this Jacobian.
+        self.col_perm = None
+
+    def permute_columns(self, col_perm):
+        """ Reorders the layout so that fill() returns the Jacobian with its
+        columns permuted, i.e., J[:, col_perm]. This lets a solver compute a
+        fill-reducing ordering once and reuse it for every later numeric
+        factorization.
+
+        Args
+        ----
+        col_perm : ndarray of int
+            New column order.
+        """
+        counts = np.diff(self.indptr)[col_perm]
+        indptr = np.zeros(len(self.indptr), dtype=int)
+        np.cumsum(counts, out=indptr[1:])
+
+        # Old data slot for each slot of the permuted data array.
+        order = np.repeat(self.indptr[col_perm] - indptr[:-1], counts) + \
+                np.arange(self.nnz)
+        new_slot = np.empty(self.nnz, dtype=int)
+        new_slot[order] = np.arange(self.nnz)
+
+        self.indices = self.indices[order]
+        self.indptr = indptr
+        self.slots = new_slot[self.slots]
+        self.col_perm = col_perm
+
+    def fill(self, blocks):
+        """ Returns a csc_matrix with this layout, filled with the given
+        sub-Jacobian blocks. If a column permutation has been set, the
+        columns of the returned matrix are permuted.
+
+        Args
+        ----
+        blocks : list of ndarray
+            Sub-Jacobian blocks, in the same order as self.keys.
+
+        Returns
+        -------
+        csc_matrix
+            The assembled Jacobian.
+        """
+        entries = self.entries
+        entries[:self.n_diag] = -1.0
+        if blocks:
+            entries[self.n_diag:] = np.concatenate([J.ravel() for J in blocks])
+        data = np.bincount(self.slots, weights=entries, minlength=self.nnz)
+
+        return csc_matrix((data, self.indices, self.indptr), shape=self.shape)
@@ -45,6 +45,20 @@ class ParallelGroup(Group):
         in check_partial_derivatives"
     deriv_options['linearize'] : bool(False)
         Set to True if you want linearize to be called even though you are using FD.
+    deriv_options['fd_workers'] :  int(1)
+        Number of local worker processes, forked from this one, used to compute
+        finite difference columns concurrently. The model must be safe to run in
+        several processes at once, so it can't be used for systems containing
+        an ExternalCode. The workers are kept until cleanup and are sent the
+        current variable values for each finite difference. Columns are
+        computed serially where the 'fork' start method isn't available.
+    deriv_options['fuse_jacobian'] : bool(False)
+        Set to True to have the matrix-vector products of this Group's linear
+        solver computed with one sparse matrix that combines the sub-Jacobians
+        of all of its components and the data transfers between them. The
+        matrix is built the first time it is needed after each linearization.
+        The usual recursive apply_linear is used instead when a component
+        defines its own apply_linear or when the Group is distributed.
     """
 
     def apply_nonlinear(self, params, unknowns, resids, metadata=None):
@@ -14,6 +14,7 @@ from six.moves import cStringIO
 
 import networkx as nx
 import numpy as np
+from scipy.sparse import csc_matrix
 
 from openmdao.core.system import System
 from openmdao.core.group import Group
@@ -25,6 +26,7 @@ from openmdao.core._checks import check_connections, _both_names
 from openmdao.core.driver import Driver
 from openmdao.core.mpi_wrap import MPI, under_mpirun, debug
 from openmdao.core.relevance import Relevance
+from openmdao.core.setup_cache import SetupCache, model_key
 
 from openmdao.components.indep_var_comp import IndepVarComp
 from openmdao.solvers.scipy_gmres import ScipyGMRES
@@ -36,6 +38,7 @@ from openmdao.util.string_util import get_common_ancestor, nearest_child, name_r
 from openmdao.util.graph import plain_bfs, OrderedDigraph
 from openmdao.util.options import OptionsDictionary
 from openmdao.util.dict_util import _jac_to_flat_dict
+from openmdao.util.array_util import get_column_coloring
 
 force_check = os.environ.get('OPENMDAO_FORCE_CHECK_SETUP')
 trace = os.environ.get('OPENMDAO_TRACE')
@@ -50,6 +53,20 @@ class _ProbData(object):
         self.in_complex_step = False
         self.precon_level = 0
         self.pathname = ''
+        self.setup_cache = None
+
+def _freeze(obj):
+    """
+    Return a hashable version of the given metadata value that compares
+    equal to another only if the values match.
+    """
+    if isinstance(obj, np.ndarray):
+        return (obj.shape, obj.dtype.str, obj.tobytes())
+    if isinstance(obj, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in iteritems(obj)))
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
 
 def _get_root_var(root, name):
     """
@@ -114,13 +131,31 @@ class Problem(object):
         If set to True, all numpy floating point errors raise exceptions and
         the variable locations that go to inf or nan are printed when they can
         be determined.
+
+    setup_cache : str, optional
+        Name of a .npz file used to cache the relevance, execution order and
+        data transfer indices computed during setup. A later setup of a model
+        with the same structure, in this or another process, loads them from
+        the file instead of computing them again.
     """
 
-    def __init__(self, root=None, driver=None, impl=None, comm=None, debug=False):
+    def __init__(self, root=None, driver=None, impl=None, comm=None, debug=False,
+                 setup_cache=None):
         super(Problem, self).__init__()
         self.root = root
         self._probdata = _ProbData()
 
+        # summary of the model structure as of the last successful setup
+        self._fingerprint = None
+
+        # total derivative colorings, keyed by mode and variable lists
+        self._total_colorings = {}
+
+        if setup_cache is None:
+            self.setup_cache = None
+        else:
+            self.setup_cache = SetupCache(setup_cache)
+
         if MPI:
             from openmdao.core.petsc_impl import PetscImpl
             if impl != PetscImpl:
@@ -456,6 +491,18 @@ class Problem(object):
 
         self._setup_errors = []
 
+        # If nothing that determines the variable layout, connections or
+        # relevance has changed since the last setup, keep the existing
+        # vectors and data transfers and only redo the stages that depend
+        # on values and options.
+        fingerprint = self._setup_fingerprint()
+        if fingerprint is not None and fingerprint == self._fingerprint:
+            self._reset_values()
+            return self._finish_setup(check, out_stream, fingerprint)
+
+        self._fingerprint = None
+        self._total_colorings = {}
+
         # if we modify the system tree, we'll need to call _init_sys_data,
         # _setup_variables and _setup_connections again
         tree_changed = False
@@ -603,24 +650,37 @@ class Problem(object):
 
         mode = self._check_for_parallel_derivs(pois, oois, parallel_u, parallel_p)
 
+        # results from a previous setup of the same model can be read from
+        # the setup cache instead of being recomputed.
+        cache = None if MPI else self.setup_cache
+        if cache is not None:
+            cache.open(model_key(self.root, params_dict, unknowns_dict,
+                                 connections, pois, oois, mode))
+        self._probdata.setup_cache = cache
+
         self._probdata.relevance = Relevance(self.root, params_dict,
                                              unknowns_dict, connections,
-                                             pois, oois, mode)
+                                             pois, oois, mode, cache=cache)
 
         # perform auto ordering
         for s in self.root.subgroups(recurse=True, include_self=True):
             # set auto order if order not already set
             if not s._order_set:
                 order = None
-                broken_edges = None
-                if self.comm.rank == 0:
-                    order, broken_edges = s.list_auto_order()
-                if MPI:
-                    if trace:
-                        debug("problem setup order bcast")
-                    order, broken_edges = self.comm.bcast((order, broken_edges), root=0)
-                    if trace:
-                        debug("problem setup order bcast DONE")
+                if cache is not None:
+                    order = cache.get_names('order:%s' % s.pathname)
+                if order is None:
+                    broken_edges = None
+                    if self.comm.rank == 0:
+                        order, broken_edges = s.list_auto_order()
+                    if MPI:
+                        if trace:
+                            debug("problem setup order bcast")
+                        order, broken_edges = self.comm.bcast((order, broken_edges), root=0)
+                        if trace:
+                            debug("problem setup order bcast DONE")
+                    if cache is not None:
+                        cache.set_names('order:%s' % s.pathname, order)
                 s.set_order(order)
 
         # Mark every comp that is executed out-of-order so that we
@@ -643,6 +703,26 @@ class Problem(object):
         # create VecWrappers for all systems in the tree.
         self.root._setup_vectors(param_owners, impl=self._impl, alloc_derivs=alloc_derivs)
 
+        if cache is not None:
+            cache.save()
+
+        return self._finish_setup(check, out_stream)
+
+    def _finish_setup(self, check, out_stream, fingerprint=None):
+        """Performs the setup stages that don't depend on the structure
+        of the model and records the fingerprint of the completed setup.
+
+        Args
+        ----
+        check : bool
+            Check for potential issues after setup is complete.
+
+        out_stream : a file-like object
+            Stream where report will be written if check is performed.
+
+        fingerprint : tuple, optional
+            Fingerprint of the model, if already known.
+        """
         # Prepare Driver
         self.driver._setup()
 
@@ -669,6 +749,10 @@ class Problem(object):
         # Lock any restricted options in the options dictionaries.
         OptionsDictionary.locked = True
 
+        if fingerprint is None:
+            fingerprint = self._setup_fingerprint()
+        self._fingerprint = fingerprint
+
         # Recursively call post_setup on all subsystems
         for s in self.root.subsystems(recurse=True, include_self=True):
             s.post_setup(self)
@@ -679,6 +763,74 @@ class Problem(object):
 
         return {}
 
+    def _setup_fingerprint(self):
+        """
+        Returns
+        -------
+        tuple or None
+            A summary of everything that determines the variable layout,
+            connections and relevance of the model, or None if the model
+            must always go through a full setup.
+        """
+        if MPI:
+            return None
+
+        def strip_vals(vardict):
+            return tuple((name, _freeze(dict((k, v) for k, v in iteritems(meta)
+                                             if k != 'val')))
+                         for name, meta in iteritems(vardict))
+
+        fprint = [self.root, self.driver, self._impl, self.comm,
+                  _freeze(list(self.driver.desvars_of_interest())),
+                  _freeze(list(self.driver.outputs_of_interest())),
+                  _freeze(dict(self.root.ln_solver.options.items()))]
+
+        for s in self.root.subsystems(recurse=True, include_self=True):
+            if not s._incremental_setup:
+                return None
+
+            fprint.append((s, s.name, _freeze(s._promotes), s.directory,
+                           s.create_dirs, s.deriv_options['type']))
+
+            if isinstance(s, Group):
+                fprint.append((tuple(s._subsystems), s._order_set,
+                               _freeze(s._src), s.ln_solver, s.nl_solver))
+            else:
+                fprint.append((strip_vals(s._init_params_dict),
+                               strip_vals(s._init_unknowns_dict)))
+
+        return tuple(fprint)
+
+    def _reset_values(self):
+        """
+        Restores the initial variable values in the existing vectors when
+        the model is set up again without any change to its structure.
+        """
+        root = self.root
+        connections = self._probdata.connections
+
+        for acc in itervalues(root.unknowns._dat):
+            if acc.remote:
+                continue
+            meta = acc.meta
+            if acc.pbo:
+                acc.val.val = meta['val']
+            elif meta['shape'] == 1:
+                acc.val[0] = meta['val']
+            else:
+                acc.val[:] = meta['val'].flat
+
+        for s in root.subsystems(recurse=True, include_self=True):
+            for vec in chain((s.params, s.resids), itervalues(s.dumat),
+                             itervalues(s.dpmat), itervalues(s.drmat)):
+                vec.vec[:] = 0.0
+
+            # unconnected params get their initial value back
+            if isinstance(s, Component):
+                for acc in itervalues(s.params._dat):
+                    if acc.pbo and acc.meta['pathname'] not in connections:
+                        acc.val.val = acc.meta['val']
+
     def cleanup(self):
         """ Clean up resources prior to exit. """
         self.driver.cleanup()
@@ -1309,6 +1461,145 @@ class Problem(object):
                                                      sparsity=sparsity,
                                                      inactives=inactives)
 
+    def compute_total_coloring(self, indep_list, unknown_list, mode='auto'):
+        """ Computes the sparsity of the total derivatives of `unknown_list`
+        with respect to `indep_list`, and partitions the linear solves into
+        colors so that all solves in a color can be done as one. Later calls
+        to calc_gradient with the same variables and mode solve only one
+        right hand side per color.
+
+        The sparsity comes from the structure of the model, not from the
+        values of the derivatives: a total derivative may be nonzero if there
+        is a chain of partial derivatives from the input to the output, as in
+        the relevance graph but resolved to individual entries. Sub-Jacobians
+        returned from linearize as scipy.sparse matrices contribute only their
+        stored entries (including stored zeros), and dense ones all of their
+        entries. Finite differenced Groups, and components that define
+        apply_linear, couple all of their unknowns to all of their inputs.
+        Return sparse sub-Jacobians to get fewer colors. The coloring is valid for as long as that
+        structure is, so compute it again if a component changes the entries
+        it stores in a sparse sub-Jacobian.
+
+        Args
+        ----
+        indep_list : iter of strings
+            Names of the independent variables.
+
+        unknown_list : iter of strings
+            Names of the outputs or states.
+
+        mode : string, optional
+            Deriviative direction, can be 'fwd', 'rev', or 'auto'.
+
+        Returns
+        -------
+        list of ndarray
+            Indices of the linear solves (in the order of the entries of
+            `indep_list` in fwd mode, or `unknown_list` in rev mode) that are
+            combined in each color.
+        """
+        indep_list = list(indep_list)
+        unknown_list = list(unknown_list)
+        mode = self._mode(mode, indep_list, unknown_list)
+        fwd = mode == 'fwd'
+
+        key = (mode, tuple(indep_list), tuple(unknown_list))
+        self._total_colorings.pop(key, None)
+
+        root = self.root
+        duvec = root.dumat[None]
+
+        # The sub-Jacobians are cached by linearize.
+        with root._dircontext:
+            root._sys_linearize(root.params, root.unknowns, root.resids)
+        partials = root._jacobian_pattern().astype(float)
+
+        # Follow the partial derivatives from every entry of the independent
+        # variables until no new entries are reached.
+        poi_pos = np.concatenate([duvec._get_local_idxs(voi, self._poi_indices)
+                                  for voi in indep_list])
+        qoi_pos = np.concatenate([duvec._get_local_idxs(voi, self._qoi_indices)
+                                  for voi in unknown_list])
+        n = len(poi_pos)
+        reached = csc_matrix((np.ones(n), (poi_pos, np.arange(n))),
+                             shape=(partials.shape[0], n))
+        while True:
+            new = reached + partials.dot(reached)
+            new.data[:] = 1.0
+            if new.nnz == reached.nnz:
+                break
+            reached = new
+
+        J = reached[qoi_pos, :].toarray().astype(bool)
+
+        # rows are the outputs and columns are the inputs of the linear solves
+        if fwd:
+            sparsity = J
+            input_list, output_list = indep_list, unknown_list
+            in_indices, out_indices = self._poi_indices, self._qoi_indices
+        else:
+            sparsity = J.T
+            input_list, output_list = unknown_list, indep_list
+            in_indices, out_indices = self._qoi_indices, self._poi_indices
+
+        colors = get_column_coloring(sparsity)
+
+        cols = [(voi, i) for voi in input_list
+                for i in range(len(duvec._get_local_idxs(voi, in_indices)))]
+        in_pos = np.concatenate([duvec._get_local_idxs(voi, in_indices)
+                                 for voi in input_list])
+        out_pos = np.concatenate([duvec._get_local_idxs(item, out_indices)
+                                  for item in output_list])
+
+        self._total_colorings[key] = {
+            'colors': colors,
+            'cols': cols,
+            'in_pos': in_pos,
+            'nz_rows': [out_pos[sparsity[:, c]] for c in range(len(cols))],
+        }
+
+        return colors
+
+    def _solve_colored(self, coloring, mode):
+        """ Performs one linear solve per color and splits each solution
+        into the solutions for the individual variables of interest.
+
+        Returns
+        -------
+        dict
+            Solution vectors keyed by variable of interest and then by index.
+        """
+        root = self.root
+        ln_solver = root.ln_solver
+        n = len(root.dumat[None].vec)
+        colors = coloring['colors']
+        in_pos = coloring['in_pos']
+
+        rhs = OrderedDict()
+        if ln_solver.supports['multi_rhs']:
+            rhs[None] = np.zeros((n, len(colors)))
+            for j, color in enumerate(colors):
+                rhs[None][in_pos[color], j] = -1.0
+            sols = ln_solver.solve(rhs, root, mode)[None].T
+        else:
+            sols = []
+            rhs[None] = np.zeros(n)
+            for color in colors:
+                rhs[None][:] = 0.0
+                rhs[None][in_pos[color]] = -1.0
+                sols.append(ln_solver.solve(rhs, root, mode)[None].copy())
+
+        dx = {}
+        for color, sol in zip(colors, sols):
+            for c in color:
+                rows = coloring['nz_rows'][c]
+                voi, i = coloring['cols'][c]
+                dxc = np.zeros(n)
+                dxc[rows] = sol[rows]
+                dx.setdefault(voi, {})[i] = dxc
+
+        return dx
+
     def _calc_gradient_fd(self, indep_list, unknown_list, return_format,
                           dv_scale=None, cn_scale=None, sparsity=None,
                           use_check=False):
@@ -1644,6 +1935,16 @@ class Problem(object):
 
         voi_srcs = {}
 
+        # With a coloring from compute_total_coloring, do one solve per color
+        # for all variables of interest up front.
+        colored = None
+        coloring = self._total_colorings.get((mode, tuple(indep_list),
+                                              tuple(unknown_list)))
+        if coloring is not None and nproc == 1 and not inactives and \
+           all(len(params) == 1 and self._get_voi_key(params[0], params) is None
+               for params in voi_sets):
+            colored = self._solve_colored(coloring, mode)
+
         # If Forward mode, solve linear system for each param
         # If Adjoint mode, solve linear system for each unknown
         for params in voi_sets:
@@ -1679,6 +1980,29 @@ class Problem(object):
                                        " in the group %s, %d != %d" % (params, old_size, len(in_idxs)))
                 voi_idxs[vkey] = in_idxs
 
+            # If the solver can take multiple right-hand sides, stack the
+            # ones for all indices of a single variable of interest into a 2D
+            # array and solve them together.
+            batch_sol = None
+            if colored is not None:
+                vkey = None
+                batch_sol = colored[voi]
+            elif len(params) == 1 and root.ln_solver.supports['multi_rhs']:
+                vkey = self._get_voi_key(voi, params)
+                cols = [i for i in range(len(in_idxs))
+                        if not (inactives and not fwd and voi in inactives and
+                                i in inactives[voi])]
+                if cols:
+                    rhs_block = np.zeros((len(duvec.vec), len(cols)))
+                    if self.root._owning_ranks[voi_srcs[vkey]] == iproc:
+                        rows = np.asarray(voi_idxs[vkey])[cols]
+                        rhs_block[rows, np.arange(len(cols))] = -1.0
+
+                    rhs_mat = OrderedDict()
+                    rhs_mat[vkey] = rhs_block
+                    sol = root.ln_solver.solve(rhs_mat, root, mode)[vkey]
+                    batch_sol = dict(zip(cols, sol.T))
+
             # at this point, we know that for all vars in the current
             # group of interest, the number of indices is the same. We loop
             # over the *size* of the indices and use the loop index to look
@@ -1696,6 +2020,10 @@ class Problem(object):
                         vkey = self._get_voi_key(voi, params)
                         dx_mat[vkey] = np.zeros((len(duvec.vec), ))
 
+                elif batch_sol is not None:
+                    dx_mat = OrderedDict()
+                    dx_mat[vkey] = batch_sol[i]
+
                 else:
                     for voi in params:
                         vkey = self._get_voi_key(voi, params)
@@ -14,7 +14,7 @@ class Relevance(object):
     """ Object that manages the data connectivity graph for systems."""
 
     def __init__(self, group, params_dict, unknowns_dict, connections,
-                 inputs, outputs, mode):
+                 inputs, outputs, mode, cache=None):
 
         self.params_dict = params_dict
         self.unknowns_dict = unknowns_dict
@@ -40,7 +40,11 @@ class Relevance(object):
             self.outputs.append(tuple(out))
 
         self._sgraph = self._setup_sys_graph(group, connections)
-        self._compute_relevant_vars(group, connections)
+
+        if cache is None or not self._load_relevant_vars(cache):
+            self._compute_relevant_vars(group, connections)
+            if cache is not None:
+                self._save_relevant_vars(cache)
 
         # when voi is None, everything is relevant
         self.relevant[None] = set(m['top_promoted_name']
@@ -230,3 +234,36 @@ class Relevance(object):
 
         self._relevant_systems = relevant
         self.relevant = relvars
+
+    def _load_relevant_vars(self, cache):
+        """
+        Load the relevant variables and systems from a `SetupCache`.
+
+        Returns
+        -------
+        bool
+            True if the cache had entries for all of our variables of interest.
+        """
+        relevant = {}
+        relsystems = {}
+        for nodes in self.inputs + self.outputs:
+            for node in nodes:
+                rvars = cache.get_names('relevant:%s' % node)
+                rsys = cache.get_names('relsys:%s' % node)
+                if rvars is None or rsys is None:
+                    return False
+                relevant[node] = set(rvars)
+                relsystems[node] = set(rsys)
+
+        self.relevant = relevant
+        self._relevant_systems = relsystems
+        return True
+
+    def _save_relevant_vars(self, cache):
+        """
+        Store the relevant variables and systems in a `SetupCache`.
+        """
+        for node, rvars in iteritems(self.relevant):
+            cache.set_names('relevant:%s' % node, sorted(rvars))
+            cache.set_names('relsys:%s' % node,
+                            sorted(self._relevant_systems[node]))
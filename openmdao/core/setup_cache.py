@@ -0,0 +1,261 @@
+""" On-disk cache of the expensive results of Problem setup."""
+
+import os
+import hashlib
+import tempfile
+from six import iteritems
+
+import numpy as np
+
+
+def _update_hash(hasher, obj):
+    """
+    Feed a stable representation of `obj` into the given hash object.
+    """
+    if isinstance(obj, np.ndarray):
+        hasher.update(repr((obj.shape, obj.dtype.str)).encode('utf-8'))
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(b'(')
+        for item in obj:
+            _update_hash(hasher, item)
+        hasher.update(b')')
+    else:
+        hasher.update(repr(obj).encode('utf-8'))
+        hasher.update(b',')
+
+
+def model_key(root, params_dict, unknowns_dict, connections, pois, oois, mode):
+    """
+    Compute a key that identifies the structure of a model.
+
+    Args
+    ----
+    root : `Group`
+        The top level `Group` of the model.
+
+    params_dict : OrderedDict
+        Metadata for all params in the model.
+
+    unknowns_dict : OrderedDict
+        Metadata for all unknowns in the model.
+
+    connections : dict
+        Absolute target names mapped to (source, src_indices).
+
+    pois : list of tuples
+        Names of the parameters of interest.
+
+    oois : list of tuples
+        Names of the outputs of interest.
+
+    mode : str
+        Derivative solution mode.
+
+    Returns
+    -------
+    str
+        Hex digest of the model structure.
+    """
+    hasher = hashlib.sha1()
+
+    for s in root.subsystems(recurse=True, include_self=True):
+        _update_hash(hasher, (s.pathname, type(s).__name__))
+
+    for vardict in (params_dict, unknowns_dict):
+        for path, meta in iteritems(vardict):
+            _update_hash(hasher, (path, meta['size'], meta['shape'],
+                                  bool(meta.get('pass_by_obj')),
+                                  bool(meta.get('state')),
+                                  meta.get('src_indices')))
+
+    for tgt, (src, idxs) in iteritems(connections):
+        if idxs is not None:
+            idxs = np.asarray(idxs)
+        _update_hash(hasher, (tgt, src, idxs))
+
+    _update_hash(hasher, (list(pois), list(oois), mode))
+
+    return hasher.hexdigest()
+
+
+def _replace(src, dst):
+    """
+    Move `src` to `dst`, replacing `dst` if it exists.
+    """
+    if hasattr(os, 'replace'):
+        os.replace(src, dst)
+    else:
+        # python 2
+        os.rename(src, dst)
+
+
+class SetupCache(object):
+    """
+    A store for index arrays, execution orders and relevance sets computed
+    during setup, saved in a numpy .npz file so that another process setting
+    up the same model can load them instead of computing them again.
+
+    Entries are only used when the key of the stored model matches the
+    key of the model being set up.
+
+    Args
+    ----
+    filename : str
+        Name of the .npz file used to store the cache.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.key = None
+        self.hits = 0
+        self.misses = 0
+        self._data = {}
+        self._modified = False
+
+    def open(self, key):
+        """
+        Load the stored entries if they belong to the model with the given key.
+
+        Args
+        ----
+        key : str
+            Key of the model being set up.
+        """
+        self.key = key
+        self._data = {}
+        self._modified = False
+
+        if not os.path.exists(self.filename):
+            return
+
+        # A file that can't be read (truncated, corrupt or written by an
+        # older version) is treated as a miss.
+        try:
+            with np.load(self.filename, allow_pickle=False) as store:
+                if '__key__' in store.files and str(store['__key__']) == key:
+                    self._data = dict((name, store[name]) for name in store.files)
+        except Exception:
+            self._data = {}
+
+    def save(self):
+        """
+        Write the cache to disk if any entries were added since it was opened.
+        """
+        if not self._modified:
+            return
+
+        self._data['__key__'] = np.array(self.key)
+
+        # Write to a temporary file in the same directory and move it into
+        # place, so that another process never reads a partly written file.
+        dirname = os.path.dirname(os.path.abspath(self.filename))
+        fd, tmpname = tempfile.mkstemp(suffix='.npz', dir=dirname)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, **self._data)
+            _replace(tmpname, self.filename)
+        except Exception:
+            if os.path.exists(tmpname):
+                os.remove(tmpname)
+            raise
+
+        self._modified = False
+
+    def get(self, name):
+        """
+        Args
+        ----
+        name : str
+            Name of the entry.
+
+        Returns
+        -------
+        ndarray or None
+            The stored array, or None if there is no entry for `name`.
+        """
+        try:
+            val = self._data[name]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return val
+
+    def set(self, name, val):
+        """
+        Store an array under the given name.
+
+        Args
+        ----
+        name : str
+            Name of the entry.
+
+        val : array_like
+            Array to store.
+        """
+        self._data[name] = np.asarray(val)
+        self._modified = True
+
+    def get_names(self, name):
+        """
+        Returns
+        -------
+        list of str or None
+            The stored list of names, or None if there is no entry for `name`.
+        """
+        val = self.get(name)
+        if val is not None:
+            return [str(n) for n in val]
+
+    def set_names(self, name, names):
+        """
+        Store a collection of names under the given name.
+        """
+        self.set(name, np.array(list(names), dtype=np.str_))
+
+    def get_index_pairs(self, name):
+        """
+        Returns
+        -------
+        list of (ndarray, ndarray) or None
+            The stored pairs of equal length index arrays, or None if there
+            is no entry for `name`.
+        """
+        ptr = self.get(name + ':ptr')
+        if ptr is None:
+            return None
+        if len(ptr) == 1:
+            return []
+
+        srcs = np.split(self._data[name + ':src'], ptr[1:-1])
+        tgts = np.split(self._data[name + ':tgt'], ptr[1:-1])
+        return list(zip(srcs, tgts))
+
+    def set_index_pairs(self, name, pairs, dtype):
+        """
+        Store pairs of equal length index arrays under the given name.
+
+        Args
+        ----
+        name : str
+            Name of the entry.
+
+        pairs : list of (ndarray, ndarray)
+            Source and target index arrays.
+
+        dtype : numpy dtype
+            Integer type of the index arrays.
+        """
+        ptr = np.zeros(len(pairs) + 1, dtype=dtype)
+        ptr[1:] = np.cumsum([len(s) for s, t in pairs])
+        if pairs:
+            srcs = np.concatenate([s for s, t in pairs])
+            tgts = np.concatenate([t for s, t in pairs])
+        else:
+            srcs = tgts = np.zeros(0, dtype=dtype)
+
+        self.set(name + ':src', srcs.astype(dtype))
+        self.set(name + ':tgt', tgts.astype(dtype))
+        self.set(name + ':ptr', ptr)
@@ -129,6 +129,10 @@ class System(object):
         # if True, create any directories needed by this System that don't exist
         self.create_dirs = False
 
+        # if False, the Problem always runs a full setup, even when the
+        # structure of the model hasn't changed since the last one.
+        self._incremental_setup = True
+
         # create placeholders for all of the vectors
         self.unknowns = _PlaceholderVecWrapper('unknowns')
         self.resids = _PlaceholderVecWrapper('resids')
@@ -176,6 +180,16 @@ class System(object):
         opt.add_option('linearize', False,
                        desc='Set to True if you want linearize to be called '
                        'even though you are using FD.')
+        opt.add_option('fd_workers', 1, lower=1,
+                       desc='Number of local worker processes, forked from '
+                       'this one, used to compute finite difference columns '
+                       'concurrently. The model must be safe to run in '
+                       "several processes at once, so it can't be used for "
+                       'systems containing an ExternalCode. The workers are '
+                       'kept until cleanup and are sent the current variable '
+                       'values for each finite difference. Columns are '
+                       "computed serially where the 'fork' start method "
+                       "isn't available.")
 
         # This will give deprecation warnings, but will convert the old to
         # new options.
@@ -183,6 +197,10 @@ class System(object):
 
         self._impl = None
 
+        # Worker processes for fd_workers, with their number and the vectors
+        # they were forked with. The pool is closed in cleanup.
+        self._fd_pool = None
+
         self._num_par_fds = 1 # this will be >1 for ParallelFDGroup
         self._par_fd_id = 0 # for ParallelFDGroup, this will be >= 0 and
                             # <= the number of parallel FDs
@@ -193,6 +211,9 @@ class System(object):
         # to regenerate a Jacobian.
         self._jacobian_changed = False
 
+        # Number of times this system has been linearized
+        self._linearize_count = 0
+
         # Used to prevent us from multiplying outscope terms on the jacobian
         self.rel_inputs = None
 
@@ -333,9 +354,15 @@ class System(object):
                 msg = "'%s' promotes '%s' but has no variables matching that specification"
                 raise RuntimeError(msg % (self.pathname, self._promotes[i]))
 
+    def __getstate__(self):
+        """ Returns state as a dict, without the finite difference workers."""
+        state = self.__dict__.copy()
+        state['_fd_pool'] = None
+        return state
+
     def cleanup(self):
         """ Clean up resources prior to exit. """
-        pass
+        self._close_fd_pool()
 
     def subsystems(self, local=False, recurse=False, include_self=False):
         """ Returns an iterator over subsystems.  For `System`, this is an empty list.
@@ -608,6 +635,13 @@ class System(object):
 
         to_prom_name = self._sysdata.to_prom_name
 
+        # Columns are either computed here, or collected into tasks that
+        # are computed by forked worker processes.
+        workers = self.deriv_options['fd_workers']
+        use_pool = workers > 1 and self._num_par_fds == 1 and not MPI and \
+                   _fd_fork_context() is not None
+        tasks = []
+
         # Compute gradient for this param or state.
         for p_name in chain(fd_params, states):
 
@@ -692,76 +726,23 @@ class System(object):
                     else:
                         step = fdstep
 
-                    if cs == 'cs':
-
-                        probdata = unknowns._probdata
-                        probdata.in_complex_step = True
-
-                        inputs._dat[param_key].imag_val[idx] += fdstep
-                        run_model(params, unknowns, resids)
-                        inputs._dat[param_key].imag_val[idx] -= fdstep
-
-                        # delta resid is delta unknown
-                        resultvec.vec[:] = resultvec.imag_vec*(1.0/fdstep)
-                        # Note: vector division is slower than vector mult.
-                        probdata.in_complex_step = False
-
-                    elif fdform == 'forward':
-
-                        target_input[idx] += step
-
-                        run_model(params, unknowns, resids)
-
-                        target_input[idx] -= step
-
-                        # delta resid is delta unknown
-                        resultvec.vec[:] -= cache1
-                        resultvec.vec[:] *= (1.0/step)
-                        # Note: vector division is slower than vector mult.
-
-                    elif fdform == 'backward':
-
-                        target_input[idx] -= step
-
-                        run_model(params, unknowns, resids)
-
-                        target_input[idx] += step
-
-                        # delta resid is delta unknown
-                        resultvec.vec[:] -= cache1
-                        resultvec.vec[:] *= (-1.0/step)
-                        # Note: vector division is slower than vector mult.
-
-                    elif fdform == 'central':
-
-                        target_input[idx] += step
-
-                        run_model(params, unknowns, resids)
-                        cache2 = resultvec.vec.copy()
-
-                        target_input[idx] -= step
-                        resultvec.vec[:] = cache1
-
-                        target_input[idx] -= step
-
-                        run_model(params, unknowns, resids)
-
-                        # central difference formula
-                        resultvec.vec[:] -= cache2
-                        resultvec.vec[:] *= (-0.5/step)
-                        # Note: vector division is slower than vector mult.
-
-                        target_input[idx] += step
+                    if use_pool:
+                        tasks.append((p_name, inputs is unknowns, param_key,
+                                      idx, col, step, fdstep, fdform, cs))
+                    else:
+                        self._fd_column(run_model, params, unknowns, resids,
+                                        resultvec, cache1, inputs, param_key,
+                                        idx, step, fdstep, fdform, cs)
 
-                    for u_name in fd_unknowns:
-                        if qoi_indices and u_name in qoi_indices:
-                            result = resultvec._dat[u_name].val[qoi_indices[u_name]]
-                        else:
-                            result = resultvec._dat[u_name].val
-                        jac[u_name, p_name][:, col] = result
-                        if self._num_par_fds > 1: # pragma: no cover
-                            fd_cols[(u_name, p_name, col)] = \
-                                                   jac[u_name, p_name][:, col]
+                        for u_name in fd_unknowns:
+                            if qoi_indices and u_name in qoi_indices:
+                                result = resultvec._dat[u_name].val[qoi_indices[u_name]]
+                            else:
+                                result = resultvec._dat[u_name].val
+                            jac[u_name, p_name][:, col] = result
+                            if self._num_par_fds > 1: # pragma: no cover
+                                fd_cols[(u_name, p_name, col)] = \
+                                                       jac[u_name, p_name][:, col]
 
                     # When an unknown is a parameter, it isn't calculated, so
                     # we manually fill in identity by placing a 1 wherever it
@@ -779,6 +760,15 @@ class System(object):
                     # Restore old residual
                     resultvec.vec[:] = cache1
 
+        if tasks:
+            results = self._fd_pool_map(tasks, workers, params, unknowns,
+                                         resids, total_derivs, fd_unknowns,
+                                         qoi_indices)
+            for task, cols in zip(tasks, results):
+                p_name, col = task[0], task[4]
+                for u_name, result in zip(fd_unknowns, cols):
+                    jac[u_name, p_name][:, col] = result
+
         if self._num_par_fds > 1:
             if trace:  # pragma: no cover
                 debug("%s: allgathering parallel FD columns" % self.pathname)
@@ -796,6 +786,189 @@ class System(object):
 
         return jac
 
+    def _fd_column(self, run_model, params, unknowns, resids, resultvec,
+                   cache1, inputs, param_key, idx, step, fdstep, fdform, cs):
+        """
+        Perturb entry `idx` of the given input, run the model, and leave the
+        finite difference (or complex step) derivative in resultvec.
+        """
+        target_input = inputs._dat[param_key].val
+
+        if cs == 'cs':
+
+            probdata = unknowns._probdata
+            probdata.in_complex_step = True
+
+            inputs._dat[param_key].imag_val[idx] += fdstep
+            run_model(params, unknowns, resids)
+            inputs._dat[param_key].imag_val[idx] -= fdstep
+
+            # delta resid is delta unknown
+            resultvec.vec[:] = resultvec.imag_vec*(1.0/fdstep)
+            # Note: vector division is slower than vector mult.
+            probdata.in_complex_step = False
+
+        elif fdform == 'forward':
+
+            target_input[idx] += step
+
+            run_model(params, unknowns, resids)
+
+            target_input[idx] -= step
+
+            # delta resid is delta unknown
+            resultvec.vec[:] -= cache1
+            resultvec.vec[:] *= (1.0/step)
+            # Note: vector division is slower than vector mult.
+
+        elif fdform == 'backward':
+
+            target_input[idx] -= step
+
+            run_model(params, unknowns, resids)
+
+            target_input[idx] += step
+
+            # delta resid is delta unknown
+            resultvec.vec[:] -= cache1
+            resultvec.vec[:] *= (-1.0/step)
+            # Note: vector division is slower than vector mult.
+
+        elif fdform == 'central':
+
+            target_input[idx] += step
+
+            run_model(params, unknowns, resids)
+            cache2 = resultvec.vec.copy()
+
+            target_input[idx] -= step
+            resultvec.vec[:] = cache1
+
+            target_input[idx] -= step
+
+            run_model(params, unknowns, resids)
+
+            # central difference formula
+            resultvec.vec[:] -= cache2
+            resultvec.vec[:] *= (-0.5/step)
+            # Note: vector division is slower than vector mult.
+
+            target_input[idx] += step
+
+    def _fd_pool_map(self, tasks, workers, params, unknowns, resids,
+                     total_derivs, fd_unknowns, qoi_indices):
+        """
+        Compute the finite difference columns described by `tasks` in worker
+        processes, and return their results in order. The workers are forked
+        on first use and kept, along with the vectors they were forked with,
+        until cleanup, setup of new vectors, or a change of fd_workers. They
+        are sent the current values of the vectors for every call.
+        """
+        vecs = (params, unknowns, resids)
+
+        if self._fd_pool is None or self._fd_pool[1] != workers or \
+           any(v is not old for v, old in zip(vecs, self._fd_pool[2])):
+            self._close_fd_pool()
+
+            # Workers share our working directory, so concurrent runs of an
+            # external code would overwrite each other's files.
+            from openmdao.components.external_code import ExternalCode
+            for sub in self.subsystems(recurse=True, include_self=True):
+                if isinstance(sub, ExternalCode):
+                    raise RuntimeError("%s: fd_workers > 1 isn't supported "
+                                       "because ExternalCode '%s' would run "
+                                       "concurrently in the same directory." %
+                                       (self.pathname, sub.pathname))
+
+            pool = _fd_fork_context().Pool(workers, _fd_pool_init,
+                                           (self,) + vecs)
+            self._fd_pool = (pool, workers, vecs)
+
+        # A component's vectors may only view variables that are owned by
+        # its parent, so the values are sent per variable.
+        state = [dict((name, acc.val.val if acc.pbo else np.array(acc.val))
+                      for name, acc in iteritems(vec._dat) if not acc.remote)
+                 for vec in vecs]
+
+        # Send the tasks in chunks so that the vectors aren't sent with
+        # every column.
+        bounds = np.linspace(0, len(tasks),
+                             min(len(tasks), 4 * workers) + 1).astype(int)
+        chunks = [(state, total_derivs, fd_unknowns, qoi_indices,
+                   tasks[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+
+        return list(chain(*self._fd_pool[0].map(_fd_pool_run, chunks, 1)))
+
+    def _fd_pool_chunk(self, params, unknowns, resids, state, total_derivs,
+                       fd_unknowns, qoi_indices, tasks):
+        """
+        Compute a chunk of finite difference columns in a worker process,
+        starting from the values of the vectors in the parent.
+
+        Returns
+        -------
+        list of list of ndarray
+            The column of the Jacobian for each unknown in `fd_unknowns`,
+            for each task.
+        """
+        for vec, values in zip((params, unknowns, resids), state):
+            for name, val in iteritems(values):
+                acc = vec._dat[name]
+                if acc.pbo:
+                    acc.val.val = val
+                else:
+                    acc.val[:] = val
+
+        if total_derivs:
+            run_model = self._sys_solve_nonlinear
+            resultvec = unknowns
+        else:
+            run_model = self._sys_apply_nonlinear
+            resultvec = resids
+
+        cache1 = resultvec.vec.copy()
+
+        return [self._fd_task(task, run_model, params, unknowns, resids,
+                              resultvec, cache1, fd_unknowns, qoi_indices)
+                for task in tasks]
+
+    def _close_fd_pool(self):
+        """ Stops the finite difference worker processes, if there are any. """
+        if self._fd_pool is not None:
+            pool = self._fd_pool[0]
+            self._fd_pool = None
+            pool.close()
+            pool.join()
+
+    def _fd_task(self, task, run_model, params, unknowns, resids, resultvec,
+                 cache1, fd_unknowns, qoi_indices):
+        """
+        Compute one finite difference column in a worker process.
+
+        Returns
+        -------
+        list of ndarray
+            The column of the Jacobian for each unknown in `fd_unknowns`.
+        """
+        p_name, in_unknowns, param_key, idx, col, step, fdstep, fdform, cs = task
+        inputs = unknowns if in_unknowns else params
+
+        self._fd_column(run_model, params, unknowns, resids, resultvec,
+                        cache1, inputs, param_key, idx, step, fdstep, fdform, cs)
+
+        results = []
+        for u_name in fd_unknowns:
+            if qoi_indices and u_name in qoi_indices:
+                result = resultvec._dat[u_name].val[qoi_indices[u_name]]
+            else:
+                result = resultvec._dat[u_name].val
+            results.append(np.array(result))
+
+        # Restore old residual
+        resultvec.vec[:] = cache1
+
+        return results
+
     def _sys_apply_linear(self, mode, do_apply, vois=(None,), gs_outputs=None,
                           rel_inputs=None):
         """
@@ -956,6 +1129,7 @@ class System(object):
                         jc[key] = jc[key].reshape((shape[0], 1))
 
         self._jacobian_changed = True
+        self._linearize_count += 1
         return self._jacobian_cache
 
     def _apply_linear_jac(self, params, unknowns, dparams, dunknowns, dresids, mode):
@@ -1582,3 +1756,38 @@ def _iter_J_nested(J):
     for output, subdict in iteritems(J):
         for param, value in iteritems(subdict):
             yield (output, param), value
+
+
+# In a forked FD worker, its copies of the system and of the vectors it
+# computes columns for. They are passed to the workers when they are forked,
+# so only the values of the vectors, the tasks and the results have to be
+# pickled. Workers started any other way (e.g. 'spawn', the default on
+# Windows and on macOS from python 3.8) would need the whole model pickled,
+# so the pool always uses the 'fork' start method.
+_fd_pool_data = None
+
+def _fd_fork_context():
+    """
+    Returns the multiprocessing context that forks its worker processes, or
+    None if processes can't be forked here.
+    """
+    import multiprocessing
+
+    if not hasattr(multiprocessing, 'get_context'):
+        # python 2 always forks where it can
+        return multiprocessing if hasattr(os, 'fork') else None
+
+    try:
+        return multiprocessing.get_context('fork')
+    except ValueError:
+        return None
+
+def _fd_pool_init(system, params, unknowns, resids):
+    """Keep the forked copies of the system and its vectors in a worker."""
+    global _fd_pool_data
+    _fd_pool_data = (system, params, unknowns, resids)
+
+def _fd_pool_run(chunk):
+    """Run a chunk of FD tasks in a worker process."""
+    system, params, unknowns, resids = _fd_pool_data
+    return system._fd_pool_chunk(params, unknowns, resids, *chunk)
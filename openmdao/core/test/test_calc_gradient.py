@@ -7,10 +7,11 @@ import unittest
 import numpy as np
 
 from numpy.testing import assert_almost_equal
+from scipy.sparse import csc_matrix
 
 from six import text_type, PY3
 
-from openmdao.api import Problem, Group, IndepVarComp, ExecComp
+from openmdao.api import Problem, Group, IndepVarComp, ExecComp, Component
 from openmdao.test.simple_comps import RosenSuzuki, FanIn
 
 
@@ -46,6 +47,42 @@ expectedJ_array = np.concatenate((
 ))
 
 
+class SparseSquareComp(Component):
+    """ y = a*x**2, with a sparse Jacobian."""
+
+    def __init__(self, n, a):
+        super(SparseSquareComp, self).__init__()
+        self.a = a
+        self.add_param('x', np.zeros(n))
+        self.add_output('y', np.zeros(n))
+
+    def solve_nonlinear(self, params, unknowns, resids):
+        unknowns['y'] = self.a*params['x']**2
+
+    def linearize(self, params, unknowns, resids):
+        # the diagonal is stored even where it is zero
+        n = len(params['x'])
+        return {('y', 'x'): csc_matrix((2.0*self.a*params['x'],
+                                        (np.arange(n), np.arange(n))),
+                                       shape=(n, n))}
+
+
+class SparseSliceComp(Component):
+    """ z = 2*x[1:4], with a sparse Jacobian."""
+
+    def __init__(self):
+        super(SparseSliceComp, self).__init__()
+        self.add_param('x', np.zeros(6))
+        self.add_output('z', np.zeros(3))
+
+    def solve_nonlinear(self, params, unknowns, resids):
+        unknowns['z'] = 2.0*params['x'][1:4]
+
+    def linearize(self, params, unknowns, resids):
+        return {('z', 'x'): csc_matrix((2.0*np.ones(3),
+                                        ([0, 1, 2], [1, 2, 3])), shape=(3, 6))}
+
+
 class TestCalcGradient(unittest.TestCase):
 
     def test_calc_gradient_interface_errors(self):
@@ -247,6 +284,79 @@ class TestCalcGradient(unittest.TestCase):
         J = prob.calc_gradient(indep_list, unknown_list, mode='fd', return_format='array')
         assert_almost_equal(J, np.array([[-6., 35.]]))
 
+    def test_calc_gradient_coloring(self):
+        prob = Problem()
+        root = prob.root = Group()
+        root.add('p', IndepVarComp('x', np.arange(1.0, 7.0)), promotes=['x'])
+        root.add('c1', SparseSquareComp(6, 3.0), promotes=['x', 'y'])
+        root.add('c2', SparseSliceComp(), promotes=['x', 'z'])
+        root.add('p2', IndepVarComp('w', 1.0), promotes=['w'])
+        root.add('c3', ExecComp('v = 4.0*w*x', x=np.zeros(1)),
+                 promotes=['w', 'v'])
+        root.connect('x', 'c3.x', src_indices=[0])
+        prob.setup(check=False)
+        prob.run()
+
+        nsolves = [0]
+        solve = root.ln_solver.solve
+        def counting_solve(rhs_mat, system, mode):
+            nsolves[0] += 1
+            return solve(rhs_mat, system, mode)
+        root.ln_solver.solve = counting_solve
+
+        for mode, indeps, unknowns, ncolors in (('fwd', ['x', 'w'], ['y', 'z', 'v'], 2),
+                                                ('rev', ['x', 'w'], ['y', 'z'], 2)):
+            J = prob.calc_gradient(indeps, unknowns, mode=mode)
+
+            colors = prob.compute_total_coloring(indeps, unknowns, mode=mode)
+            self.assertEqual(len(colors), ncolors)
+
+            nsolves[0] = 0
+            Jc = prob.calc_gradient(indeps, unknowns, mode=mode)
+            self.assertEqual(nsolves[0], ncolors)
+            assert_almost_equal(Jc, J)
+
+            Jd = prob.calc_gradient(indeps, unknowns, mode=mode, return_format='dict')
+            assert_almost_equal(Jd['y']['x'], np.diag(6.0*np.arange(1.0, 7.0)))
+
+    def test_calc_gradient_coloring_structural(self):
+        prob = Problem()
+        root = prob.root = Group()
+        root.add('p', IndepVarComp('x', np.zeros(4)), promotes=['x'])
+        root.add('c1', SparseSquareComp(4, 1.0), promotes=['x', 'y'])
+        root.add('c2', ExecComp('z = x[0]*x[1]', x=np.zeros(2)),
+                 promotes=['z'])
+        root.connect('x', 'c2.x', src_indices=[0, 1])
+        prob.setup(check=False)
+        prob.run()
+
+        # every derivative is zero here, but not structurally zero
+        colors = prob.compute_total_coloring(['x'], ['y', 'z'], mode='fwd')
+        self.assertEqual(len(colors), 2)
+
+        x = np.array([1.0, -2.0, 3.0, 0.5])
+        prob['x'] = x
+        prob.run()
+        J = prob.calc_gradient(['x'], ['y', 'z'], mode='fwd')
+        assert_almost_equal(J[:4], np.diag(2.0*x))
+        assert_almost_equal(J[4], [x[1], x[0], 0.0, 0.0])
+
+        # dense sub-Jacobians and finite differenced components couple all
+        # of their entries
+        for fd in (False, True):
+            prob = Problem()
+            root = prob.root = Group()
+            root.add('p', IndepVarComp('x', np.zeros(4)), promotes=['x'])
+            root.add('c1', ExecComp('y = x**2', x=np.zeros(4), y=np.zeros(4)),
+                     promotes=['x', 'y'])
+            if fd:
+                root.c1.deriv_options['type'] = 'fd'
+            prob.setup(check=False)
+            prob.run()
+
+            colors = prob.compute_total_coloring(['x'], ['y'], mode='fwd')
+            self.assertEqual(len(colors), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
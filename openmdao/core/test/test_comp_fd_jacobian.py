@@ -3,12 +3,13 @@ finite difference."""
 
 from __future__ import print_function
 from collections import OrderedDict
+import multiprocessing
 import unittest
 
 import numpy as np
 
 from openmdao.api import Component, Group, Problem, System, \
-    IndepVarComp, ExecComp, ScipyGMRES
+    IndepVarComp, ExecComp, ExternalCode, ScipyGMRES
 from openmdao.core.vec_wrapper import SrcVecWrapper
 from openmdao.test.simple_comps import SimpleArrayComp, \
                                       SimpleImplicitComp
@@ -172,6 +173,88 @@ class CompFDTestCase(unittest.TestCase):
 
         assert_equal_jacobian(self, jac, expected_jac, 1e-5)
 
+    def test_fd_workers(self):
+
+        comp = self.p.root.ci1
+        params, unknowns, resids = comp.params, comp.unknowns, comp.resids
+
+        params['x'] = np.array([0.5])
+        comp.solve_nonlinear(params, unknowns, resids)
+        jac = comp.fd_jacobian(params, unknowns, resids)
+        ucache = unknowns.vec.copy()
+        rcache = resids.vec.copy()
+
+        comp.deriv_options['fd_workers'] = 2
+        for form in ('forward', 'central'):
+            comp.deriv_options['form'] = form
+            pjac = comp.fd_jacobian(params, unknowns, resids)
+
+            assert_equal_jacobian(self, pjac, jac, 1e-5)
+
+            # the perturbations happen in the workers
+            np.testing.assert_array_equal(unknowns.vec, ucache)
+            np.testing.assert_array_equal(resids.vec, rcache)
+
+        # the workers are kept, and are sent the current values
+        pool = comp._fd_pool[0]
+        params['x'] = np.array([0.25])
+        comp.solve_nonlinear(params, unknowns, resids)
+        comp.deriv_options['fd_workers'] = 1
+        jac = comp.fd_jacobian(params, unknowns, resids)
+        comp.deriv_options['fd_workers'] = 2
+        pjac = comp.fd_jacobian(params, unknowns, resids)
+
+        self.assertIs(comp._fd_pool[0], pool)
+        assert_equal_jacobian(self, pjac, jac, 1e-5)
+
+        self.p.cleanup()
+        self.assertIsNone(comp._fd_pool)
+
+    def test_fd_workers_external_code(self):
+
+        prob = Problem(Group())
+        prob.root.add('p', IndepVarComp('x', 1.0))
+        sub = prob.root.add('sub', Group())
+        ext = sub.add('ext', ExternalCode())
+        ext.add_param('x', 1.0)
+        ext.add_output('y', 1.0)
+        prob.root.connect('p.x', 'sub.ext.x')
+        sub.deriv_options['type'] = 'fd'
+        sub.deriv_options['fd_workers'] = 2
+        prob.setup(check=False)
+
+        # the workers would overwrite each other's files
+        with self.assertRaises(RuntimeError) as cm:
+            sub.fd_jacobian(sub.params, sub.unknowns, sub.resids,
+                            total_derivs=True)
+
+        self.assertEqual(str(cm.exception),
+                         "sub: fd_workers > 1 isn't supported because "
+                         "ExternalCode 'sub.ext' would run concurrently in "
+                         "the same directory.")
+
+    @unittest.skipUnless(hasattr(multiprocessing, 'get_context'),
+                         "start methods need python 3.4 or later")
+    def test_fd_workers_spawn_default(self):
+
+        comp = self.p.root.ci1
+        params, unknowns, resids = comp.params, comp.unknowns, comp.resids
+
+        params['x'] = np.array([0.5])
+        comp.solve_nonlinear(params, unknowns, resids)
+        jac = comp.fd_jacobian(params, unknowns, resids)
+
+        # the workers are forked even if the default start method is spawn
+        method = multiprocessing.get_start_method()
+        multiprocessing.set_start_method('spawn', force=True)
+        try:
+            comp.deriv_options['fd_workers'] = 2
+            pjac = comp.fd_jacobian(params, unknowns, resids)
+        finally:
+            multiprocessing.set_start_method(method, force=True)
+
+        assert_equal_jacobian(self, pjac, jac, 1e-5)
+
     def test_override_states(self):
 
         expected_keys=[('y', 'x'), ('y', 'z'), ('z', 'x'), ('z', 'z')]
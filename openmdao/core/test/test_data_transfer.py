@@ -0,0 +1,76 @@
+""" Tests for the DataTransfer object."""
+
+import unittest
+import numpy as np
+
+from openmdao.core.data_transfer import DataTransfer
+from openmdao.core.problem import _ProbData
+
+
+class _Vec(object):
+    """ Just the parts of a VecWrapper that DataTransfer uses."""
+
+    def __init__(self, vec, probdata):
+        self.vec = vec
+        self.imag_vec = np.zeros(vec.shape)
+        self._probdata = probdata
+
+
+class TestDataTransfer(unittest.TestCase):
+
+    def setUp(self):
+        # one long slice run, two short scatters, and a src_indices
+        # connection that reads the same source entry twice.
+        self.src_idxs = [np.arange(0, 20), np.array([20, 21]),
+                         np.array([23]), np.array([22, 22, 21])]
+        self.tgt_idxs = [np.arange(5, 25), np.array([0, 1]),
+                         np.array([2]), np.array([25, 26, 27])]
+        self.pbd = _ProbData()
+
+    def _xfer(self, mode):
+        return DataTransfer(self.src_idxs, self.tgt_idxs, {}, [], mode, None)
+
+    def test_fwd(self):
+        xfer = self._xfer('fwd')
+        self.assertEqual(len(xfer._slices), 1)
+
+        src = _Vec(np.arange(24, dtype=float) + 1.0, self.pbd)
+        tgt = _Vec(np.zeros(28), self.pbd)
+        xfer.transfer(src, tgt)
+
+        expected = np.zeros(28)
+        for isrcs, itgts in zip(self.src_idxs, self.tgt_idxs):
+            expected[itgts] = src.vec[isrcs]
+        np.testing.assert_array_equal(tgt.vec, expected)
+
+    def test_fwd_complex_step(self):
+        xfer = self._xfer('fwd')
+
+        src = _Vec(np.arange(24, dtype=float), self.pbd)
+        src.imag_vec[:] = np.arange(24, dtype=float) * 2.0
+        tgt = _Vec(np.zeros(28), self.pbd)
+
+        self.pbd.in_complex_step = True
+        try:
+            xfer.transfer(src, tgt)
+        finally:
+            self.pbd.in_complex_step = False
+
+        np.testing.assert_array_equal(tgt.imag_vec, tgt.vec * 2.0)
+
+    def test_rev(self):
+        xfer = self._xfer('rev')
+
+        src = _Vec(np.ones(24), self.pbd)
+        tgt = _Vec(np.arange(28, dtype=float) + 1.0, self.pbd)
+        xfer.transfer(src, tgt, mode='rev')
+
+        # Contributions from all targets accumulate in the sources.
+        expected = np.ones(24)
+        for isrcs, itgts in zip(self.src_idxs, self.tgt_idxs):
+            np.add.at(expected, isrcs, tgt.vec[itgts])
+        np.testing.assert_array_equal(src.vec, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
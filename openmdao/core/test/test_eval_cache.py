@@ -0,0 +1,100 @@
+""" Tests for the driver evaluation cache."""
+
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, Newton, ScipyGMRES
+from openmdao.core.eval_cache import EvalCache, StateCache
+from openmdao.test.sellar import SellarStateConnection
+from openmdao.test.util import assert_rel_error
+
+
+class TestEvalCache(unittest.TestCase):
+
+    def test_get_set(self):
+        cache = EvalCache(10)
+        x = np.array([1.0, 2.0])
+
+        self.assertIsNone(cache.get(x, 'funcs'))
+        cache.set(x, 'funcs', 3.0)
+        self.assertEqual(cache.get(x.copy(), 'funcs'), 3.0)
+
+        # Fields of a point are cached separately.
+        self.assertIsNone(cache.get(x, 'grad'))
+        cache.set(x, 'grad', 4.0)
+        self.assertEqual(cache.get(x, 'grad'), 4.0)
+        self.assertEqual(len(cache), 1)
+
+        self.assertIsNone(cache.get(x + 1e-15, 'funcs'))
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 3)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+
+    def test_lru(self):
+        cache = EvalCache(2)
+        x1, x2, x3 = np.array([1.0]), np.array([2.0]), np.array([3.0])
+
+        cache.set(x1, 'funcs', 1)
+        cache.set(x2, 'funcs', 2)
+
+        # x1 is used, so x2 is dropped to make room for x3.
+        cache.get(x1, 'funcs')
+        cache.set(x3, 'funcs', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertTrue(x1 in cache)
+        self.assertFalse(x2 in cache)
+        self.assertTrue(x3 in cache)
+
+
+class TestStateCache(unittest.TestCase):
+
+    def test_nearest(self):
+        cache = StateCache(2)
+        self.assertIsNone(cache.nearest(np.zeros(2)))
+
+        cache.add(np.array([0.0, 0.0]), np.array([1.0]))
+        cache.add(np.array([1.0, 1.0]), np.array([2.0]))
+        self.assertEqual(cache.nearest(np.array([0.2, 0.1])), 1.0)
+        self.assertEqual(cache.nearest(np.array([0.8, 0.9])), 2.0)
+
+        # The oldest point is replaced when full.
+        cache.add(np.array([0.1, 0.1]), np.array([3.0]))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.nearest(np.array([0.0, 0.0])), 3.0)
+
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 1)
+
+    def test_driver_warm_start(self):
+        iters = []
+        for state_cache in [None, StateCache(10)]:
+            prob = Problem()
+            prob.root = SellarStateConnection()
+            prob.root.nl_solver = Newton()
+            prob.root.ln_solver = ScipyGMRES()
+            prob.driver.add_desvar('x')
+            prob.driver.add_desvar('z')
+            prob.driver.state_cache = state_cache
+            prob.setup(check=False)
+
+            count = 0
+            for z in [[5.0, 2.0], [1.0, 8.0], [5.0, 2.0], [1.0, 8.0]]:
+                prob['z'] = np.array(z)
+                prob.run()
+                count += prob.root.nl_solver.iter_count
+
+            assert_rel_error(self, prob['y1'], 7.64693805, 1e-6)
+            iters.append(count)
+
+        # Returning to a visited point starts from its converged states.
+        self.assertLess(iters[1], iters[0])
+        self.assertEqual(len(prob.driver.state_cache), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
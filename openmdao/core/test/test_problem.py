@@ -16,6 +16,7 @@ from openmdao.test.example_groups import ExampleGroup, ExampleGroupWithPromotes,
 from openmdao.test.sellar import SellarStateConnection
 from openmdao.test.simple_comps import SimpleComp, SimpleImplicitComp, RosenSuzuki, FanIn
 from openmdao.util.options import OptionsDictionary
+from openmdao.test.util import assert_rel_error
 
 if PY3:
     def py3fix(s):
@@ -1047,6 +1048,45 @@ class TestProblem(unittest.TestCase):
             "setup must be called again before running the model."
         self.assertEqual(str(err.exception), expected_msg)
 
+    def test_incremental_setup(self):
+
+        top = Problem()
+        top.root = SellarStateConnection()
+        top.setup(check=False)
+        top.run()
+
+        y1 = top['y1']
+        uvec = top.root.unknowns.vec
+        xfers = top.root._data_xfer
+        relevance = top._probdata.relevance
+
+        # Option and value changes keep the vectors and data transfers.
+        top.root.nl_solver.options['atol'] = 1e-12
+        top['x'] = 3.0
+        top.setup(check=False)
+
+        self.assertTrue(top.root.unknowns.vec is uvec)
+        self.assertTrue(top.root._data_xfer is xfers)
+        self.assertTrue(top._probdata.relevance is relevance)
+
+        # values are back at their initial values
+        self.assertEqual(top['x'], 1.0)
+        self.assertEqual(top['y1'], 1.0)
+
+        top.run()
+        assert_rel_error(self, top['y1'], y1, 1e-9)
+
+        # A new design variable changes relevance, so everything is rebuilt.
+        top.driver.add_desvar('z')
+        top.setup(check=False)
+
+        self.assertFalse(top.root.unknowns.vec is uvec)
+        self.assertFalse(top._probdata.relevance is relevance)
+
+        top.run()
+        assert_rel_error(self, top['y1'], y1, 1e-9)
+
+
 class TestCheckSetup(unittest.TestCase):
 
     def test_out_of_order(self):
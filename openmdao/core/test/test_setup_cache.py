@@ -0,0 +1,101 @@
+""" Tests for the on-disk setup cache."""
+
+import os
+import unittest
+from tempfile import mkdtemp
+from shutil import rmtree
+
+import numpy as np
+
+from openmdao.api import Problem
+from openmdao.test.sellar import SellarDerivativesGrouped
+from openmdao.test.util import assert_rel_error
+
+
+class TestSetupCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = mkdtemp()
+        self.fname = os.path.join(self.tmpdir, 'setup.npz')
+
+    def tearDown(self):
+        try:
+            rmtree(self.tmpdir)
+        except OSError:
+            pass
+
+    def _problem(self, desvars=('x', 'z')):
+        prob = Problem(root=SellarDerivativesGrouped(), setup_cache=self.fname)
+        for name in desvars:
+            prob.driver.add_desvar(name)
+        prob.driver.add_objective('obj')
+        prob.driver.add_constraint('con1', upper=0.0)
+        prob.root.ln_solver.options['mode'] = 'rev'
+        prob.setup(check=False)
+        return prob
+
+    def test_reuse(self):
+        prob1 = self._problem()
+        self.assertTrue(os.path.exists(self.fname))
+        self.assertEqual(prob1.setup_cache.hits, 0)
+
+        prob1.run()
+        J1 = prob1.calc_gradient(['x', 'z'], ['obj', 'con1'], return_format='array')
+
+        prob2 = self._problem()
+        self.assertTrue(prob2.setup_cache.hits > 0)
+        self.assertEqual(prob2.setup_cache.misses, 0)
+
+        rel1 = prob1.root._probdata.relevance
+        rel2 = prob2.root._probdata.relevance
+        self.assertEqual(rel1.relevant, rel2.relevant)
+        self.assertEqual(rel1._relevant_systems, rel2._relevant_systems)
+        self.assertEqual(prob1.root.list_order(), prob2.root.list_order())
+
+        for key, xfer in prob1.root._data_xfer.items():
+            xfer2 = prob2.root._data_xfer[key]
+            np.testing.assert_array_equal(xfer._src_idxs, xfer2._src_idxs)
+            np.testing.assert_array_equal(xfer._tgt_idxs, xfer2._tgt_idxs)
+
+        prob2.run()
+        J2 = prob2.calc_gradient(['x', 'z'], ['obj', 'con1'], return_format='array')
+
+        assert_rel_error(self, prob2['y1'], prob1['y1'], 1e-9)
+        assert_rel_error(self, J2, J1, 1e-9)
+
+    def test_structure_change(self):
+        self._problem()
+
+        # different variables of interest give a different key, so nothing
+        # is read from the stale file.
+        prob = self._problem(desvars=('z',))
+        self.assertEqual(prob.setup_cache.hits, 0)
+
+        prob.run()
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+
+    def test_bad_file(self):
+        self._problem()
+        with open(self.fname, 'rb') as f:
+            data = f.read()
+
+        # a truncated file or one that isn't an npz file is a miss
+        for content in (data[:len(data)//2], b'not a cache'):
+            with open(self.fname, 'wb') as f:
+                f.write(content)
+
+            prob = self._problem()
+            self.assertEqual(prob.setup_cache.hits, 0)
+            prob.run()
+            assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+
+            # and is replaced by a good one
+            prob = self._problem()
+            self.assertTrue(prob.setup_cache.hits > 0)
+
+        # no temporary files are left behind
+        self.assertEqual(os.listdir(self.tmpdir), ['setup.npz'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -161,6 +161,40 @@ class TestVecWrapper(unittest.TestCase):
         self.assertTrue((np.array(u._dat['C1.y1'].val)==np.array([1., 1., 1., 1., 1., 1.])).all())
         self.assertTrue((np.array(u._dat['C1.y2'].val)==np.array([2.])).all())
 
+    def test_bulk_get_set(self):
+        unknowns_dict = OrderedDict()
+
+        unknowns_dict['y1'] = { 'shape': (3,2), 'size': 6, 'val': np.ones((3, 2)) }
+        unknowns_dict['y2'] = { 'shape': 1, 'size': 1, 'val': 2.0 }
+        unknowns_dict['y3'] = { 'size': 0, 'val': "foo", 'pass_by_obj': True }
+
+        sd = _SysData('')
+        for u, meta in unknowns_dict.items():
+            meta['pathname'] = u
+            meta['top_promoted_name'] = u
+            sd.to_prom_name[u] = u
+
+        u = SrcVecWrapper(sd, pbd)
+        u.setup(unknowns_dict, store_byobjs=True)
+
+        y1, y2, y3 = u.bulk_get(['y1', 'y2', 'y3'])
+        self.assertEqual(y1.shape, (3, 2))
+        self.assertEqual(y2, 2.0)
+        self.assertEqual(y3, 'foo')
+
+        # reshaped views are cached and share memory with the vector
+        self.assertTrue(u['y1'] is y1)
+        y1[0, 0] = 5.0
+        self.assertEqual(u.vec[0], 5.0)
+
+        u.bulk_set(['y1', 'y2', 'y3'], [np.ones((3, 2))*3., 4.0, 'bar'])
+        self.assertTrue(np.all(u['y1'] == np.ones((3, 2))*3.))
+        self.assertEqual(u['y2'], 4.0)
+        self.assertEqual(u['y3'], 'bar')
+
+        # accessors are slotted
+        self.assertFalse(hasattr(u._dat['y1'], '__dict__'))
+
     def test_norm(self):
         unknowns_dict = OrderedDict()
 
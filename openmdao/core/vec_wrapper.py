@@ -27,6 +27,11 @@ class _ByObjWrapper(object):
 
 # using a slotted object here to save memory
 class Accessor(object):
+
+    __slots__ = ['owned', 'vectype', 'pbo', 'remote', 'probdata', 'val',
+                 'imag_val', 'slice', 'meta', 'shape', 'get', 'flat', 'set',
+                 '_view', '_view_base']
+
     def __init__(self, vecwrapper, slice, val, meta, probdata, alloc_complex,
                  owned=True, imag_val=None, dangling=False):
         """ Initialize this accessor.
@@ -86,22 +91,30 @@ class Accessor(object):
         else:
             self.slice = slice
         self.meta = meta
+        self.shape = meta.get('shape')
+
+        # reshaped view of val, rebuilt whenever val is replaced
+        self._view = None
+        self._view_base = None
 
         self.get, self.flat = self._setup_get_funct(vecwrapper, meta, alloc_complex)
         self.set = self._setup_set_funct(vecwrapper, meta, alloc_complex)
 
     def __getstate__(self):
         """ Returns state as a dict. """
-        state = self.__dict__.copy()
+        state = dict((s, getattr(self, s)) for s in self.__slots__
+                     if hasattr(self, s))
         for s in ('get', 'set'):
             state[s] = getattr(self, s).__name__
         if state['flat'] is not None:
             state['flat'] = state['flat'].__name__
+        state['_view'] = state['_view_base'] = None
         return state
 
     def __setstate__(self, state):
         """ Restore state from `state`. """
-        self.__dict__.update(state)
+        for name, val in iteritems(state):
+            setattr(self, name, val)
         for s in ('get', 'set'):
             setattr(self, s, getattr(self, getattr(self, s)))
         flat = getattr(self, 'flat')
@@ -224,8 +237,12 @@ class Accessor(object):
             return self.val
 
     def _get_arr_diff_shape(self):
-        """Array with different shape."""
-        return self.val.reshape(self.meta['shape'])
+        """Array with different shape, using a cached view."""
+        val = self.val
+        if self._view_base is not val:
+            self._view = val.reshape(self.shape)
+            self._view_base = val
+        return self._view
 
     def _get_arr_diff_shape_complex(self):
         """Array with different shape, complex support."""
@@ -233,7 +250,7 @@ class Accessor(object):
             val = self.val + self.imag_val*1j
         else:
             val = self.val
-        return val.reshape(self.meta['shape'])
+        return val.reshape(self.shape)
 
     def _get_scalar(self):
         """Fast scalar."""
@@ -269,7 +286,7 @@ class Accessor(object):
         scale, offset = self.meta['unit_conv']
         vec = self.val + offset
         vec *= scale
-        return vec.reshape(self.meta['shape'])
+        return vec.reshape(self.shape)
 
     def _get_arr_units_diff_shape_complex(self):
         """Array with diff shape and unit conversion, complex support."""
@@ -280,7 +297,7 @@ class Accessor(object):
         scale, offset = self.meta['unit_conv']
         vec = val + offset
         vec *= scale
-        return vec.reshape(self.meta['shape'])
+        return vec.reshape(self.shape)
 
     def _get_scalar_units(self):
         """Scalar with unit conversion."""
@@ -434,6 +451,42 @@ class VecWrapper(object):
         """
         self._dat[name].set(value)
 
+    def bulk_get(self, names):
+        """
+        Retrieve the unflattened values of several variables in one call.
+
+        Args
+        ----
+        names : iter of str
+            Names of the variables to get the values for.
+
+        Returns
+        -------
+        list
+            The unflattened values of the named variables, in the same order
+            as names. Arrays are views into this vector unless a unit
+            conversion or complex step is active.
+        """
+        dat = self._dat
+        return [dat[name].get() for name in names]
+
+    def bulk_set(self, names, values):
+        """
+        Set the values of several variables in one call.
+
+        Args
+        ----
+        names : iter of str
+            Names of the variables to set.
+
+        values : iter
+            The unflattened values of the named variables, in the same order
+            as names.
+        """
+        dat = self._dat
+        for name, value in zip(names, values):
+            dat[name].set(value)
+
     def __len__(self):
         """
         Returns
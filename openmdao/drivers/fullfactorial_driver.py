@@ -2,10 +2,7 @@
 OpenMDAO design-of-experiments driver implementing the Full Factorial method.
 """
 
-from collections import OrderedDict
-import itertools
-from six import iteritems
-from six.moves import zip
+from six import itervalues
 
 import numpy as np
 
@@ -36,29 +33,27 @@ class FullFactorialDriver(PredeterminedRunsDriver):
         self.num_levels = num_levels
 
     def _build_runlist(self):
-        value_arrays = OrderedDict()
-        for name, meta in iteritems(self.get_desvar_metadata()):
-            value_arrays[name] = []
-
-            # Support for array desvars
-            val = self.root.unknowns._dat[name].val
-            nval = meta['size']
-
-            for k in range(nval):
-
-                low = meta['lower']
-                high = meta['upper']
-                if isinstance(low, np.ndarray):
-                    low = low[k]
-                if isinstance(high, np.ndarray):
-                    high = high[k]
-
-                value_arrays[name].append(np.linspace(low, high,
-                                                      num=self.num_levels).tolist())
-
-        keys = list(value_arrays.keys())
-        for name in keys:
-            value_arrays[name] = [np.array(x) for x in itertools.product(*value_arrays[name])]
-
-        for combination in itertools.product(*value_arrays.values()):
-            yield zip(keys, combination)
+        """Build a runlist of all combinations of the levels of every design
+        variable entry, with the last entry varying fastest."""
+        for case in self._iter_cases(0, self._num_cases()):
+            yield case
+
+    def _num_cases(self):
+        size = sum(meta['size'] for meta in
+                   itervalues(self.get_desvar_metadata()))
+        return self.num_levels**size
+
+    def _get_case_block(self, idxs):
+        """Decodes each case index into one level per design variable entry,
+        as the digits of the index in base num_levels."""
+        sizes, lows, highs = self._get_desvar_bounds()
+        dims = len(lows)
+
+        vals = np.empty((len(idxs), dims))
+        if dims > 0:
+            digits = np.unravel_index(idxs, (self.num_levels,)*dims)
+            for j in range(dims):
+                levels = np.linspace(lows[j], highs[j], num=self.num_levels)
+                vals[:, j] = levels[digits[j]]
+
+        return self._split_desvars(sizes, vals)
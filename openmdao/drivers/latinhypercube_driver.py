@@ -2,12 +2,10 @@
 OpenMDAO design-of-experiments Driver implementing the Latin Hypercube and Optimized Latin Hypercube methods.
 """
 
-from collections import OrderedDict
 import os
-from random import shuffle, randint, seed
 
-from six import iteritems, itervalues
-from six.moves import range, zip
+from six import itervalues
+from six.moves import range
 
 import numpy as np
 
@@ -17,6 +15,9 @@ from openmdao.util.array_util import evenly_distrib_idxs
 trace = os.environ.get('OPENMDAO_TRACE')
 from openmdao.core.mpi_wrap import debug
 
+# Number of rows of the hypercube that share a stream of random numbers.
+_BUCKET_BLOCK = 256
+
 
 class LatinHypercubeDriver(PredeterminedRunsDriver):
     """Design-of-experiments Driver implementing the Latin Hypercube method.
@@ -46,98 +47,89 @@ class LatinHypercubeDriver(PredeterminedRunsDriver):
 
     def _build_runlist(self):
         """Build a runlist based on the Latin Hypercube method."""
-        design_vars = self.get_desvar_metadata()
-
-        # Add up sizes
-        self.num_design_vars = sum(meta['size'] for meta in itervalues(design_vars))
-
-        if self.seed is not None:
-            seed(self.seed)
-            np.random.seed(self.seed)
+        self._init_lhc(self.seed)
 
-        # Generate an LHC of the proper size
-        rand_lhc = self._get_lhc()
-
-        # Map LHC to buckets
-        buckets = OrderedDict()
-        j = 0
-
-        for (name, bounds) in iteritems(design_vars):
-            buckets[name] = []
-
-            # Support for array desvars
-            val = self.root.unknowns._dat[name].val
-            nval = bounds['size']
-
-            for k in range(nval):
-
-                lowb = bounds['lower']
-                upb = bounds['upper']
-                if isinstance(lowb, np.ndarray):
-                    lowb = lowb[k]
-                if isinstance(upb, np.ndarray):
-                    upb = upb[k]
-
-                design_var_buckets = self._get_buckets(lowb, upb)
-                buckets[name].append([design_var_buckets[rand_lhc[i, j]]
-                                      for i in range(self.num_samples)])
-                j += 1
-
-        # Return random values in given buckets
-        for i in range(self.num_samples):
-            sample = []
-            for key, bounds in iteritems(buckets):
-                sample.append([key, np.array([np.random.uniform(bounds[k][i][0],
-                                                                bounds[k][i][1])
-                                              for k in range(design_vars[key]['size'])])
-                               ])
-            yield sample
+        for case in self._iter_cases(0, self.num_samples):
+            yield case
 
     def _distrib_build_runlist(self):
         """
         Returns an iterator over only those cases meant to execute
-        in the current rank as part of a parallel DOE. A latin hypercube,
-        unlike some other DOE generators, is created in one rank and then
-        the appropriate cases are scattered to the appropriate ranks.
+        in the current rank as part of a parallel DOE. Every rank builds the
+        same latin hypercube from a common seed, then generates the values of
+        its own contiguous range of cases.
         """
         comm = self._full_comm
 
-        # get the par_doe_id from every rank in the full comm so we know which
-        # cases to scatter where
-        doe_ids = comm.allgather(self._par_doe_id)
+        lhc_seed = self.seed
+        if lhc_seed is None:
+            if comm.rank == 0:
+                lhc_seed = np.random.RandomState().randint(2**31 - 1)
+            lhc_seed = comm.bcast(lhc_seed, root=0)
 
-        job_list = None
-        if comm.rank == 0:
-            if trace:
-                debug('Parallel DOE using %d procs' % self._num_par_doe)
-            run_list = [list(case) for case in self._build_runlist()] # need to run iterator
+        if trace:
+            debug('Parallel DOE using %d procs' % self._num_par_doe)
+        self._init_lhc(lhc_seed)
 
-            run_sizes, run_offsets = evenly_distrib_idxs(self._num_par_doe,
-                                                         len(run_list))
-            jobs = [run_list[o:o+s] for o, s in zip(run_offsets, run_sizes)]
+        run_sizes, run_offsets = evenly_distrib_idxs(self._num_par_doe,
+                                                     self.num_samples)
+        start = run_offsets[self._par_doe_id]
+        stop = start + run_sizes[self._par_doe_id]
+        if trace: debug('Number of DOE jobs: %s' % (stop - start))
 
-            job_list = [jobs[i] for i in doe_ids]
+        for case in self._iter_cases(start, stop):
+            yield case
 
-        if trace: debug("scattering job_list: %s" % job_list)
-        run_list = comm.scatter(job_list, root=0)
-        if trace: debug('Number of DOE jobs: %s (scatter DONE)' % len(run_list))
+    def _init_lhc(self, lhc_seed):
+        """Generates the latin hypercube, and the seed of the random values
+        within its buckets.
+        """
+        design_vars = self.get_desvar_metadata()
 
-        for case in run_list:
-            yield case
+        # Add up sizes
+        self.num_design_vars = sum(meta['size'] for meta in itervalues(design_vars))
+
+        # A generator of our own, so the global ones are left alone.
+        rng = np.random.RandomState(lhc_seed)
+
+        # Generate an LHC of the proper size
+        self._lhc = self._get_lhc(rng)
+        self._bucket_seed = rng.randint(2**31 - 1)
+
+    def _num_cases(self):
+        return self.num_samples
 
-    def _get_lhc(self):
+    def _get_case_block(self, idxs):
+        """Returns random values in the buckets of the latin hypercube rows
+        with the given indices. The values of a row only depend on its index,
+        so any rank can generate any block of them.
+        """
+        sizes, lows, highs = self._get_desvar_bounds()
+        dims = len(lows)
+
+        # The random numbers come from a separate stream for each group of
+        # _BUCKET_BLOCK rows.
+        rand = np.empty((len(idxs), dims))
+        groups = idxs // _BUCKET_BLOCK
+        for group in np.unique(groups):
+            mask = groups == group
+            stream = np.random.RandomState([self._bucket_seed, group])
+            rand[mask] = stream.uniform(size=(_BUCKET_BLOCK, dims))[idxs[mask] % _BUCKET_BLOCK]
+
+        width = (highs - lows) / self.num_samples
+        vals = lows + (self._lhc[idxs] + rand) * width
+
+        return self._split_desvars(sizes, vals)
+
+    def _get_lhc(self, rng):
         """Generates a Latin Hypercube based on the number of samples and the
-        number of design variables.
+        number of design variables, using the random generator `rng`.
         """
 
-        rand_lhc = _rand_latin_hypercube(self.num_samples, self.num_design_vars)
+        rand_lhc = _rand_latin_hypercube(self.num_samples, self.num_design_vars,
+                                         rng)
         return rand_lhc.astype(int)
 
-    def _get_buckets(self, low, high):
-        """Determines the distribution of samples."""
-        bucket_walls = np.linspace(low, high, self.num_samples + 1)
-        return list(zip(bucket_walls[0:-1], bucket_walls[1:]))
-
 
 class OptimizedLatinHypercubeDriver(LatinHypercubeDriver):
     """Design-of-experiments Driver implementing the Morris-Mitchell method for
@@ -155,17 +147,20 @@ class OptimizedLatinHypercubeDriver(LatinHypercubeDriver):
         self.generations = generations
         self.norm_method = norm_method
 
-    def _get_lhc(self):
-        """Generate an Optimized Latin Hypercube
+    def _get_lhc(self, rng):
+        """Generate an Optimized Latin Hypercube, using the random generator
+        `rng`.
         """
 
-        rand_lhc = _rand_latin_hypercube(self.num_samples, self.num_design_vars)
+        rand_lhc = _rand_latin_hypercube(self.num_samples, self.num_design_vars,
+                                         rng)
 
         # Optimize our LHC before returning it
         best_lhc = _LHC_Individual(rand_lhc, q=1, p=self.norm_method)
         for q in self.qs:
             lhc_start = _LHC_Individual(rand_lhc, q, self.norm_method)
-            lhc_opt = _mmlhs(lhc_start, self.population, self.generations)
+            lhc_opt = _mmlhs(lhc_start, self.population, self.generations,
+                             rng)
             if lhc_opt.mmphi() < best_lhc.mmphi():
                 best_lhc = lhc_opt
 
@@ -217,22 +212,23 @@ class _LHC_Individual(object):
 
         return self.phi
 
-    def perturb(self, mutation_count):
+    def perturb(self, mutation_count, rng):
         """ Interchanges pairs of randomly chosen elements within randomly chosen
         columns of a DOE a number of times. The result of this operation will also
-        be a Latin hypercube.
+        be a Latin hypercube. The choices are made with the random generator
+        `rng`.
         """
 
         new_doe = self.doe.copy()
         n, k = self.doe.shape
         for count in range(mutation_count):
-            col = randint(0, k - 1)
+            col = rng.randint(k)
 
             # Choosing two distinct random points
-            el1 = randint(0, n - 1)
-            el2 = randint(0, n - 1)
+            el1 = rng.randint(n)
+            el2 = rng.randint(n)
             while el1 == el2:
-                el2 = randint(0, n - 1)
+                el2 = rng.randint(n)
 
             new_doe[el1, col] = self.doe[el2, col]
             new_doe[el2, col] = self.doe[el1, col]
@@ -259,14 +255,12 @@ class _LHC_Individual(object):
         return self.doe
 
 
-def _rand_latin_hypercube(n, k):
+def _rand_latin_hypercube(n, k, rng):
     # Calculates a random Latin hypercube set of n points in k dimensions
-    # within [0,n-1]^k hypercube.
+    # within [0,n-1]^k hypercube, using the random generator rng.
     arr = np.zeros((n, k))
-    row = list(range(0, n))
     for i in range(k):
-        shuffle(row)
-        arr[:, i] = row
+        arr[:, i] = rng.permutation(n)
     return arr
 
 
@@ -284,9 +278,10 @@ def _is_latin_hypercube(lh):
     return True
 
 
-def _mmlhs(x_start, population, generations):
-    """Evolutionary search for most space filling Latin-Hypercube.
-    Returns a new LatinHypercube instance with an optimized set of points.
+def _mmlhs(x_start, population, generations, rng):
+    """Evolutionary search for most space filling Latin-Hypercube, using the
+    random generator `rng`. Returns a new LatinHypercube instance with an
+    optimized set of points.
     """
 
     x_best = x_start
@@ -304,7 +299,7 @@ def _mmlhs(x_start, population, generations):
         phi_improved = phi_best
 
         for offspring in range(population):
-            x_try = x_best.perturb(mutations)
+            x_try = x_best.perturb(mutations, rng)
             phi_try = x_try.mmphi()
 
             if phi_try < phi_improved:
@@ -8,7 +8,8 @@ import sys
 import os
 import traceback
 import logging
-from itertools import chain
+from itertools import chain, islice
+from collections import OrderedDict
 from six.moves import zip
 from six import next, PY3, iteritems, string_types
 
@@ -26,9 +27,12 @@ from openmdao.recorders.inmem_recorder import InMemoryRecorder
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
-def worker(problem, response_vars, case_queue, response_queue, worker_id): # pragma: no cover
-    """This is used to run parallel DOEs using multprocessing. It takes a case
-    off of the case_queue, runs it, then puts responses on the response_queue.
+def worker(problem, numeric_vars, obj_vars, case_queue, response_queue,
+           worker_id, buf, chunk_size, width): # pragma: no cover
+    """This is used to run parallel DOEs using multprocessing. It takes a
+    chunk of cases off of the case_queue and runs them. The numeric responses
+    of each case are written to a row of the shared buffer, then the metadata
+    and the other responses are put on the response_queue.
     """
     # set env var so comps/recorders know they're running in a worker proc
     os.environ['OPENMDAO_WORKER_ID'] = str(worker_id)
@@ -43,40 +47,115 @@ def worker(problem, response_vars, case_queue, response_queue, worker_id): # pra
         driver = problem.driver
         root = driver.root
 
-        terminate = 0
-        for case_id, case in iter(case_queue.get, 'STOP'):
-            #logging.info("worker %d, case id %d, case %s" % (worker_id, case_id, case))
+        values = numpy.frombuffer(buf)[:chunk_size*width].reshape(chunk_size,
+                                                                  width)
 
-            if terminate:
-                continue
+        for chunk in iter(case_queue.get, 'STOP'):
+            results = []
+            for case_id, case in chunk:
+                #logging.info("worker %d, case id %d, case %s" % (worker_id, case_id, case))
 
-            metadata = driver._prep_case(case, case_id)
+                metadata = driver._prep_case(case, case_id)
+                objs = []
 
-            try:
-                terminate, exc = driver._try_case(root, metadata)
-                if terminate:
-                    complete_case = (metadata, [])
-                else:
-                    complete_case = (metadata,
-                             [_get_root_var(root, n) for n in response_vars])
-            except:
-                # we generally shouldn't get here, but just in case,
-                # handle it so that the main process doesn't hang at the
-                # end when it tries to join all of the concurrent processes.
-                if metadata.get('msg'):
-                    metadata['msg'] += "\n\n%s" % traceback.format_exc()
-                else:
-                    metadata['msg'] = traceback.format_exc()
-                metadata['success'] = 0
-                metadata['terminate'] = 1
-                complete_case = (metadata, [])
+                try:
+                    terminate, exc = driver._try_case(root, metadata)
+                    if not terminate:
+                        row = values[len(results)]
+                        for name, start, end in numeric_vars:
+                            row[start:end] = numpy.ravel(_get_root_var(root, name))
+                        objs = [_get_root_var(root, n) for n in obj_vars]
+                except:
+                    # we generally shouldn't get here, but just in case,
+                    # handle it so that the main process doesn't hang at the
+                    # end when it tries to join all of the concurrent processes.
+                    if metadata.get('msg'):
+                        metadata['msg'] += "\n\n%s" % traceback.format_exc()
+                    else:
+                        metadata['msg'] = traceback.format_exc()
+                    metadata['success'] = 0
+                    metadata['terminate'] = 1
+                    objs = []
+
+                metadata['id'] = case_id
+                results.append((metadata, objs))
 
-            metadata['id'] = case_id
-            response_queue.put(complete_case)
+                # don't run the rest of the chunk after a fatal error
+                if metadata['terminate']:
+                    break
+
+            response_queue.put((worker_id, results))
     except:
         logging.error(traceback.format_exc())
         raise
 
+
+class _WorkerPool(object):
+    """
+    Worker processes for a load balanced DOE run with multiprocessing. Each
+    worker has its own case queue, so that a new chunk of cases is only sent
+    to a worker after its results have been read, and a shared memory buffer
+    that it writes the numeric responses of its chunk into.
+    """
+
+    def __init__(self, problem, num_procs, chunk_size, numeric_vars, obj_vars,
+                 width, daemon=False):
+        self.key = (num_procs, chunk_size, tuple(numeric_vars),
+                    tuple(obj_vars))
+
+        # Create queues
+        if sys.platform == 'win32':
+            self._manager = multiprocessing.Manager()
+            self.case_queues = [self._manager.Queue() for i in range(num_procs)]
+            self.done_queue = self._manager.Queue()
+        else:
+            self._manager = None
+            self.case_queues = [multiprocessing.Queue() for i in range(num_procs)]
+            self.done_queue = multiprocessing.Queue()
+
+        self._bufs = [multiprocessing.RawArray('d', max(chunk_size*width, 1))
+                      for i in range(num_procs)]
+        self.values = [numpy.frombuffer(buf)[:chunk_size*width].reshape(chunk_size,
+                                                                        width)
+                       for buf in self._bufs]
+
+        # Start worker processes
+        ranges = [(n, start, end) for n, start, end, shape in numeric_vars]
+        self.procs = []
+        for i in range(num_procs):
+            proc = multiprocessing.Process(target=worker,
+                                           args=(problem, ranges, obj_vars,
+                                                 self.case_queues[i],
+                                                 self.done_queue, i,
+                                                 self._bufs[i], chunk_size,
+                                                 width))
+            proc.daemon = daemon
+            self.procs.append(proc)
+
+        for proc in self.procs:
+            proc.start()
+
+    def is_alive(self):
+        """
+        Returns
+        -------
+        bool
+            True if all of the worker processes are still running.
+        """
+        return all(proc.is_alive() for proc in self.procs)
+
+    def shutdown(self):
+        """Tells all workers we're done and waits for them to exit."""
+        for queue in self.case_queues:
+            queue.put('STOP')
+
+        for proc in self.procs:
+            proc.join()
+
+        if self._manager is not None:
+            self._manager.shutdown()
+
+
 class PredeterminedRunsDriver(Driver):
     """
     Baseclass for design-of-experiments Drivers that have pre-determined
@@ -92,6 +171,22 @@ class PredeterminedRunsDriver(Driver):
         cases among all of the other ranks. Default is False.  If
         multiprocessing is being used instead of MPI, then cases are always
         load balanced.
+
+    Options
+    -------
+    options['auto_add_response'] :  bool(False)
+        If True, all design vars, objectives and constraints are automatically
+        added as responses.
+    options['block_size'] :  int(1024)
+        Number of cases generated at a time by drivers that can generate
+        their cases by index.
+    options['chunk_size'] :  int(1)
+        Number of cases sent to a multiprocessing worker at a time.
+    options['keep_workers'] :  bool(False)
+        If True, the multiprocessing workers are kept running between calls
+        to run() and are only stopped by cleanup(). They keep the model as it
+        was when they were started, so only the design variables should
+        change between runs.
     """
 
     def __init__(self, num_par_doe=1, load_balance=False):
@@ -102,12 +197,39 @@ class PredeterminedRunsDriver(Driver):
         self.options.add_option('auto_add_response', False,
                        desc="If True, all design vars, objectives and "
                             "constraints are automatically added as responses.")
+        self.options.add_option('block_size', 1024, lower=1,
+                       desc="Number of cases generated at a time by drivers "
+                            "that can generate their cases by index.")
+        self.options.add_option('chunk_size', 1, lower=1,
+                       desc="Number of cases sent to a multiprocessing worker "
+                            "at a time.")
+        self.options.add_option('keep_workers', False,
+                       desc="If True, the multiprocessing workers are kept "
+                            "running between calls to run() and are only "
+                            "stopped by cleanup(). They keep the model as it "
+                            "was when they were started, so only the design "
+                            "variables should change between runs.")
 
         self._num_par_doe = int(num_par_doe)
         self._par_doe_id = 0
         self._load_balance = load_balance
         self._respvars = []
         self._resp_recorder = None
+        self._pool = None
+
+    def __getstate__(self):
+        """ Worker processes can't be pickled, so they are left behind."""
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        return state
+
+    def cleanup(self):
+        """ Stops any multiprocessing workers and cleans up resources prior
+        to exit."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        super(PredeterminedRunsDriver, self).cleanup()
 
     def _setup_communicators(self, comm, parent_dir):
         """
@@ -455,7 +577,7 @@ class PredeterminedRunsDriver(Driver):
         metadata['terminate'] = 0
 
         try:
-            root.solve_nonlinear(metadata=metadata)
+            self._solve_model(metadata)
         except AnalysisError:
             metadata['msg'] = traceback.format_exc()
             metadata['success'] = 0
@@ -563,10 +685,57 @@ class PredeterminedRunsDriver(Driver):
                   'meta': meta
                }
 
+    def _response_layout(self, root, response_vars):
+        """
+        Splits the response variables into the float valued ones, which are
+        returned from a multiproc run in shared memory, and the rest, which
+        are pickled.
+
+        Returns
+        -------
+        tuple
+            List of (name, start, end, shape) of the float variables, with
+            shape None for scalars, the list of the other names, and the
+            number of floats per case.
+        """
+        numeric_vars = []
+        obj_vars = []
+        width = 0
+
+        for name in response_vars:
+            if name in root.unknowns:
+                meta = root.unknowns.metadata(name)
+            elif name in root.params:
+                meta = root.params.metadata(name)
+            else:
+                meta = {}
+
+            val = _get_root_var(root, name)
+            if meta.get('pass_by_obj'):
+                obj_vars.append(name)
+            elif isinstance(val, float):
+                numeric_vars.append((name, width, width + 1, None))
+                width += 1
+            elif isinstance(val, numpy.ndarray) and val.dtype == float:
+                numeric_vars.append((name, width, width + val.size, val.shape))
+                width += val.size
+            else:
+                obj_vars.append(name)
+
+        return numeric_vars, obj_vars, width
+
+    def _next_chunk(self, runiter, iter_count):
+        """Returns a list of up to chunk_size (case_id, case) tuples."""
+        chunk = []
+        for case in islice(runiter, self.options['chunk_size']):
+            # case is a generator, so must make a list to send
+            chunk.append((iter_count + len(chunk), list(case)))
+        return chunk
+
     def _run_lb_multiproc(self, problem):
         """This runs the DOE in parallel with load balancing via
-        multiprocessing.  A new case is distributed to a worker process as
-        soon as it finishes its previous case.
+        multiprocessing.  A new chunk of cases is distributed to a worker
+        process as soon as it finishes its previous chunk.
         """
         root = problem.root
 
@@ -575,78 +744,158 @@ class PredeterminedRunsDriver(Driver):
         response_vars = uvars + pvars
         numuvars = len(uvars)
 
-        runiter = self._build_runlist()
+        numeric_vars, obj_vars, width = self._response_layout(root,
+                                                              response_vars)
+        chunk_size = self.options['chunk_size']
+        keep_workers = self.options['keep_workers']
+
+        pool = self._pool
+        self._pool = None
+        if pool is not None:
+            key = (self._num_par_doe, chunk_size, tuple(numeric_vars),
+                   tuple(obj_vars))
+            if pool.key != key or not pool.is_alive():
+                pool.shutdown()
+                pool = None
+
+        if pool is None:
+            pool = _WorkerPool(problem, self._num_par_doe, chunk_size,
+                               numeric_vars, obj_vars, width,
+                               daemon=keep_workers)
 
-        # Create queues
-        if sys.platform == 'win32':
-            manager = multiprocessing.Manager()
-            task_queue = manager.Queue()
-            done_queue = manager.Queue()
-        else:
-            task_queue = multiprocessing.Queue()
-            done_queue = multiprocessing.Queue()
+        runiter = self._build_runlist()
 
-        procs = []
+        iter_count = 0
+        num_active = 0
         terminating = False
 
-        # Start worker processes
-        for i in range(self._num_par_doe):
-            procs.append(multiprocessing.Process(target=worker,
-                                                 args=(problem, response_vars,
-                                                 task_queue, done_queue, i)))
-
-        for proc in procs:
-            proc.start()
+        for queue in pool.case_queues:
+            chunk = self._next_chunk(runiter, iter_count)
+            if not chunk:
+                break
+            queue.put(chunk)
+            iter_count += len(chunk)
+            num_active += 1
+
+        while num_active > 0:
+            worker_id, results = pool.done_queue.get()
+            num_active -= 1
+
+            # copy the rows out before the worker gets another chunk
+            rows = pool.values[worker_id][:len(results)].copy()
+
+            for row, (meta, objs) in zip(rows, results):
+                #logging.info("RECEIVED: %d" % meta['id'])
+                values = {}
+                if not meta['terminate']:
+                    for name, start, end, shape in numeric_vars:
+                        if shape is None:
+                            values[name] = float(row[start])
+                        else:
+                            values[name] = row[start:end].reshape(shape)
+                    values.update(zip(obj_vars, objs))
+                values = [values[n] for n in response_vars if n in values]
+
+                complete_case = self._build_case(meta, uvars, pvars,
+                                                 numuvars, values)
+                if complete_case is None:
+                    # there was a fatal error, don't run more cases
+                    terminating = True
+                    continue
+
+                self.recorders.record_completed_case(root, complete_case)
+
+            if not terminating:
+                chunk = self._next_chunk(runiter, iter_count)
+                if chunk:
+                    pool.case_queues[worker_id].put(chunk)
+                    iter_count += len(chunk)
+                    num_active += 1
 
-        iter_count = 0
-        num_active = 0
-        empty = {}
-        try:
-            for proc in procs:
-                # case is a generator, so must make a list to send
-                case = list(next(runiter))
-                task_queue.put((iter_count, case))
-                iter_count += 1
-                num_active += 1
-        except StopIteration:
-            pass
+        # a worker that had a fatal error can't be trusted with another run
+        if keep_workers and not terminating:
+            self._pool = pool
         else:
-            try:
-                while num_active > 0:
-                    meta, values = done_queue.get()
-                    #logging.info("RECEIVED: %d, %s" % (meta['id'], values[2]))
-                    complete_case = self._build_case(meta, uvars, pvars,
-                                                     numuvars, values)
-                    num_active -= 1
-                    if complete_case is None:
-                        # there was a fatal error, don't run more cases
-                        break
+            pool.shutdown()
 
-                    self.recorders.record_completed_case(root, complete_case)
-                    case = list(next(runiter))
-                    task_queue.put((iter_count, case))
-                    iter_count += 1
-                    num_active += 1
-            except StopIteration:
-                pass
+    def _num_cases(self):
+        """
+        Returns
+        -------
+        int or None
+            The number of cases, or None if this driver can't generate its
+            cases by index. Drivers that return a number must also
+            implement _get_case_block.
+        """
+        return None
 
-        # tell all workers we're done
-        for proc in procs:
-            task_queue.put('STOP')
+    def _get_case_block(self, idxs):
+        """
+        Generates the design variable values of the cases with the given
+        indices.
 
-        for i in range(num_active):
-            meta, values = done_queue.get()
-            #logging.info("RECEIVED: %d, %s" % (meta['id'], values[0]))
-            complete_case = self._build_case(meta, uvars, pvars,
-                                             numuvars, values)
-            if complete_case is None:
-                # had a fatal error, don't record
-                continue
+        Args
+        ----
+        idxs : ndarray
+            Indices of the cases.
 
-            self.recorders.record_completed_case(root, complete_case)
+        Returns
+        -------
+        OrderedDict
+            An array of shape (len(idxs), size) for each design variable.
+        """
+        raise NotImplementedError("_get_case_block")
 
-        for proc in procs:
-            proc.join()
+    def _iter_cases(self, start, stop, step=1):
+        """
+        Returns an iterator over the cases with indices in range(start, stop,
+        step), generated in blocks of 'block_size' cases so that the full
+        runlist is never built.
+        """
+        block_size = self.options['block_size']
+
+        for bstart in range(start, stop, block_size*step):
+            idxs = numpy.arange(bstart, min(bstart + block_size*step, stop),
+                                step)
+            block = self._get_case_block(idxs)
+            names = list(block)
+            for i in range(len(idxs)):
+                yield zip(names, [block[name][i] for name in names])
+
+    def _get_desvar_bounds(self):
+        """
+        Returns
+        -------
+        tuple
+            The size of each design variable, and arrays of the lower and
+            upper bounds of all of their entries.
+        """
+        sizes = OrderedDict()
+        lows = []
+        highs = []
+        for name, meta in iteritems(self.get_desvar_metadata()):
+            size = meta['size']
+            sizes[name] = size
+            lows.append(numpy.broadcast_to(meta['lower'], (size,)))
+            highs.append(numpy.broadcast_to(meta['upper'], (size,)))
+
+        if not sizes:
+            return sizes, numpy.zeros(0), numpy.zeros(0)
+
+        return sizes, numpy.concatenate(lows).astype(float), \
+            numpy.concatenate(highs).astype(float)
+
+    def _split_desvars(self, sizes, vals):
+        """
+        Splits an array with a column per design variable entry into an
+        OrderedDict of arrays, one per design variable.
+        """
+        block = OrderedDict()
+        j = 0
+        for name, size in iteritems(sizes):
+            block[name] = vals[:, j:j+size]
+            j += size
+        return block
 
     def _get_case_w_nones(self, it):
         """A wrapper around a case generator that returns None cases if
@@ -682,10 +931,18 @@ class PredeterminedRunsDriver(Driver):
         Returns an iterator over only those cases meant to execute
         in the current rank as part of a parallel DOE. _build_runlist
         will be called on all ranks, but only those cases targeted to
-        this rank will run. Override this method
-        (see LatinHypercubeDriver) if your DOE generator needs to
-        create all cases on one rank and scatter them to other ranks.
+        this rank will run. Drivers that generate their cases by index only
+        generate the cases of this rank. Override this method
+        (see LatinHypercubeDriver) if your DOE generator needs a different
+        distribution of the cases.
         """
+        num_cases = self._num_cases()
+        if num_cases is not None:
+            for case in self._iter_cases(self._par_doe_id, num_cases,
+                                         self._num_par_doe):
+                yield case
+            return
+
         for i, case in enumerate(self._build_runlist()):
             if (i % self._num_par_doe) == self._par_doe_id:
                 yield case
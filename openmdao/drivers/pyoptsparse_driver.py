@@ -8,6 +8,7 @@ additional MPI capability.
 from __future__ import print_function
 
 import traceback
+from copy import deepcopy
 from six import iteritems
 from six.moves import range
 
@@ -17,6 +18,7 @@ import numpy as np
 from pyoptsparse import Optimization
 
 from openmdao.core.driver import Driver
+from openmdao.core.eval_cache import EvalCache
 from openmdao.core.system import AnalysisError
 from openmdao.util.record_util import create_local_meta, update_local_meta
 from collections import OrderedDict
@@ -64,6 +66,13 @@ class pyOptSparseDriver(Driver):
 
     Options
     -------
+    options['cache_gradients'] :  bool(True)
+        Set to True to also cache the gradients when 'cache_size' is
+        greater than zero.
+    options['cache_size'] :  int(0)
+        Number of design points whose objective and constraint values are
+        kept, so that the model isn't run again when the optimizer requests
+        a point it has already seen. Set to 0 to turn off the cache.
     options['exit_flag'] :  int(0)
         0 for fail, 1 for ok
     options['optimizer'] :  str('SLSQP')
@@ -102,6 +111,15 @@ class pyOptSparseDriver(Driver):
         self.options.add_option('gradient method', 'openmdao',
                                 values={'openmdao', 'pyopt_fd', 'snopt_fd'},
                                 desc='Finite difference implementation to use')
+        self.options.add_option('cache_size', 0, lower=0,
+                                desc='Number of design points whose objective '
+                                'and constraint values are kept, so that the '
+                                "model isn't run again when the optimizer "
+                                'requests a point it has already seen. Set to '
+                                '0 to turn off the cache.')
+        self.options.add_option('cache_gradients', True,
+                                desc='Set to True to also cache the gradients '
+                                "when 'cache_size' is greater than zero.")
 
         # The user places optimizer-specific settings in here.
         self.opt_settings = {}
@@ -124,6 +142,11 @@ class pyOptSparseDriver(Driver):
         self.sub_sparsity = OrderedDict()
         self.active_tols = {}
 
+        # Cache of the evaluated design points, and the point that the model
+        # was last run at.
+        self.eval_cache = None
+        self._model_x = None
+
     def _setup(self):
         self.supports['gradients'] = self.options['optimizer'] in grad_drivers
         if len(self._objs) > 1 and self.options['optimizer'] not in multi_obj_drivers:
@@ -155,7 +178,13 @@ class pyOptSparseDriver(Driver):
 
         # Initial Run
         with problem.root._dircontext:
-            problem.root.solve_nonlinear(metadata=self.metadata)
+            self._solve_model(self.metadata)
+
+        if self.options['cache_size'] > 0:
+            self.eval_cache = EvalCache(self.options['cache_size'])
+        else:
+            self.eval_cache = None
+        self._model_x = None
 
         opt_prob = Optimization(self.options['title'], self._objfunc)
 
@@ -336,7 +365,7 @@ class pyOptSparseDriver(Driver):
             self.set_desvar(name, val)
 
         with self.root._dircontext:
-            self.root.solve_nonlinear(metadata=self.metadata)
+            self._solve_model(self.metadata)
 
         # Save the most recent solution.
         self.pyopt_solution = sol
@@ -448,34 +477,18 @@ class pyOptSparseDriver(Driver):
         """
 
         fail = 0
-        metadata = self.metadata
-        system = self.root
-
-        try:
-            for name in self.indep_list:
-                self.set_desvar(name, dv_dict[name])
-
-            # Execute the model
-            #print("Setting DV")
-            #print(dv_dict)
 
-            self.iter_count += 1
-            update_local_meta(metadata, (self.iter_count,))
+        if self.eval_cache is not None:
+            func_dict = self.eval_cache.get(self._dv_array(dv_dict), 'funcs')
+            if func_dict is not None:
+                return deepcopy(func_dict), fail
 
-            try:
-                with self.root._dircontext:
-                    system.solve_nonlinear(metadata=metadata)
-
-            # Let the optimizer try to handle the error
-            except AnalysisError:
-                fail = 1
-
-            func_dict = self.get_objectives() # this returns a new OrderedDict
-            func_dict.update(self.get_constraints())
+        try:
+            func_dict, fail = self._run_model(dv_dict)
 
-            # Record after getting obj and constraint to assure they have
-            # been gathered in MPI.
-            self.recorders.record_iteration(system, metadata)
+            if self.eval_cache is not None and not fail:
+                self.eval_cache.set(self._model_x, 'funcs',
+                                    deepcopy(func_dict))
 
             # Get the double-sided constraint evaluations
             #for key, con in iteritems(self.get_2sided_constraints()):
@@ -495,6 +508,73 @@ class pyOptSparseDriver(Driver):
         #print(func_dict)
         return func_dict, fail
 
+    def _run_model(self, dv_dict):
+        """ Sets the design variables, runs the model and records the
+        iteration.
+
+        Args
+        ----
+        dv_dict : dict
+            Dictionary of design variable values.
+
+        Returns
+        -------
+        func_dict : dict
+            Dictionary of all functional variables evaluated at design point.
+
+        fail : int
+            0 for successful function evaluation
+            1 for unsuccessful function evaluation
+        """
+
+        fail = 0
+        metadata = self.metadata
+        system = self.root
+
+        for name in self.indep_list:
+            self.set_desvar(name, dv_dict[name])
+
+        self.iter_count += 1
+        update_local_meta(metadata, (self.iter_count,))
+
+        self._model_x = None
+        try:
+            with system._dircontext:
+                self._solve_model(metadata)
+
+        # Let the optimizer try to handle the error
+        except AnalysisError:
+            fail = 1
+
+        func_dict = self.get_objectives() # this returns a new OrderedDict
+        func_dict.update(self.get_constraints())
+
+        if not fail:
+            self._model_x = self._dv_array(dv_dict)
+
+        # Record after getting obj and constraint to assure they have
+        # been gathered in MPI.
+        self.recorders.record_iteration(system, metadata)
+
+        return func_dict, fail
+
+    def _dv_array(self, dv_dict):
+        """ Concatenates the design variables into the vector that keys the
+        evaluation cache.
+
+        Args
+        ----
+        dv_dict : dict
+            Dictionary of design variable values.
+
+        Returns
+        -------
+        ndarray
+            Flattened design variable values.
+        """
+        return np.concatenate([np.asarray(dv_dict[name], dtype=float).ravel()
+                               for name in self.indep_list])
+
     def _gradfunc(self, dv_dict, func_dict):
         """ Function that evaluates and returns the gradient of the objective
         function and constraints. This function is passed to pyOpt's
@@ -520,7 +600,20 @@ class pyOptSparseDriver(Driver):
 
         fail = 0
 
+        cache = self.eval_cache
+        if cache is not None:
+            x = self._dv_array(dv_dict)
+            if self.options['cache_gradients']:
+                sens_dict = cache.get(x, 'grad')
+                if sens_dict is not None:
+                    return deepcopy(sens_dict), fail
+
         try:
+            # A cache hit may have left the model at another point, so run it
+            # at the requested one. This bypasses the function cache.
+            if cache is not None and \
+               (self._model_x is None or not np.array_equal(x, self._model_x)):
+                self._run_model(dv_dict)
 
             # Assemble inactive constraints
             inactives = {}
@@ -585,6 +678,10 @@ class pyOptSparseDriver(Driver):
                     coo['coo'] = [np.array(row), np.array(col), np.array(data)]
                     sens_dict[con][desvar] = coo
 
+            if cache is not None and self.options['cache_gradients'] and \
+               not fail:
+                cache.set(x, 'grad', deepcopy(sens_dict))
+
         except Exception as msg:
             tb = traceback.format_exc()
 
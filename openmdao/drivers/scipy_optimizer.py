@@ -11,6 +11,7 @@ import numpy as np
 from scipy.optimize import minimize
 
 from openmdao.core.driver import Driver
+from openmdao.core.eval_cache import EvalCache
 from openmdao.util.record_util import create_local_meta, update_local_meta
 from collections import OrderedDict
 
@@ -40,6 +41,13 @@ class ScipyOptimizer(Driver):
 
     Options
     -------
+    options['cache_gradients'] :  bool(True)
+        Set to True to also cache the gradients when 'cache_size' is
+        greater than zero.
+    options['cache_size'] :  int(0)
+        Number of design points whose objective and constraint values are
+        kept, so that the model isn't run again when the optimizer requests
+        a point it has already seen. Set to 0 to turn off the cache.
     options['disp'] :  bool(True)
         Set to False to prevent printing of Scipy convergence messages
     options['maxiter'] : int(200)
@@ -73,6 +81,15 @@ class ScipyOptimizer(Driver):
         self.options.add_option('disp', True,
                                 desc='Set to False to prevent printing of Scipy '
                                 'convergence messages')
+        self.options.add_option('cache_size', 0, lower=0,
+                                desc='Number of design points whose objective '
+                                'and constraint values are kept, so that the '
+                                "model isn't run again when the optimizer "
+                                'requests a point it has already seen. Set to '
+                                '0 to turn off the cache.')
+        self.options.add_option('cache_gradients', True,
+                                desc='Set to True to also cache the gradients '
+                                "when 'cache_size' is greater than zero.")
 
         # The user places optimizer-specific settings in here.
         self.opt_settings = OrderedDict()
@@ -87,6 +104,19 @@ class ScipyOptimizer(Driver):
         self.cons = None
         self.objs = None
 
+        # Flattened constraint values, and for each constraint type the rows
+        # of them it uses with the sign and offset that make it a scipy
+        # constraint, sign*value + offset >= 0 (or == 0).
+        self._con_vec = None
+        self._con_rows = {}
+        self._con_sign = {}
+        self._con_offset = {}
+
+        # Cache of the evaluated design points, and the point that the model
+        # was last run at.
+        self.eval_cache = None
+        self._model_x = None
+
     def _setup(self):
         self.supports['gradients'] = self.options['optimizer'] in _gradient_optimizers
         super(ScipyOptimizer, self)._setup()
@@ -108,7 +138,7 @@ class ScipyOptimizer(Driver):
 
         # Initial Run
         with problem.root._dircontext:
-            problem.root.solve_nonlinear(metadata=self.metadata)
+            self._solve_model(self.metadata)
 
         pmeta = self.get_desvar_metadata()
         self.params = list(pmeta)
@@ -116,6 +146,7 @@ class ScipyOptimizer(Driver):
         con_meta = self.get_constraint_metadata()
         self.cons = list(con_meta)
         self.con_cache = self.get_constraints()
+        self._con_vec = self._flatten_cons(self.con_cache)
 
         self.opt_settings['maxiter'] = self.options['maxiter']
         self.opt_settings['disp'] = self.options['disp']
@@ -157,38 +188,62 @@ class ScipyOptimizer(Driver):
 
                     bounds.append((p_low, p_high))
 
-        # Constraints
+        self._model_x = x_init.copy()
+        if self.options['cache_size'] > 0:
+            self.eval_cache = EvalCache(self.options['cache_size'])
+            self._cache_funcs(x_init, self.get_objectives())
+        else:
+            self.eval_cache = None
+
+        # Constraints. All equality constraints and all inequality
+        # constraints are each given to scipy as one vector valued function,
+        # so each evaluation is a single numpy expression.
         constraints = []
         i = 0
         if opt in _constraint_optimizers:
+            rows = {'eq': [], 'ineq': []}
+            sign = {'eq': [], 'ineq': []}
+            offset = {'eq': [], 'ineq': []}
+
+            def add(kind, idxs, sgn, bound):
+                rows[kind].append(idxs)
+                sign[kind].append(np.full(len(idxs), sgn))
+                offset[kind].append(-sgn*np.broadcast_to(bound, idxs.shape))
+
             for name, meta in con_meta.items():
                 size = meta['size']
-                dblcon = meta['upper'] is not None and meta['lower'] is not None
-                for j in range(0, size):
-                    con_dict = OrderedDict()
-                    if meta['equals'] is not None:
-                        con_dict['type'] = 'eq'
-                    else:
-                        con_dict['type'] = 'ineq'
-                    con_dict['fun'] = self._confunc
-                    if opt in _constraint_grad_optimizers:
-                        con_dict['jac'] = self._congradfunc
-                    con_dict['args'] = [name, j]
-                    constraints.append(con_dict)
+                idxs = np.arange(i, i+size)
                 self.con_idx[name] = i
                 i += size
 
-                # Add extra constraint if double-sided
-                if dblcon:
-                    name = '2bl-' + name
-                    for j in range(0, size):
-                        con_dict = OrderedDict()
-                        con_dict['type'] = 'ineq'
-                        con_dict['fun'] = self._confunc
-                        if opt in _constraint_grad_optimizers:
-                            con_dict['jac'] = self._congradfunc
-                        con_dict['args'] = [name, j]
-                        constraints.append(con_dict)
+                # Note, scipy defines constraints to be satisfied when
+                # positive, which is the opposite of OpenMDAO.
+                if meta['equals'] is not None:
+                    add('eq', idxs, -1.0, meta['equals'])
+                elif meta['lower'] is None:
+                    add('ineq', idxs, -1.0, meta['upper'])
+                else:
+                    add('ineq', idxs, 1.0, meta['lower'])
+
+                    # Add extra constraint if double-sided
+                    if meta['upper'] is not None:
+                        add('ineq', idxs, -1.0, meta['upper'])
+
+            for kind in ('eq', 'ineq'):
+                if not rows[kind]:
+                    continue
+
+                self._con_rows[kind] = np.concatenate(rows[kind])
+                self._con_sign[kind] = np.concatenate(sign[kind])
+                self._con_offset[kind] = np.concatenate(offset[kind])
+
+                con_dict = OrderedDict()
+                con_dict['type'] = kind
+                con_dict['fun'] = self._confunc
+                if opt in _constraint_grad_optimizers:
+                    con_dict['jac'] = self._congradfunc
+                con_dict['args'] = [kind]
+                constraints.append(con_dict)
 
         # Provide gradients for optimizers that support it
         if opt in _gradient_optimizers:
@@ -210,6 +265,12 @@ class ScipyOptimizer(Driver):
                           #callback=None,
                           options=self.opt_settings)
 
+        # The last point that was evaluated, or the last one that missed the
+        # cache, isn't always the final point, so make sure that the model is
+        # left there.
+        if not np.array_equal(result.x, self._model_x):
+            self._run_model(result.x)
+
         self._problem = None
         self.result = result
         self.exit_flag = 1 if self.result.success else 0
@@ -220,7 +281,7 @@ class ScipyOptimizer(Driver):
 
     def _objfunc(self, x_new):
         """ Function that evaluates and returns the objective function. Model
-        is executed here.
+        is executed here, unless the point is in the cache.
 
         Args
         ----
@@ -232,6 +293,42 @@ class ScipyOptimizer(Driver):
         float
             Value of the objective function evaluated at the new design point.
         """
+        if self.eval_cache is not None:
+            funcs = self.eval_cache.get(x_new, 'funcs')
+            if funcs is not None:
+                f_new, self.con_cache, self._con_vec = funcs
+                return f_new
+
+        objs = self._run_model(x_new)
+
+        if self.eval_cache is not None:
+            return self._cache_funcs(x_new, objs)
+
+        # Get the objective function evaluations
+        for name, obj in objs.items():
+            f_new = obj
+            break
+
+        #print("Functions calculated")
+        #print(x_new)
+        #print(f_new)
+
+        return f_new
+
+    def _run_model(self, x_new):
+        """ Sets the design variables, runs the model and records the
+        iteration.
+
+        Args
+        ----
+        x_new : ndarray
+            Array containing parameter values at new design point.
+
+        Returns
+        -------
+        dict
+            Values of the objectives.
+        """
 
         system = self.root
         metadata = self.metadata
@@ -247,73 +344,85 @@ class ScipyOptimizer(Driver):
         update_local_meta(metadata, (self.iter_count,))
 
         with system._dircontext:
-            system.solve_nonlinear(metadata=metadata)
+            self._solve_model(metadata)
 
-        # Get the objective function evaluations
-        for name, obj in self.get_objectives().items():
-            f_new = obj
-            break
+        self._model_x = np.array(x_new)
 
+        objs = self.get_objectives()
         self.con_cache = self.get_constraints()
+        self._con_vec = self._flatten_cons(self.con_cache)
 
         # Record after getting obj and constraints to assure it has been
         # gathered in MPI.
         self.recorders.record_iteration(system, metadata)
 
-        #print("Functions calculated")
-        #print(x_new)
-        #print(f_new)
+        return objs
+
+    def _cache_funcs(self, x_new, objs):
+        """ Stores copies of the objective and constraint values of a point
+        in the cache, since they may be views into the model's vectors.
 
+        Args
+        ----
+        x_new : ndarray
+            Array containing parameter values at the design point.
+
+        objs : dict
+            Values of the objectives.
+
+        Returns
+        -------
+        ndarray
+            Copy of the value of the objective function.
+        """
+        for name, obj in objs.items():
+            f_new = np.array(obj)
+            break
+
+        self.con_cache = OrderedDict((name, np.array(con)) for name, con in
+                                     iteritems(self.con_cache))
+        self.eval_cache.set(x_new, 'funcs',
+                            (f_new, self.con_cache, self._con_vec))
         return f_new
 
-    def _confunc(self, x_new, name, idx):
-        """ Function that returns the value of the constraint function
-        requested in args. Note that this function is called for each
-        constraint, so the model is only run when the objective is evaluated.
+    def _flatten_cons(self, cons):
+        """ Concatenates the values of all constraints, in the order of their
+        rows in the gradient.
+
+        Args
+        ----
+        cons : dict
+            Constraint values keyed on name.
+
+        Returns
+        -------
+        ndarray
+            Flattened constraint values.
+        """
+        if not self.cons:
+            return np.zeros(0)
+        return np.concatenate([np.asarray(cons[name], dtype=float).ravel()
+                               for name in self.cons])
+
+    def _confunc(self, x_new, kind):
+        """ Function that returns the values of all constraints of one
+        type. Note that this function is called after the objective, so the
+        model is only run when the objective is evaluated.
 
         Args
         ----
         x_new : ndarray
             Array containing parameter values at new design point.
-        name : string
-            Name of the constraint to be evaluated.
-        idx : float
-            Contains index into the constraint array.
+        kind : string
+            Constraint type, 'eq' or 'ineq'.
 
         Returns
         -------
-        float
-            Value of the constraint function.
+        ndarray
+            Values of the constraint functions.
         """
-
-        if name.startswith('2bl-'):
-            name = name[4:]
-            dbl_side = True
-        else:
-            dbl_side = False
-
-        cons = self.con_cache
-        meta = self._cons[name]
-
-        # Equality constraints
-        bound = meta['equals']
-        if bound is not None:
-            if isinstance(bound, np.ndarray):
-                bound = bound[idx]
-            return bound - cons[name][idx]
-
-        # Note, scipy defines constraints to be satisfied when positive,
-        # which is the opposite of OpenMDAO.
-        upper = meta['upper']
-        lower = meta['lower']
-        if lower is None or dbl_side:
-            if isinstance(upper, np.ndarray):
-                upper = upper[idx]
-            return upper - cons[name][idx]
-        else:
-            if isinstance(lower, np.ndarray):
-                lower = lower[idx]
-            return cons[name][idx] - lower
+        return self._con_sign[kind]*self._con_vec[self._con_rows[kind]] + \
+            self._con_offset[kind]
 
     def _gradfunc(self, x_new):
         """ Function that evaluates and returns the objective function.
@@ -329,58 +438,47 @@ class ScipyOptimizer(Driver):
         ndarray
             Gradient of objective with respect to parameter array.
         """
+        cache = self.eval_cache
+        if cache is not None and self.options['cache_gradients']:
+            grad = cache.get(x_new, 'grad')
+            if grad is not None:
+                self.grad_cache = grad
+                return grad[0, :]
+
+        # A cache hit may have left the model at another point.
+        if cache is not None and not np.array_equal(x_new, self._model_x):
+            self._run_model(x_new)
 
         grad = self.calc_gradient(self.params, self.objs+self.cons,
                                   return_format='array')
         self.grad_cache = grad
 
+        if cache is not None and self.options['cache_gradients']:
+            cache.set(x_new, 'grad', grad)
+
         #print("Gradients calculated")
         #print(x_new)
         #print(grad[0, :])
 
         return grad[0, :]
 
-    def _congradfunc(self, x_new, name, idx):
-        """ Function that returns the cached gradient of the constraint
-        function. Note, scipy calls the constraints one at a time, so the
-        gradient is cached when the objective gradient is called.
+    def _congradfunc(self, x_new, kind):
+        """ Function that returns the cached gradient of all constraints of
+        one type. The gradient is cached when the objective gradient is
+        called.
 
         Args
         ----
         x_new : ndarray
             Array containing parameter values at new design point.
-        name : string
-            Name of the constraint to be evaluated.
-        idx : float
-            Contains index into the constraint array.
+        kind : string
+            Constraint type, 'eq' or 'ineq'.
 
         Returns
         -------
-        float
-            Gradient of the constraint function wrt all params.
+        ndarray
+            Gradient of the constraint functions wrt all params.
         """
-
-        if name.startswith('2bl-'):
-            name = name[4:]
-            dbl_side = True
-        else:
-            dbl_side = False
-
-        grad = self.grad_cache
-        meta = self._cons[name]
-        grad_idx = self.con_idx[name] + idx + 1
-
-        #print("Constraint Gradient returned")
-        #print(x_new)
-        #print(name, idx, grad[grad_idx, :])
-
-        # Equality constraints
-        if meta['equals'] is not None:
-            return -grad[grad_idx, :]
-
-        # Note, scipy defines constraints to be satisfied when positive,
-        # which is the opposite of OpenMDAO.
-        if meta['lower'] is None or dbl_side:
-            return -grad[grad_idx, :]
-        else:
-            return grad[grad_idx, :]
+        # Row 0 of the gradient is the objective.
+        return self._con_sign[kind][:, np.newaxis] * \
+            self.grad_cache[self._con_rows[kind] + 1, :]
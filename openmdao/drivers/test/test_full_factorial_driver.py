@@ -1,6 +1,7 @@
 """Testing FullFactorialDriver"""
 
 import unittest
+import itertools
 from pprint import pformat
 from types import GeneratorType
 
@@ -52,6 +53,44 @@ class TestFullFactorial(unittest.TestCase):
                         "Incorrect inputs generated.")
         self.assertTrue((np.array([0.0]), np.array([1.0])) in inputs,
                         "Incorrect inputs generated.")
+    def test_case_blocks(self):
+
+        prob = Problem()
+        root = prob.root = Group()
+
+        root.add('p1', IndepVarComp('x', np.zeros(2)), promotes=['*'])
+        root.add('p2', IndepVarComp('y', 50.0), promotes=['*'])
+
+        prob.driver = FullFactorialDriver(3)
+        prob.driver.options['block_size'] = 5
+        prob.driver.add_desvar('x', lower=np.array([0.0, -1.0]),
+                               upper=np.array([1.0, 1.0]))
+        prob.driver.add_desvar('y', lower=10.0, upper=20.0)
+
+        prob.setup(check=False)
+        driver = prob.driver
+
+        # Same order as the product of the levels, last entry fastest.
+        levels = [np.linspace(0.0, 1.0, 3), np.linspace(-1.0, 1.0, 3),
+                  np.linspace(10.0, 20.0, 3)]
+        expected = np.array(list(itertools.product(*levels)))
+
+        cases = [dict(case) for case in driver._build_runlist()]
+        self.assertEqual(len(cases), 27)
+        vals = np.array([np.concatenate([case['x'], case['y']]) for case in cases])
+        np.testing.assert_array_equal(vals, expected)
+
+        block = driver._get_case_block(np.array([26, 4]))
+        np.testing.assert_array_equal(block['x'], expected[[26, 4], :2])
+        np.testing.assert_array_equal(block['y'], expected[[26, 4], 2:])
+
+        # Each parallel DOE only generates its own cases.
+        driver._num_par_doe = 4
+        for i in range(4):
+            driver._par_doe_id = i
+            cases = [dict(case) for case in driver._distrib_build_runlist()]
+            vals = np.array([np.concatenate([case['x'], case['y']]) for case in cases])
+            np.testing.assert_array_equal(vals, expected[i::4])
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,7 @@
 """ Testing driver LatinHypercubeDriver."""
 
+import random
 import unittest
-from random import seed
 from types import GeneratorType
 
 import numpy as np
@@ -23,12 +23,11 @@ class TestLatinHypercubeDriver(unittest.TestCase):
     def seed(self):
         # seedval = None
         self.seedval = 1
-        seed(self.seedval)
-        np.random.seed(self.seedval)
+        self.rng = np.random.RandomState(self.seedval)
 
     def test_rand_latin_hypercube(self):
         for n, k in self.hypercube_sizes:
-            test_lhc = _rand_latin_hypercube(n, k)
+            test_lhc = _rand_latin_hypercube(n, k, self.rng)
 
             self.assertTrue(_is_latin_hypercube(test_lhc))
 
@@ -37,12 +36,12 @@ class TestLatinHypercubeDriver(unittest.TestCase):
         population = 3
         generations = 6
 
-        test_lhc = _rand_latin_hypercube(n, k)
+        test_lhc = _rand_latin_hypercube(n, k, self.rng)
         best_lhc = _LHC_Individual(test_lhc, 1, p)
         mmphi_initial = best_lhc.mmphi()
         for q in (1, 2, 5, 10, 20, 50, 100):
             lhc_start = _LHC_Individual(test_lhc, q, p)
-            lhc_opt = _mmlhs(lhc_start, population, generations)
+            lhc_opt = _mmlhs(lhc_start, population, generations, self.rng)
             if lhc_opt.mmphi() < best_lhc.mmphi():
                 best_lhc = lhc_opt
 
@@ -167,6 +166,80 @@ class TestLatinHypercubeDriver(unittest.TestCase):
                 len(yDict) == 100,
                 "One of the intervals wasn't covered.")
 
+    def test_case_blocks(self):
+
+        def sample(block_size, num_par_doe=1):
+            prob = Problem()
+            root = prob.root = Group()
+
+            root.add('p1', IndepVarComp('x', np.zeros(2)), promotes=['*'])
+            root.add('p2', IndepVarComp('y', 50.0), promotes=['*'])
+
+            prob.driver = LatinHypercubeDriver(600, seed=3)
+            prob.driver.options['block_size'] = block_size
+            prob.driver.add_desvar('x', lower=np.array([0.0, -1.0]), upper=1.0)
+            prob.driver.add_desvar('y', lower=-50.0, upper=50.0)
+
+            prob.setup(check=False)
+            driver = prob.driver
+
+            if num_par_doe == 1:
+                runlist = driver._build_runlist()
+                self.assertTrue(type(runlist) == GeneratorType)
+            else:
+                driver._num_par_doe = num_par_doe
+                runlist = []
+                for i in range(num_par_doe):
+                    driver._par_doe_id = i
+                    runlist.extend(list(driver._distrib_build_runlist()))
+
+            cases = [dict(case) for case in runlist]
+            return np.array([np.concatenate([case['x'], case['y']])
+                             for case in cases])
+
+        vals = sample(1024)
+        self.assertEqual(vals.shape, (600, 3))
+
+        # A single sample in each bucket of every variable.
+        lows = np.array([0.0, -1.0, -50.0])
+        widths = (np.array([1.0, 1.0, 50.0]) - lows) / 600
+        buckets = np.floor((vals - lows) / widths)
+        self.assertTrue(_is_latin_hypercube(buckets))
+
+        # The values don't depend on how the cases are generated.
+        np.testing.assert_array_equal(sample(7), vals)
+        np.testing.assert_array_equal(sample(100, num_par_doe=3), vals)
+
+    def test_global_random_state(self):
+
+        def sample(driver):
+            prob = Problem()
+            root = prob.root = Group()
+            root.add('p1', IndepVarComp('x', np.zeros(2)), promotes=['*'])
+
+            prob.driver = driver
+            prob.driver.add_desvar('x', lower=-1.0, upper=1.0)
+
+            prob.setup(check=False)
+            return np.array([dict(case)['x'] for case in driver._build_runlist()])
+
+        np_state = np.random.get_state()
+        py_state = random.getstate()
+
+        for driver_class in (LatinHypercubeDriver, OptimizedLatinHypercubeDriver):
+            vals = sample(driver_class(10, seed=5))
+
+            # The seed gives the same cases without touching the global
+            # random generators.
+            np.testing.assert_array_equal(sample(driver_class(10, seed=5)), vals)
+            self.assertFalse(np.array_equal(sample(driver_class(10, seed=6)), vals))
+
+        self.assertEqual(random.getstate(), py_state)
+        new_state = np.random.get_state()
+        self.assertEqual(new_state[0], np_state[0])
+        np.testing.assert_array_equal(new_state[1], np_state[1])
+        self.assertEqual(new_state[2:], np_state[2:])
+
     '''
     def test_seed_works(self):
     '''
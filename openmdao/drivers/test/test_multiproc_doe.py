@@ -1,8 +1,10 @@
 
 import unittest
 
+import numpy as np
+
 from openmdao.api import IndepVarComp, Component, Group, Problem, \
-                         FullFactorialDriver, AnalysisError
+                         FullFactorialDriver, AnalysisError, ExecComp
 from openmdao.test.exec_comp_for_test import ExecComp4Test
 
 class LBParallelDOETestCase6(unittest.TestCase):
@@ -141,6 +143,55 @@ class LBParallelDOETestCase6(unittest.TestCase):
             self.assertEqual(nfails[fail_rank], 1)
         else:
             self.assertEqual(nfails[fail_rank], 0)
+    def test_chunks_keep_workers(self):
+
+        problem = Problem()
+        root = problem.root = Group()
+        root.add('indep_var', IndepVarComp('x', val=1.0))
+        root.add('const', IndepVarComp('c', val=np.arange(3.0)))
+        root.add('mult', ExecComp("y=c*x", c=np.zeros(3), y=np.zeros(3)))
+
+        root.connect('indep_var.x', 'mult.x')
+        root.connect('const.c', 'mult.c')
+
+        num_levels = 25
+        problem.driver = FullFactorialDriver(num_levels=num_levels,
+                                             num_par_doe=3,
+                                             load_balance=True)
+        problem.driver.options['auto_add_response'] = True
+        problem.driver.options['chunk_size'] = 4
+        problem.driver.options['keep_workers'] = True
+        problem.driver.add_desvar('indep_var.x',
+                                  lower=1.0, upper=float(num_levels))
+        problem.driver.add_objective('mult.y')
+
+        problem.setup(check=False)
+
+        pids = None
+        for i in range(2):
+            problem.run()
+
+            xs = []
+            for responses, success, msg in problem.driver.get_responses():
+                responses = dict(responses)
+                self.assertTrue(success)
+                xs.append(responses['indep_var.x'])
+                np.testing.assert_array_equal(responses['mult.y'],
+                                              np.arange(3.0)*xs[-1])
+
+            self.assertEqual(sorted(xs), list(np.linspace(1.0, num_levels,
+                                                          num_levels)))
+
+            # the same workers are used for both runs
+            procs = problem.driver._pool.procs
+            if pids is None:
+                pids = [proc.pid for proc in procs]
+            self.assertEqual([proc.pid for proc in procs], pids)
+
+        problem.cleanup()
+        self.assertIsNone(problem.driver._pool)
+        for proc in procs:
+            self.assertFalse(proc.is_alive())
 
 if __name__ == '__main__':
     unittest.main()
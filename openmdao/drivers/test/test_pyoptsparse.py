@@ -1,18 +1,23 @@
 """ Testing pyoptsparse."""
 
 import os
+import sys
+import types
 import unittest
+from copy import deepcopy
 
 from six.moves import cStringIO
 
 import numpy as np
 
 from openmdao.api import IndepVarComp, Group, Problem, ExecComp, Component
+from openmdao.core.eval_cache import EvalCache
 from openmdao.core.system import AnalysisError
 from openmdao.test.paraboloid import Paraboloid
 from openmdao.test.simple_comps import SimpleArrayComp, ArrayComp2D
 from openmdao.test.util import assert_rel_error, ConcurrentTestCaseMixin, \
                                set_pyoptsparse_opt
+from openmdao.util.record_util import create_local_meta
 
 
 # check that pyoptsparse is installed
@@ -1765,5 +1770,75 @@ class TestPyoptSparse(unittest.TestCase, ConcurrentTestCaseMixin):
         driver_issues = checks['driver_issues']['active_tol']
         self.assertEqual(driver_issues, ['ci', 'cia'])
 
+class TestPyoptSparseCache(unittest.TestCase):
+    """ Tests of the evaluation cache that call the driver's callbacks
+    directly, so pyoptsparse doesn't need to be installed."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.stubbed = 'pyoptsparse' not in sys.modules and OPTIMIZER is None
+        if cls.stubbed:
+            stub = types.ModuleType('pyoptsparse')
+            stub.Optimization = None
+            sys.modules['pyoptsparse'] = stub
+
+        from openmdao.drivers.pyoptsparse_driver import pyOptSparseDriver
+        cls.driver_class = pyOptSparseDriver
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.stubbed:
+            del sys.modules['pyoptsparse']
+            del sys.modules['openmdao.drivers.pyoptsparse_driver']
+
+    def test_gradient_after_cache_hit(self):
+        prob = Problem()
+        root = prob.root = Group()
+
+        root.add('p1', IndepVarComp('x', 50.0), promotes=['*'])
+        root.add('p2', IndepVarComp('y', 50.0), promotes=['*'])
+        root.add('comp', Paraboloid(), promotes=['*'])
+
+        prob.driver = driver = self.driver_class()
+        driver.options['cache_size'] = 10
+        driver.add_desvar('x')
+        driver.add_desvar('y')
+        driver.add_objective('f_xy')
+
+        prob.setup(check=False)
+
+        # the state that run() sets up before handing over to pyoptsparse
+        driver._problem = prob
+        driver.metadata = create_local_meta(None, 'SLSQP')
+        driver.eval_cache = EvalCache(driver.options['cache_size'])
+        driver.indep_list = ['x', 'y']
+        driver.quantities = ['f_xy']
+        driver.sparsity = {'f_xy': driver.indep_list}
+
+        dv_a = {'x': np.array([1.0]), 'y': np.array([2.0])}
+        dv_b = {'x': np.array([3.0]), 'y': np.array([-1.0])}
+
+        # the values may be views into the model's vectors
+        func_a = deepcopy(driver._objfunc(dv_a)[0])
+        driver._objfunc(dv_b)
+
+        # a hit leaves the model at B
+        func, fail = driver._objfunc(dv_a)
+        self.assertEqual(driver.iter_count, 2)
+        assert_rel_error(self, func['f_xy'], func_a['f_xy'], 1e-10)
+
+        # so the gradient has to run the model at A again
+        sens, fail = driver._gradfunc(dv_a, func_a)
+        self.assertEqual(fail, 0)
+        self.assertEqual(driver.iter_count, 3)
+        assert_rel_error(self, sens['f_xy']['x'], -2.0, 1e-10)
+        assert_rel_error(self, sens['f_xy']['y'], 13.0, 1e-10)
+
+        # and the gradient at A is cached
+        sens, fail = driver._gradfunc(dv_a, func_a)
+        self.assertEqual(driver.iter_count, 3)
+        assert_rel_error(self, sens['f_xy']['x'], -2.0, 1e-10)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ import unittest
 import numpy as np
 
 from openmdao.api import IndepVarComp, Group, Problem, ScipyOptimizer, ExecComp
+from openmdao.drivers import scipy_optimizer
 from openmdao.test.paraboloid import Paraboloid
 from openmdao.test.sellar import SellarDerivatives, SellarStateConnection
 from openmdao.test.simple_comps import SimpleArrayComp, ArrayComp2D
@@ -600,6 +601,124 @@ class TestScipyOptimize(unittest.TestCase):
         # Minimum should be at (7.166667, -7.833334)
         assert_rel_error(self, prob['x'] - prob['y'], 11.0, 1e-6)
 
+    def _array_con_problem(self, optimizer):
+
+        prob = Problem()
+        root = prob.root = Group()
+
+        root.add('p', IndepVarComp('x', np.zeros(5)), promotes=['*'])
+        root.add('obj', ExecComp('f = sum((x - 3.0)**2)', x=np.zeros(5)),
+                 promotes=['*'])
+        root.add('con', ExecComp('c = 1.0*x', x=np.zeros(5), c=np.zeros(5)),
+                 promotes=['*'])
+        root.add('sum', ExecComp('s = sum(x)', x=np.zeros(5)), promotes=['*'])
+
+        prob.driver = ScipyOptimizer()
+        prob.driver.options['optimizer'] = optimizer
+        prob.driver.options['tol'] = 1.0e-9
+        prob.driver.options['disp'] = False
+        prob.driver.add_desvar('x', lower=-50.0, upper=50.0)
+        prob.driver.add_objective('f')
+        prob.driver.add_constraint('c', lower=-1.0,
+                                   upper=np.array([1.0, 2.0, 10.0, 10.0, 10.0]))
+        if optimizer == 'SLSQP':
+            prob.driver.add_constraint('s', equals=13.0)
+
+        prob.setup(check=False)
+        return prob
+
+    def test_array_constraints_vectorized_SLSQP(self):
+        prob = self._array_con_problem('SLSQP')
+        prob.run()
+
+        assert_rel_error(self, prob['x'], np.array([1.0, 2.0, 10.0/3.0,
+                                                    10.0/3.0, 10.0/3.0]), 1e-6)
+
+        # One scipy constraint per type, the double-sided one stacked twice.
+        driver = prob.driver
+        self.assertEqual(sorted(driver._con_rows.keys()), ['eq', 'ineq'])
+        self.assertEqual(driver.con_idx['c'], 0)
+        self.assertEqual(driver.con_idx['s'], 5)
+
+        x = prob['x']
+        assert_rel_error(self, driver._confunc(None, 'eq'),
+                         np.array([13.0 - np.sum(x)]), 1e-10)
+        assert_rel_error(self, driver._confunc(None, 'ineq'),
+                         np.concatenate([x + 1.0,
+                                         [1.0, 2.0, 10.0, 10.0, 10.0] - x]),
+                         1e-10)
+
+        # The constraints are linear, so the last cached gradient is exact.
+        jac = driver._congradfunc(None, 'ineq')
+        assert_rel_error(self, jac, np.vstack([np.eye(5), -np.eye(5)]), 1e-10)
+        assert_rel_error(self, driver._congradfunc(None, 'eq'),
+                         -np.ones((1, 5)), 1e-10)
+
+    def test_array_constraints_vectorized_COBYLA(self):
+        prob = self._array_con_problem('COBYLA')
+        prob.run()
+
+        assert_rel_error(self, prob['x'], np.array([1.0, 2.0, 3.0, 3.0, 3.0]),
+                         1e-5)
+        self.assertEqual(list(prob.driver._con_rows.keys()), ['ineq'])
+
+    def test_eval_cache(self):
+
+        results = []
+        for opt in ['SLSQP', 'COBYLA']:
+            for cache_size in [0, 10]:
+
+                prob = Problem()
+                root = prob.root = Group()
+
+                root.add('p1', IndepVarComp('x', 50.0), promotes=['*'])
+                root.add('p2', IndepVarComp('y', 50.0), promotes=['*'])
+                root.add('comp', Paraboloid(), promotes=['*'])
+                root.add('con', ExecComp('c = - x + y'), promotes=['*'])
+
+                prob.driver = ScipyOptimizer()
+                prob.driver.options['optimizer'] = opt
+                prob.driver.options['tol'] = 1.0e-8
+                prob.driver.options['disp'] = False
+                prob.driver.options['cache_size'] = cache_size
+                prob.driver.add_desvar('x', lower=-50.0, upper=50.0)
+                prob.driver.add_desvar('y', lower=-50.0, upper=50.0)
+                prob.driver.add_objective('f_xy')
+                prob.driver.add_constraint('c', upper=-15.0)
+
+                prob.setup(check=False)
+
+                # count the runs made by the optimizer, apart from the run at
+                # the final point afterwards
+                minimize = scipy_optimizer.minimize
+                counts = []
+                def counting_minimize(*args, **kwargs):
+                    result = minimize(*args, **kwargs)
+                    counts.append(prob.driver.iter_count)
+                    return result
+                scipy_optimizer.minimize = counting_minimize
+                try:
+                    prob.run()
+                finally:
+                    scipy_optimizer.minimize = minimize
+
+                # the model is left at the final point
+                assert_rel_error(self, np.array([prob['x'], prob['y']]),
+                                 prob.driver.result.x, 1e-12)
+                self.assertTrue(prob.driver.iter_count - counts[0] in (0, 1))
+
+                results.append((prob['x'], prob['y'], counts[0]))
+
+            # Same path, fewer model runs.
+            (x0, y0, count0), (x1, y1, count1) = results[-2:]
+            assert_rel_error(self, x1, x0, 1e-6)
+            assert_rel_error(self, y1, y0, 1e-6)
+            self.assertLess(count1, count0)
+
+            cache = prob.driver.eval_cache
+            self.assertEqual(cache.hits, count0 - count1)
+            self.assertTrue(len(cache) <= 10)
+
     def test_simple_paraboloid_scaled_constraint_fd(self):
 
         prob = Problem()
@@ -13,10 +13,25 @@ class BackTracking(LineSearch):
     """A line search subsolver that implements backracking using the
     Armijo-Goldstein condition..
 
+    The number of model evaluations of the last line search is kept in
+    `iter_count`, and the total over all line searches since setup in
+    `eval_count`.
+
     Options
     -------
+    options['cache_states'] : bool(False)
+        Set to True to keep the state of the model at the trial points. With
+        solve_subsystems, each trial then starts the subsystem solves from the
+        states of the closest earlier trial, interpolated toward those of the
+        starting point. The best point is restored without evaluating it
+        again if the search fails.
     options['err_on_maxiter'] : bool(False)
         If True, raise an AnalysisError if not converged at maxiter.
+    options['interpolation'] : str('none')
+        Set to 'cubic' to pick each backtracking step from a quadratic, then
+        cubic, model of the residual along the Newton step, limited to between
+        rho_min and rho times the previous step. With 'none', the step is
+        multiplied by rho.
     options['iprint'] :  int(0)
         Set to 0 to print only failures, set to 1 to print iteration totals to
         stdout, set to 2 to print the residual each iteration to stdout,
@@ -27,6 +42,8 @@ class BackTracking(LineSearch):
         Set to True to solve subsystems. You may need this for solvers nested under Newton.
     options['rho'] : int(0.5)
         Backtracking step.
+    options['rho_min'] : float(0.1)
+        Smallest reduction of the step from interpolation.
     options['c'] : int(0.5)
         Slope check trigger.
     """
@@ -43,8 +60,33 @@ class BackTracking(LineSearch):
                        desc="Backtracking step.")
         opt.add_option('c', 0.5,
                        desc="Slope check trigger.")
+        opt.add_option('interpolation', 'none', values=['none', 'cubic'],
+                       desc="Set to 'cubic' to pick each backtracking step from "
+                       "a quadratic, then cubic, model of the residual along the "
+                       "Newton step, limited to between rho_min and rho times the "
+                       "previous step. With 'none', the step is multiplied by rho.")
+        opt.add_option('rho_min', 0.1, lower=0.0,
+                       desc="Smallest reduction of the step from interpolation.")
+        opt.add_option('cache_states', False,
+                       desc="Set to True to keep the state of the model at "
+                       "the trial points. With solve_subsystems, each trial "
+                       "then starts the subsystem solves from the states of "
+                       "the closest earlier trial, interpolated toward those "
+                       "of the starting point. The best point is restored "
+                       "without evaluating it again if the search fails.")
 
         self.print_name = 'BK_TKG'
+        self.eval_count = 0
+
+    def setup(self, sub):
+        """ Resets the evaluation count.
+
+        Args
+        ----
+        sub: `System`
+            System that owns this solver.
+        """
+        self.eval_count = 0
 
     def solve(self, params, unknowns, resids, system, solver, alpha_scalar, alpha,
               base_u, base_norm, fnorm, fnorm0, metadata=None):
@@ -100,12 +142,32 @@ class BackTracking(LineSearch):
         rho = self.options['rho']
         c = self.options['c']
         iprint = self.options['iprint']
+        cubic = self.options['interpolation'] == 'cubic'
+        cache = self.options['cache_states']
+        solve_subs = self.options['solve_subsystems']
+        warm_start = cache and solve_subs
         result = system.dumat[None]
         local_meta = create_local_meta(metadata, system.pathname)
 
         itercount = 0
         ls_alpha = alpha_scalar
 
+        # Earlier trial for the cubic model.
+        alpha_old = fnorm_old = None
+
+        # The caller has already evaluated the full step.
+        if cache:
+            best_u = unknowns.vec.copy()
+            best_r = resids.vec.copy()
+            best_norm = fnorm
+
+        # How far the subsystem solves moved the unknowns away from the
+        # Newton step at the closest trial, which is the last one since the
+        # step only shrinks.
+        if warm_start:
+            trial_alpha = alpha_scalar
+            trial_offset = unknowns.vec - base_u - alpha*result.vec
+
         # Further backtacking if needed.
         # The Armijo-Goldstein is basically a slope comparison --actual vs predicted.
         # We don't have an actual gradient, but we have the Newton vector that should
@@ -113,7 +175,13 @@ class BackTracking(LineSearch):
         # "rise".
         while itercount < maxiter and (base_norm - fnorm) < c*ls_alpha*base_norm:
 
-            ls_alpha *= rho
+            if cubic:
+                new_alpha = self._interpolate(base_norm, ls_alpha, fnorm,
+                                              alpha_old, fnorm_old)
+                alpha_old, fnorm_old = ls_alpha, fnorm
+                ls_alpha = new_alpha
+            else:
+                ls_alpha *= rho
 
             # If our step will violate any upper or lower bounds, then reduce
             # alpha in just that direction so that we only step to that
@@ -125,14 +193,24 @@ class BackTracking(LineSearch):
             unknowns.vec += alpha*result.vec
             itercount += 1
 
+            # Start the subsystem solves from the states of the closest
+            # trial, interpolated toward those of the starting point.
+            if warm_start and trial_alpha > 0.0:
+                on_step = unknowns.vec.copy()
+                unknowns.vec += (ls_alpha/trial_alpha)*trial_offset
+
             # Metadata update
             update_local_meta(local_meta, (solver.iter_count, itercount))
 
             # Just evaluate the model with the new points
-            if self.options['solve_subsystems']:
+            if solve_subs:
                 system.children_solve_nonlinear(local_meta)
             system.apply_nonlinear(params, unknowns, resids, local_meta)
 
+            if warm_start and trial_alpha > 0.0:
+                trial_alpha = ls_alpha
+                trial_offset = unknowns.vec - on_step
+
             solver.recorders.record_iteration(system, local_meta)
 
             fnorm = resids.norm()
@@ -140,6 +218,13 @@ class BackTracking(LineSearch):
                 self.print_norm(self.print_name, system, itercount,
                                 fnorm, fnorm0, indent=1, solver='LS')
 
+            if cache and fnorm < best_norm:
+                best_u[:] = unknowns.vec
+                best_r[:] = resids.vec
+                best_norm = fnorm
+
+        self.iter_count = itercount
+        self.eval_count += itercount
 
         # Final residual print if you only want the last one
         if iprint == 1:
@@ -148,6 +233,14 @@ class BackTracking(LineSearch):
 
         if itercount >= maxiter or isnan(fnorm):
 
+            # Go back to the best point we have seen.
+            if cache and not best_norm >= fnorm:
+                unknowns.vec[:] = best_u
+                resids.vec[:] = best_r
+                fnorm = best_norm
+                for grp in system.subgroups(recurse=True, include_self=True):
+                    grp._transfer_data()
+
             if self.options['err_on_maxiter']:
                 msg = "Solve in '{}': BackTracking failed to converge after {} " \
                       "iterations."
@@ -165,3 +258,55 @@ class BackTracking(LineSearch):
                             fnorm, fnorm0, msg=msg, indent=1, solver='LS')
 
         return fnorm
+
+    def _interpolate(self, f_norm0, alpha, f_norm, alpha_old, f_norm_old):
+        """ Minimizes a model of f = 0.5*||r||**2 along the Newton step,
+        whose slope at zero is -||r0||**2. The model is a quadratic through
+        the last trial, or a cubic through the last two.
+
+        Args
+        ----
+        f_norm0 : float
+            Norm of the residual before the step.
+
+        alpha : float
+            Step of the last trial.
+
+        f_norm : float
+            Norm of the residual at the last trial.
+
+        alpha_old : float or None
+            Step of the trial before that, if any.
+
+        f_norm_old : float or None
+            Norm of the residual at the trial before that.
+
+        Returns
+        -------
+        float
+            The next step.
+        """
+        f0 = 0.5*f_norm0**2
+        g0 = -f_norm0**2
+        d1 = 0.5*f_norm**2 - f0 - g0*alpha
+
+        with np.errstate(all='ignore'):
+            if alpha_old is None:
+                new_alpha = -g0*alpha**2/(2.0*d1)
+            else:
+                d2 = 0.5*f_norm_old**2 - f0 - g0*alpha_old
+                denom = alpha**2*alpha_old**2*(alpha - alpha_old)
+                a = (alpha_old**2*d1 - alpha**2*d2)/denom
+                b = (alpha**3*d2 - alpha_old**3*d1)/denom
+                if a == 0.0:
+                    new_alpha = -g0/(2.0*b)
+                else:
+                    disc = b*b - 3.0*a*g0
+                    new_alpha = (-b + np.sqrt(disc))/(3.0*a)
+
+        # Also catches nan from a bad model.
+        lower = self.options['rho_min']*alpha
+        upper = self.options['rho']*alpha
+        if not new_alpha >= lower:
+            return lower if new_alpha <= upper else upper
+        return min(new_alpha, upper)
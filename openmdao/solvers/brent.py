@@ -19,6 +19,11 @@ class Brent(NonLinearSolver):
     give either `lower_bound` and `upper_bound` or `var_lower_bound`
     and `var_upper_bound`.
 
+    If the `vectorize` option is set, every entry of an array `state_var` is
+    converged at once, with one evaluation of the model per iteration for
+    all of them. Each entry of the residual must then only depend on the
+    same entry of the state, and the bounds can be arrays.
+
 
     Options
     -------
@@ -44,6 +49,8 @@ class Brent(NonLinearSolver):
         if given, name of the variable to pull the lower bound value from.This variable must be a parameter on of of the child components of the containing system
     options['var_upper_bound'] :  str('')
         if given, name of the variable to pull the upper bound value from.This variable must be a parameter on of of the child components of the containing system
+    options['vectorize'] :  bool(False)
+        Set to True to converge all entries of state_var at once. state_var_idx is not used.
     options['xtol'] :  int(0)
         The routine converges when a root is known to lie within xtol of the value return. Should be >= 0. The routine modifies this to take into account the relative precision of doubles.
     """
@@ -74,6 +81,9 @@ class Brent(NonLinearSolver):
         opt.add_option('var_upper_bound', '', desc='if given, name of the variable to pull the upper bound value from.'
             'This variable must be a parameter on of of the child components of the containing system')
 
+        opt.add_option('vectorize', False,
+            desc='Set to True to converge all entries of state_var at once. state_var_idx is not used.')
+
         # we renamed max_iter to maxiter to match all the other solvers
         opt._add_deprecation('max_iter', 'maxiter')
 
@@ -177,20 +187,26 @@ class Brent(NonLinearSolver):
 
         # Evaluate Norm
         self.sys.apply_nonlinear(params, unknowns, resids)
-        self.basenorm = resid_norm_0 = abs(resids._dat[self.s_var_name].val[idx])
 
         failed = False
-        try:
-            xstar = brentq(self._eval, **kwargs)
-        except RuntimeError as err:
-            msg = str(err)
-            if 'different signs' in msg:
-                raise
-            failed = True
+        if self.options['vectorize']:
+            self.basenorm = resid_norm_0 = np.linalg.norm(resids._dat[self.s_var_name].val)
+            failed, msg = self._solve_vectorized(lower, upper, params, unknowns, resids)
+            resid_norm = np.linalg.norm(resids._dat[self.s_var_name].val)
 
-        self.sys = None
+        else:
+            self.basenorm = resid_norm_0 = abs(resids._dat[self.s_var_name].val[idx])
+            try:
+                xstar = brentq(self._eval, **kwargs)
+            except RuntimeError as err:
+                msg = str(err)
+                if 'different signs' in msg:
+                    raise
+                failed = True
 
-        resid_norm = abs(resids._dat[self.s_var_name].val[idx])
+            resid_norm = abs(resids._dat[self.s_var_name].val[idx])
+
+        self.sys = None
 
         if self.options['iprint'] > 0:
 
@@ -217,9 +233,138 @@ class Brent(NonLinearSolver):
 
         self.recorders.record_iteration(self.sys, self.local_meta)
 
+        normval = abs(resids._dat[self.s_var_name].val[idx])
+        self._log_norm(self.sys, self.iter_count, normval)
+
         if self.options['iprint'] == 2:
-            normval = abs(resids._dat[self.s_var_name].val[idx])
             self.print_norm(self.print_name, self.sys, self.iter_count, normval,
                             self.basenorm)
 
         return resids._dat[self.s_var_name].val[idx]
+
+    def _eval_all(self, x, params, unknowns, resids):
+        """Sets every entry of the state to x and returns a copy of the
+        residual."""
+
+        self.iter_count += 1
+        update_local_meta(self.local_meta, (self.iter_count, ))
+
+        unknowns._dat[self.s_var_name].val[:] = x
+
+        self.sys.children_solve_nonlinear(self.local_meta)
+        self.sys.apply_nonlinear(params, unknowns, resids)
+
+        self.recorders.record_iteration(self.sys, self.local_meta)
+
+        fval = resids._dat[self.s_var_name].val
+        normval = np.linalg.norm(fval)
+        self._log_norm(self.sys, self.iter_count, normval)
+
+        if self.options['iprint'] == 2:
+            self.print_norm(self.print_name, self.sys, self.iter_count,
+                            normval, self.basenorm)
+
+        return fval.copy()
+
+    def _solve_vectorized(self, lower, upper, params, unknowns, resids):
+        """ Brent's method (as in scipy's brentq) applied to every entry of
+        the state at once. The brackets of each entry are updated with
+        masked array operations, and entries stop changing once their
+        bracket is small enough.
+
+        Returns
+        -------
+        bool
+            True if some entries did not converge within maxiter iterations.
+
+        str
+            Message describing the result.
+        """
+        xtol = self.options['xtol'] or 2e-12
+        rtol = self.options['rtol']
+        maxiter = self.options['maxiter']
+        size = len(unknowns._dat[self.s_var_name].val)
+
+        xpre = np.empty(size)
+        xpre[:] = lower
+        xcur = np.empty(size)
+        xcur[:] = upper
+
+        fpre = self._eval_all(xpre, params, unknowns, resids)
+        fcur = self._eval_all(xcur, params, unknowns, resids)
+        xlast = xcur.copy()
+
+        bad = np.flatnonzero(fpre*fcur > 0.0)
+        if len(bad) > 0:
+            raise ValueError("f(a) and f(b) must have different signs for "
+                             "entries %s of '%s'" % (list(bad), self.s_var_name))
+
+        # A root at the lower bound needs no iterations.
+        at_lower = fpre == 0.0
+        xcur[at_lower] = xpre[at_lower]
+        fcur[at_lower] = 0.0
+
+        xblk = np.zeros(size)
+        fblk = np.zeros(size)
+        spre = np.zeros(size)
+        scur = np.zeros(size)
+
+        active = fcur != 0.0
+        count = 0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            while True:
+                # Keep the root bracketed by [xcur, xblk].
+                flip = active & (fpre != 0.0) & \
+                    (np.signbit(fpre) != np.signbit(fcur))
+                xblk[flip] = xpre[flip]
+                fblk[flip] = fpre[flip]
+                spre[flip] = scur[flip] = xcur[flip] - xpre[flip]
+
+                # Make xcur the best guess so far.
+                swap = active & (np.abs(fblk) < np.abs(fcur))
+                xpre[swap], xcur[swap], xblk[swap] = xcur[swap], xblk[swap], xcur[swap]
+                fpre[swap], fcur[swap], fblk[swap] = fcur[swap], fblk[swap], fcur[swap]
+
+                delta = 0.5*(xtol + rtol*np.abs(xcur))
+                sbis = 0.5*(xblk - xcur)
+                active &= (fcur != 0.0) & (np.abs(sbis) >= delta)
+
+                if not active.any() or count >= maxiter:
+                    break
+                count += 1
+
+                # Secant step, or inverse quadratic extrapolation.
+                dpre = (fpre - fcur)/(xpre - xcur)
+                dblk = (fblk - fcur)/(xblk - xcur)
+                stry = np.where(xpre == xblk,
+                                -fcur*(xcur - xpre)/(fcur - fpre),
+                                -fcur*(fblk*dblk - fpre*dpre)/(dblk*dpre*(fblk - fpre)))
+
+                # Otherwise bisect.
+                good = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre)) & \
+                    (2.0*np.abs(stry) < np.minimum(np.abs(spre), 3.0*np.abs(sbis) - delta))
+                spre[active] = np.where(good, scur, sbis)[active]
+                scur[active] = np.where(good, stry, sbis)[active]
+
+                xpre[active] = xcur[active]
+                fpre[active] = fcur[active]
+
+                step = np.where(np.abs(scur) > delta, scur,
+                                np.where(sbis > 0.0, delta, -delta))
+                xcur[active] += step[active]
+
+                fval = self._eval_all(xcur, params, unknowns, resids)
+                fcur[active] = fval[active]
+                xlast[:] = xcur
+
+        # Leave the model at the roots.
+        if np.any(xlast != xcur):
+            self._eval_all(xcur, params, unknowns, resids)
+
+        if active.any():
+            return True, "Failed to converge after %d iterations, entries %s " \
+                "of '%s' not converged." % (count, list(np.flatnonzero(active)),
+                                             self.s_var_name)
+
+        return False, 'Converged'
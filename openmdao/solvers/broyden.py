@@ -0,0 +1,346 @@
+""" Non-linear solver that implements Broyden's quasi-Newton method."""
+
+from math import isnan
+
+import numpy as np
+
+from openmdao.core.system import AnalysisError
+from openmdao.solvers.solver_base import error_wrap_nl, NonLinearSolver
+from openmdao.util.record_util import update_local_meta, create_local_meta
+
+
+class Broyden(NonLinearSolver):
+    """A quasi-Newton solver that updates an approximation of the inverse
+    Jacobian with the change in the residuals from each step (Broyden's
+    "good" method). The approximation is kept as a list of rank one updates
+    to an initial inverse Jacobian of -alpha*I, so each step only costs a
+    residual evaluation. The updates are discarded (restarted) after
+    `max_updates` steps or when the residual norm grows. By default a
+    restart takes a regular Newton step, which linearizes the model and
+    calls solve_linear. A linear solver can be specified by assigning it to
+    `self.ln_solver` to use a different solver than the one in the parent
+    system.
+
+    Options
+    -------
+    options['alpha'] :  float(1.0)
+        Scale of the initial inverse Jacobian, -alpha*I. For explicit
+        residuals, a step with it is a fixed point iteration relaxed by alpha.
+    options['atol'] :  float(1e-10)
+        Absolute convergence tolerance on the residual.
+    options['diverge_rate'] :  float(1.0)
+        The updates are restarted if a step increases the residual norm by
+        more than this factor.
+    options['err_on_maxiter'] : bool(False)
+        If True, raise an AnalysisError if not converged at maxiter.
+    options['iprint'] :  int(0)
+        Set to 0 to print only failures, set to 1 to print iteration totals to
+        stdout, set to 2 to print the residual each iteration to stdout,
+        or -1 to suppress all printing.
+    options['max_updates'] :  int(10)
+        Maximum number of rank one updates kept before restarting.
+    options['maxiter'] :  int(50)
+        Maximum number of iterations.
+    options['newton_restart'] :  bool(True)
+        Set to True to take a Newton step, which linearizes the model, on
+        every restart. Set to False to never use derivatives.
+    options['rtol'] :  float(1e-10)
+        Relative convergence tolerance on the residual.
+    options['solve_subsystems'] :  bool(True)
+        Set to True to solve subsystems after each step.
+    options['utol'] :  float(1e-12)
+        Convergence tolerance on the change in the unknowns.
+    """
+
+    def __init__(self):
+        super(Broyden, self).__init__()
+
+        # What we support
+        self.supports['uses_derivatives'] = True
+
+        opt = self.options
+        opt.add_option('atol', 1e-10, lower=0.0,
+                       desc='Absolute convergence tolerance on the residual.')
+        opt.add_option('rtol', 1e-10, lower=0.0,
+                       desc='Relative convergence tolerance on the residual.')
+        opt.add_option('utol', 1e-12, lower=0.0,
+                       desc='Convergence tolerance on the change in the unknowns.')
+        opt.add_option('maxiter', 50, lower=0,
+                       desc='Maximum number of iterations.')
+        opt.add_option('alpha', 1.0, lower=0.0,
+                       desc='Scale of the initial inverse Jacobian, -alpha*I. '
+                       'For explicit residuals, a step with it is a fixed '
+                       'point iteration relaxed by alpha.')
+        opt.add_option('max_updates', 10, lower=1,
+                       desc='Maximum number of rank one updates kept before '
+                       'restarting.')
+        opt.add_option('diverge_rate', 1.0, lower=0.0,
+                       desc='The updates are restarted if a step increases the '
+                       'residual norm by more than this factor.')
+        opt.add_option('newton_restart', True,
+                       desc='Set to True to take a Newton step, which linearizes '
+                       'the model, on every restart. Set to False to never use '
+                       'derivatives.')
+        opt.add_option('solve_subsystems', True,
+                       desc='Set to True to solve subsystems after each step.')
+
+        self.print_name = 'BROYDEN'
+
+        # User can specify a different linear solver for the Newton steps.
+        # Default is to use the parent's solver.
+        self.ln_solver = None
+
+        # We need local relevancy for sub-solves
+        self.rel_inputs = None
+
+        # Number of restarts and linearizations in the last solve.
+        self.restart_count = 0
+        self.linearize_count = 0
+
+    def setup(self, sub):
+        """ Initialize sub solvers.
+
+        Args
+        ----
+        sub: `System`
+            System that owns this solver.
+        """
+        if self.ln_solver:
+            self.ln_solver.setup(sub)
+
+        if sub.is_active():
+
+            # Determine set of relevant inputs for local Newton steps if we
+            # are not root.
+            if sub.name is not '':
+                conns = sub.connections
+                all_tgt = [var for var in sub._params_dict if var in conns]
+                duvec = sub.dumat[None]
+                rel_src = [duvec.metadata(var)['pathname'] for var in duvec]
+                self.rel_inputs = set([var for var in all_tgt \
+                                       if conns[var][0].startswith(sub.pathname) and \
+                                       conns[var][0] in rel_src])
+
+    @error_wrap_nl
+    def solve(self, params, unknowns, resids, system, metadata=None):
+        """ Solves the system using Broyden's method.
+
+        Args
+        ----
+        params : `VecWrapper`
+            `VecWrapper` containing parameters. (p)
+
+        unknowns : `VecWrapper`
+            `VecWrapper` containing outputs and states. (u)
+
+        resids : `VecWrapper`
+            `VecWrapper` containing residuals. (r)
+
+        system : `System`
+            Parent `System` object.
+
+        metadata : dict, optional
+            Dictionary containing execution metadata (e.g. iteration coordinate).
+        """
+
+        atol = self.options['atol']
+        rtol = self.options['rtol']
+        utol = self.options['utol']
+        maxiter = self.options['maxiter']
+        iprint = self.options['iprint']
+        max_updates = self.options['max_updates']
+        diverge_rate = self.options['diverge_rate']
+        newton_restart = self.options['newton_restart']
+
+        # Metadata setup
+        self.iter_count = 0
+        self.restart_count = 0
+        self.linearize_count = 0
+        local_meta = create_local_meta(metadata, system.pathname)
+        if self.ln_solver:
+            self.ln_solver.local_meta = local_meta
+        else:
+            system.ln_solver.local_meta = local_meta
+        update_local_meta(local_meta, (self.iter_count, 0))
+
+        # Perform an initial run to propagate srcs to targets.
+        system.children_solve_nonlinear(local_meta)
+        system.apply_nonlinear(params, unknowns, resids)
+
+        f_norm = resids.norm()
+        f_norm0 = f_norm
+
+        self._log_norm(system, 0, f_norm)
+
+        if iprint == 2:
+            self.print_norm(self.print_name, system, 0, f_norm,
+                            f_norm0)
+
+        step = system.dumat[None]
+        u_old = np.empty(unknowns.vec.shape)
+        r_old = np.empty(resids.vec.shape)
+        u_norm = 1.0e99
+
+        # Rank one updates of the inverse Jacobian, H = H0 + sum(a*b^T)
+        self._updates = []
+        restart = True
+
+        # Can't have the system trying to FD itself when it also contains
+        # this solver.
+        save_type = system.deriv_options['type']
+        system.deriv_options.locked = False
+        system.deriv_options['type'] = 'user'
+
+        while self.iter_count < maxiter and f_norm > atol and \
+                f_norm/f_norm0 > rtol and u_norm > utol:
+
+            if restart:
+                self._updates = []
+                self.restart_count += 1
+
+                if newton_restart:
+                    self._newton_step(params, unknowns, resids, system)
+                else:
+                    step.vec[:] = -self._apply_inverse(resids.vec)
+                restart = False
+
+            else:
+                step.vec[:] = -self._apply_inverse(resids.vec)
+
+            self.iter_count += 1
+
+            # If our step will violate any upper or lower bounds, then reduce
+            # it in just that direction so that we only step to that boundary.
+            alpha = unknowns.distance_along_vector_to_limit(np.ones(len(unknowns.vec)),
+                                                            step)
+
+            u_old[:] = unknowns.vec
+            r_old[:] = resids.vec
+            f_norm_old = f_norm
+
+            unknowns.vec += alpha*step.vec
+
+            # Metadata update
+            update_local_meta(local_meta, (self.iter_count, 0))
+
+            if self.options['solve_subsystems']:
+                system.children_solve_nonlinear(local_meta)
+            system.apply_nonlinear(params, unknowns, resids, local_meta)
+
+            self.recorders.record_iteration(system, local_meta)
+
+            f_norm = resids.norm()
+            u_norm = np.linalg.norm(unknowns.vec - u_old)
+            self._log_norm(system, self.iter_count, f_norm)
+            if iprint == 2:
+                self.print_norm(self.print_name, system, self.iter_count,
+                                f_norm, f_norm0, u_norm=u_norm)
+
+            if f_norm > diverge_rate*f_norm_old or \
+               not self._update(unknowns.vec - u_old, resids.vec - r_old) or \
+               len(self._updates) >= max_updates:
+                restart = True
+
+        self._updates = []
+
+        # Final residual print if you only want the last one
+        if iprint == 1:
+            self.print_norm(self.print_name, system, self.iter_count,
+                            f_norm, f_norm0, u_norm=u_norm)
+
+        # Return system's FD status back to what it was
+        system.deriv_options['type'] = save_type
+        system.deriv_options.locked = True
+
+        if self.iter_count >= maxiter or isnan(f_norm):
+            msg = 'FAILED to converge after %d iterations' % self.iter_count
+            fail = True
+        else:
+            msg = 'Converged in %d iterations' % self.iter_count
+            fail = False
+
+        if iprint > 0 or (fail and iprint > -1 ):
+
+            self.print_norm(self.print_name, system, self.iter_count,
+                            f_norm, f_norm0, msg=msg)
+
+        if fail and self.options['err_on_maxiter']:
+            raise AnalysisError("Solve in '%s': Broyden %s" % (system.pathname,
+                                                               msg))
+
+    def _newton_step(self, params, unknowns, resids, system):
+        """ Linearizes the model and solves for a Newton step, which is left
+        in the system's dumat.
+        """
+        system._sys_linearize(params, unknowns, resids, total_derivs=False)
+        self.linearize_count += 1
+
+        system.drmat[None].vec[:] = -resids.vec
+        with system._dircontext:
+            system.solve_linear(system.dumat, system.drmat,
+                                [None], mode='fwd', solver=self.ln_solver,
+                                rel_inputs=self.rel_inputs)
+
+    def _apply_inverse(self, vec, transpose=False):
+        """ Multiplies a vector by the approximate inverse Jacobian.
+
+        Args
+        ----
+        vec : ndarray
+            Incoming vector.
+
+        transpose : bool(False)
+            Set to True to multiply by the transpose.
+
+        Returns
+        -------
+        ndarray
+            The product.
+        """
+        prod = -self.options['alpha']*vec
+        for a, b in self._updates:
+            if transpose:
+                prod += b*a.dot(vec)
+            else:
+                prod += a*b.dot(vec)
+        return prod
+
+    def _update(self, s, y):
+        """ Adds the rank one update for the step s that changed the
+        residuals by y.
+
+        Args
+        ----
+        s : ndarray
+            Change in the unknowns.
+
+        y : ndarray
+            Change in the residuals.
+
+        Returns
+        -------
+        bool
+            False if the update is degenerate and the approximation has to
+            be restarted.
+        """
+        Hy = self._apply_inverse(y)
+        denom = s.dot(Hy)
+        if abs(denom) <= 1e-14 * np.linalg.norm(s) * np.linalg.norm(Hy):
+            return False
+
+        self._updates.append(((s - Hy) / denom, self._apply_inverse(s, transpose=True)))
+        return True
+
+    def print_all_convergence(self, level=2):
+        """ Turns on iprint for this solver and all subsolvers. Override if
+        your solver has subsolvers.
+
+        Args
+        ----
+        level : int(2)
+            iprint level. Set to 2 to print residuals each iteration; set to 1
+            to print just the iteration totals.
+        """
+        self.options['iprint'] = level
+        if self.ln_solver:
+            self.ln_solver.options['iprint'] = level
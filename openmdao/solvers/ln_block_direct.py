@@ -0,0 +1,256 @@
+""" OpenMDAO LinearSolver that sweeps over the subsystems of a Group, solving
+the diagonal block of each child Group with a factored Jacobian."""
+
+from __future__ import print_function
+
+from collections import OrderedDict
+from six import itervalues
+
+import numpy as np
+
+from openmdao.core.system import AnalysisError
+from openmdao.solvers.ln_direct import DirectSolver
+from openmdao.solvers.ln_gauss_seidel import LinearGaussSeidel
+
+
+class BlockDirectSolver(LinearGaussSeidel):
+    """ LinearSolver that performs block Gauss Seidel or block Jacobi sweeps
+    over the subsystems of a Group. The diagonal block of each child `Group`
+    is assembled with `Group.assemble_jacobian` and LU factored once per
+    linearization, so repeated solves, for example as the preconditioner of
+    `ScipyGMRES`, only do forward and back substitution. Components are
+    solved with their own solve_linear.
+
+    Options
+    -------
+    options['atol'] :  float(1e-12)
+        Absolute convergence tolerance.
+    options['err_on_maxiter'] : bool(False)
+        If True, raise an AnalysisError if not converged at maxiter.
+    options['iprint'] :  int(0)
+        Set to 0 to print only failures, set to 1 to print iteration totals to
+        stdout, set to 2 to print the residual each iteration to stdout,
+        or -1 to suppress all printing.
+    options['jacobian_format'] : str('dense')
+        Storage format of the assembled blocks, either 'dense' or 'csc'.
+    options['jacobian_method'] : str('assemble')
+        Method used to build the blocks. Select 'assemble' to place the
+        component sub-Jacobians directly, or 'MVP' to build them from
+        matrix vector products for Groups with components that define
+        apply_linear.
+    options['maxiter'] :  int(1)
+        Maximum number of iterations.
+    options['mode'] :  str('auto')
+        Derivative calculation mode, set to 'fwd' for forward mode, 'rev' for reverse mode, or 'auto' to let OpenMDAO determine the best mode.
+    options['rtol'] :  float(1e-10)
+        Relative convergence tolerance.
+    options['sweep'] :  str('gs')
+        Set to 'gs' for block Gauss Seidel sweeps, which use the latest
+        solution of the earlier subsystems, or 'jacobi' for block Jacobi
+        sweeps, which only use the diagonal blocks.
+    """
+
+    def __init__(self):
+        super(BlockDirectSolver, self).__init__()
+
+        opt = self.options
+        opt.add_option('sweep', 'gs', values=['gs', 'jacobi'],
+                       desc="Set to 'gs' for block Gauss Seidel sweeps, which use "
+                       "the latest solution of the earlier subsystems, or "
+                       "'jacobi' for block Jacobi sweeps, which only use the "
+                       "diagonal blocks.")
+        opt.add_option('jacobian_method', 'assemble', values=['assemble', 'MVP'],
+                       desc="Method used to build the blocks. Select 'assemble' "
+                       "to place the component sub-Jacobians directly, or 'MVP' "
+                       "to build them from matrix vector products for Groups "
+                       "with components that define apply_linear.")
+        opt.add_option('jacobian_format', 'dense', values=['dense', 'csc'],
+                       desc="Storage format of the assembled blocks, either "
+                       "'dense' or 'csc'.")
+
+        self.print_name = 'LN_BDS'
+
+        # Factored solver of each child Group, and the linearization and mode
+        # that it was factored for.
+        self._block_solvers = OrderedDict()
+        self._factored = {}
+
+    def setup(self, group):
+        """ Creates a DirectSolver for each child Group.
+
+        Args
+        ----
+        group: `Group`
+            Group that owns this solver.
+        """
+        super(BlockDirectSolver, self).setup(group)
+
+        self._block_solvers = OrderedDict()
+        self._factored = {}
+
+        for sub in group.subgroups():
+            solver = DirectSolver()
+            solver.options['jacobian_method'] = self.options['jacobian_method']
+            solver.options['jacobian_format'] = self.options['jacobian_format']
+            solver.options['iprint'] = -1
+            if sub.is_active():
+                solver.setup(sub)
+            self._block_solvers[sub.name] = solver
+
+    def solve(self, rhs_mat, system, mode):
+        """ Solves the linear system for the problem in self.system. The
+        full solution vector is returned.
+
+        Args
+        ----
+        rhs_mat : dict of ndarray
+            Dictionary containing one ndarry per top level quantity of
+            interest. Each array contains the right-hand side for the linear
+            solve.
+
+        system : `System`
+            Parent `System` object.
+
+        mode : string
+            Derivative mode, can be 'fwd' or 'rev'.
+
+        Returns
+        -------
+        dict of ndarray : Solution vectors
+        """
+        if self.options['sweep'] == 'gs':
+            return super(BlockDirectSolver, self).solve(rhs_mat, system, mode)
+
+        return self._solve_jacobi(rhs_mat, system, mode)
+
+    def _solve_jacobi(self, rhs_mat, system, mode):
+        """ Block Jacobi iteration, x += D^-1 * (rhs - A*x), where D is the
+        block diagonal of A.
+        """
+        if mode == 'fwd':
+            sol_vec, rhs_vec = system.dumat, system.drmat
+        else:
+            sol_vec, rhs_vec = system.drmat, system.dumat
+
+        vois = list(rhs_mat.keys())
+        iprint = self.options['iprint']
+        maxiter = self.options['maxiter']
+        atol = self.options['atol']
+        rtol = self.options['rtol']
+
+        sol_buf = OrderedDict()
+        for voi in vois:
+            sol_buf[voi] = np.zeros(rhs_mat[voi].shape)
+
+        f_norm0 = np.linalg.norm(np.concatenate([rhs for rhs in rhs_mat.values()]))
+        if f_norm0 == 0.0:
+            f_norm0 = 1.0
+        f_norm = f_norm0
+
+        self.iter_count = 0
+        while self.iter_count < maxiter:
+
+            # Residual of the current solution
+            if self.iter_count > 0:
+                for voi in vois:
+                    sol_vec[voi].vec[:] = sol_buf[voi]
+                    rhs_vec[voi].vec[:] = 0.0
+                system.clear_dparams()
+                system._sys_apply_linear(mode, system._do_apply, vois=vois)
+                self.matvec_count += 1
+
+                f_norm = 0.0
+                for voi in vois:
+                    rhs_vec[voi].vec *= -1.0
+                    rhs_vec[voi].vec += rhs_mat[voi]
+                    f_norm += rhs_vec[voi].norm()**2
+                f_norm = f_norm**0.5
+
+                self._log_norm(system, self.iter_count, f_norm)
+
+                if iprint == 2:
+                    self.print_norm(self.print_name, system, self.iter_count,
+                                    f_norm, f_norm0, indent=1, solver='LN')
+
+                if f_norm < atol or f_norm/f_norm0 < rtol:
+                    break
+            else:
+                for voi in vois:
+                    rhs_vec[voi].vec[:] = rhs_mat[voi]
+
+            # The subsystem vectors are views into ours, so each diagonal
+            # block solve writes its own part of the correction.
+            system.clear_dparams()
+            for sub in itervalues(system._subsystems):
+                if sub.is_active():
+                    with sub._dircontext:
+                        self._solve_sub(sub, vois, mode)
+
+            for voi in vois:
+                sol_buf[voi] += sol_vec[voi].vec
+
+            self.iter_count += 1
+
+        for voi in vois:
+            sol_vec[voi].vec[:] = sol_buf[voi]
+
+        if maxiter > 1 and self.iter_count >= maxiter:
+            msg = 'FAILED to converge after %d iterations' % self.iter_count
+            failed = True
+        else:
+            msg = 'Converged in %d iterations' % self.iter_count
+            failed = False
+
+        if iprint > 0 or (failed and iprint > -1 ):
+
+            self.print_norm(self.print_name, system, self.iter_count, f_norm,
+                            f_norm0, indent=1, solver='LN', msg=msg)
+
+        if failed and self.options['err_on_maxiter']:
+            raise AnalysisError("Solve in '%s': BlockDirectSolver %s" %
+                                (system.pathname, msg))
+
+        return sol_buf
+
+    def _solve_sub(self, sub, vois, mode):
+        """ Solves the diagonal block of one subsystem, factoring the block
+        of a child Group again if it was linearized since the last solve.
+
+        Args
+        ----
+        sub : `System`
+            Subsystem to solve.
+
+        vois: list of strings
+            List of all quantities of interest to key into the mats.
+
+        mode : string
+            Derivative mode, can be 'fwd' or 'rev'.
+        """
+        solver = self._block_solvers.get(sub.name)
+        if solver is None:
+            sub.solve_linear(sub.dumat, sub.drmat, vois, mode=mode)
+            return
+
+        # The Group's own ln_solver may also watch _jacobian_changed, so leave
+        # it the way we found it.
+        key = (sub._linearize_count, mode)
+        changed = sub._jacobian_changed
+        sub._jacobian_changed = self._factored.get(sub.name) != key
+        try:
+            sub.solve_linear(sub.dumat, sub.drmat, vois, mode=mode, solver=solver)
+        finally:
+            if not sub._jacobian_changed:
+                self._factored[sub.name] = key
+            sub._jacobian_changed = changed
+
+    def print_all_convergence(self, level=2):
+        """ Turns on iprint for this solver. The block solvers never print.
+
+        Args
+        ----
+        level : int(2)
+            iprint level. Set to 2 to print residuals each iteration; set to 1
+            to print just the iteration totals.
+        """
+        self.options['iprint'] = level
@@ -6,6 +6,7 @@ from collections import OrderedDict
 
 import numpy as np
 from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu, spsolve
 
 from openmdao.solvers.solver_base import MultLinearSolver
 
@@ -32,6 +33,13 @@ class DirectSolver(MultLinearSolver):
     options['solve_method'] : str('LU')
         Solution method, either 'solve' for linalg.solve, or 'LU' for
         linalg.lu_factor and linalg.lu_solve.
+    options['jacobian_format'] : str('dense')
+        Storage format for the Jacobian. Select 'dense' to assemble an ndarray.
+        Select 'csc' to assemble a scipy.sparse csc_matrix, which is factored
+        with scipy.sparse.linalg.splu (or solved with spsolve). When the
+        Jacobian is assembled, its nonzero layout and the fill-reducing
+        column ordering from the first factorization are kept, so later
+        linearizations only refill values and refactor numerically.
     """
 
     def __init__(self):
@@ -53,10 +61,19 @@ class DirectSolver(MultLinearSolver):
         self.options.add_option('solve_method', 'LU', values=['LU', 'solve'],
                                 desc="Solution method, either 'solve' for linalg.solve, " +
                                 "or 'LU' for linalg.lu_factor and linalg.lu_solve.")
+        self.options.add_option('jacobian_format', 'dense', values=['dense', 'csc'],
+                                desc="Storage format for the Jacobian. Select " +
+                                "'dense' to assemble an ndarray. Select 'csc' " +
+                                "to assemble a scipy.sparse csc_matrix, which " +
+                                "is factored with scipy.sparse.linalg.splu (or " +
+                                "solved with spsolve).")
+
+        self.supports['multi_rhs'] = True
 
         self.jacobian = None
         self.lup = None
         self.mode = None
+        self.col_perm = None
 
     def setup(self, system):
         """ Initialization. Allocate Jacobian and set up some helpers.
@@ -71,15 +88,21 @@ class DirectSolver(MultLinearSolver):
         if self.options['jacobian_method'] == 'MVP':
             return
 
+        # Clear the index cache and the sparse layout
+        system._icache = {}
+        system._jac_pattern = None
+
+        # The sparse Jacobian is allocated during assembly.
+        if self.options['jacobian_format'] == 'csc':
+            self.jacobian = None
+            return
+
         # Note, we solve a slightly modified version of the unified
         # derivatives equations in OpenMDAO.
         # (dR/du) * (du/dr) = -I
         u_vec = system.unknowns
         self.jacobian = -np.eye(u_vec.vec.size)
 
-        # Clear the index cache
-        system._icache = {}
-
     def solve(self, rhs_mat, system, mode):
         """ Solves the linear system for the problem in self.system. The
         full solution vector is returned.
@@ -89,7 +112,8 @@ class DirectSolver(MultLinearSolver):
         rhs_mat : dict of ndarray
             Dictionary containing one ndarry per top level quantity of
             interest. Each array contains the right-hand side for the linear
-            solve.
+            solve, or a 2D array with one right-hand side per column, which
+            are all solved with the same factorization.
 
         system : `System`
             Parent `System` object.
@@ -108,6 +132,8 @@ class DirectSolver(MultLinearSolver):
             self.mode = mode
 
         sol_buf = OrderedDict()
+        sparse = self.options['jacobian_format'] == 'csc'
+        use_lu = self.options['solve_method'] == 'LU'
 
         for voi, rhs in rhs_mat.items():
             self.voi = None
@@ -120,15 +146,31 @@ class DirectSolver(MultLinearSolver):
                     self.setup(system)
                 self.mode = mode
 
+                fmt = self.options['jacobian_format']
                 self.jacobian, _ = system.assemble_jacobian(mode=mode, method=method,
-                                                            mult=self.mult)
+                                                            mult=self.mult,
+                                                            jacobian_format=fmt)
                 system._jacobian_changed = False
 
-                if self.options['solve_method'] == 'LU':
-                    self.lup = lu_factor(self.jacobian)
-
-            if self.options['solve_method'] == 'LU':
-                deriv = lu_solve(self.lup, rhs)
+                # Column ordering of the assembled sparse Jacobian, if any.
+                self.col_perm = None
+                if sparse and method == 'assemble':
+                    self.col_perm = system._jac_pattern.col_perm
+
+                if use_lu:
+                    if sparse:
+                        self.lup = self._sparse_factor(system)
+                    else:
+                        self.lup = lu_factor(self.jacobian)
+
+            if use_lu:
+                if sparse:
+                    deriv = self._unpermute(self.lup.solve(rhs))
+                else:
+                    deriv = lu_solve(self.lup, rhs)
+            elif sparse:
+                deriv = spsolve(self.jacobian, rhs).reshape(rhs.shape)
+                deriv = self._unpermute(deriv)
             else:
                 deriv = np.linalg.solve(self.jacobian, rhs)
 
@@ -137,3 +179,47 @@ class DirectSolver(MultLinearSolver):
 
         return sol_buf
 
+    def _sparse_factor(self, system):
+        """ Factors the sparse Jacobian. The fill-reducing column ordering
+        found by the first factorization is stored in the Jacobian's layout,
+        which then assembles the already permuted matrix, so later
+        factorizations skip the ordering step.
+
+        Args
+        ----
+        system : `System`
+            Parent `System` object.
+
+        Returns
+        -------
+        SuperLU : Factorized Jacobian.
+        """
+        if self.col_perm is not None:
+            return splu(self.jacobian, permc_spec='NATURAL')
+
+        lup = splu(self.jacobian)
+
+        if self.options['jacobian_method'] == 'assemble':
+            system._jac_pattern.permute_columns(np.argsort(lup.perm_c))
+
+        return lup
+
+    def _unpermute(self, sol):
+        """ Undoes the column permutation of the assembled Jacobian on a
+        solution vector.
+
+        Args
+        ----
+        sol : ndarray
+            Solution of the (possibly column-permuted) linear system.
+
+        Returns
+        -------
+        ndarray : Solution of the original linear system.
+        """
+        if self.col_perm is None:
+            return sol
+
+        deriv = np.empty(sol.shape)
+        deriv[self.col_perm] = sol
+        return deriv
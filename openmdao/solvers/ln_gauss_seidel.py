@@ -152,7 +152,7 @@ class LinearGaussSeidel(LinearSolver):
                         dpmat[voi].vec[:] = 0.0
 
                     with sub._dircontext:
-                        sub.solve_linear(sub.dumat, sub.drmat, vois, mode=mode)
+                        self._solve_sub(sub, vois, mode)
 
                     # for voi in vois:
                     #    print('post solve', dpmat[voi].vec, dumat[voi].vec, drmat[voi].vec)
@@ -185,7 +185,7 @@ class LinearGaussSeidel(LinearSolver):
                         continue
 
                     with sub._dircontext:
-                        sub.solve_linear(sub.dumat, sub.drmat, vois, mode=mode)
+                        self._solve_sub(sub, vois, mode)
                     #for voi in vois:
                         #print('post solve', dpmat[voi].vec, dumat[voi].vec, drmat[voi].vec)
 
@@ -203,11 +203,14 @@ class LinearGaussSeidel(LinearSolver):
                     sol_buf[voi] = drmat[voi].vec
 
             self.iter_count += 1
+            self.matvec_count += 1
             if maxiter == 1:
                 f_norm = 0.0
             else:
                 f_norm = self._norm(system, mode, rhs_mat)
 
+            self._log_norm(system, self.iter_count, f_norm)
+
             if iprint == 2:
                 self.print_norm(self.print_name, system, self.iter_count,
                                 f_norm, f_norm0, indent=1, solver='LN')
@@ -235,6 +238,22 @@ class LinearGaussSeidel(LinearSolver):
 
         return sol_buf
 
+    def _solve_sub(self, sub, vois, mode):
+        """ Solves the diagonal block of one subsystem during a sweep.
+
+        Args
+        ----
+        sub : `System`
+            Subsystem to solve.
+
+        vois: list of strings
+            List of all quantities of interest to key into the mats.
+
+        mode : string
+            Derivative mode, can be 'fwd' or 'rev'.
+        """
+        sub.solve_linear(sub.dumat, sub.drmat, vois, mode=mode)
+
     def _norm(self, system, mode, rhs_mat):
         """ Computes the norm of the linear residual
 
@@ -256,6 +275,7 @@ class LinearGaussSeidel(LinearSolver):
         # identical to gs_outputs in the vois we care about, so just use it.
         system._sys_apply_linear(mode, system._do_apply, vois=rhs_mat.keys(),
                                 gs_outputs=system.dumat)
+        self.matvec_count += 1
 
         if mode == 'fwd':
             rhs_vec = system.drmat
@@ -1,8 +1,10 @@
 """ Non-linear solver that implements a Newton's method."""
 
 from math import isnan
+import warnings
 
 import numpy as np
+from scipy.sparse.linalg import gmres, LinearOperator
 
 from openmdao.core.system import AnalysisError
 from openmdao.solvers.solver_base import error_wrap_nl, NonLinearSolver
@@ -29,8 +31,24 @@ class Newton(NonLinearSolver):
         Set to 0 to print only failures, set to 1 to print iteration totals to
         stdout, set to 2 to print the residual each iteration to stdout,
         or -1 to suppress all printing.
+    options['jacobian_lag'] :  int(1)
+        Maximum number of iterations that use the same linearization. Set to 1
+        to linearize the model on every iteration.
+    options['lag_rate'] :  float(0.5)
+        A lagged linearization is replaced early if an iteration reduces the
+        residual norm by less than this factor.
+    options['matrix_free'] :  bool(False)
+        Set to True to solve for the Newton step with GMRES, using differences
+        of residuals from apply_nonlinear for the Jacobian-vector products
+        instead of linearizing the model.
     options['maxiter'] :  int(20)
         Maximum number of iterations.
+    options['mf_rtol'] :  float(1e-08)
+        Relative tolerance of the GMRES solve for the matrix-free Newton step.
+        If that solve fails, a warning is issued, or an AnalysisError is raised
+        if 'err_on_maxiter' is True.
+    options['mf_step'] :  float(1e-07)
+        Relative step size used to difference the residuals in matrix-free mode.
     options['rtol'] :  float(1e-10)
         Relative convergence tolerance on the residual.
     options['solve_subsystems'] :  bool(True)
@@ -58,6 +76,27 @@ class Newton(NonLinearSolver):
                        desc='Initial over-relaxation factor.')
         opt.add_option('solve_subsystems', True,
                        desc='Set to True to solve subsystems. You may need this for solvers nested under Newton.')
+        opt.add_option('jacobian_lag', 1, lower=1,
+                       desc='Maximum number of iterations that use the same '
+                       'linearization. Set to 1 to linearize the model on every '
+                       'iteration.')
+        opt.add_option('lag_rate', 0.5, lower=0.0,
+                       desc='A lagged linearization is replaced early if an '
+                       'iteration reduces the residual norm by less than this '
+                       'factor.')
+        opt.add_option('matrix_free', False,
+                       desc='Set to True to solve for the Newton step with GMRES, '
+                       'using differences of residuals from apply_nonlinear for '
+                       'the Jacobian-vector products instead of linearizing the '
+                       'model.')
+        opt.add_option('mf_step', 1e-7, lower=0.0,
+                       desc='Relative step size used to difference the residuals '
+                       'in matrix-free mode.')
+        opt.add_option('mf_rtol', 1e-8, lower=0.0,
+                       desc='Relative tolerance of the GMRES solve for the '
+                       'matrix-free Newton step. If that solve fails, a warning '
+                       "is issued, or an AnalysisError is raised if "
+                       "'err_on_maxiter' is True.")
 
         self.print_name = 'NEWTON'
 
@@ -71,6 +110,9 @@ class Newton(NonLinearSolver):
         # We need local relevancy for Newton sub-solves
         self.rel_inputs = None
 
+        # Number of times the model was linearized in the last solve.
+        self.linearize_count = 0
+
     def setup(self, sub):
         """ Initialize sub solvers.
 
@@ -142,11 +184,15 @@ class Newton(NonLinearSolver):
         maxiter = self.options['maxiter']
         alpha_scalar = self.options['alpha']
         iprint = self.options['iprint']
+        jacobian_lag = self.options['jacobian_lag']
+        lag_rate = self.options['lag_rate']
+        matrix_free = self.options['matrix_free']
         ls = self.line_search
         unknowns_cache = self.unknowns_cache
 
         # Metadata setup
         self.iter_count = 0
+        self.linearize_count = 0
         local_meta = create_local_meta(metadata, system.pathname)
         if self.ln_solver:
             self.ln_solver.local_meta = local_meta
@@ -164,6 +210,8 @@ class Newton(NonLinearSolver):
         f_norm = resids.norm()
         f_norm0 = f_norm
 
+        self._log_norm(system, 0, f_norm)
+
         if iprint == 2:
             self.print_norm(self.print_name, system, 0, f_norm,
                             f_norm0)
@@ -172,6 +220,11 @@ class Newton(NonLinearSolver):
         result = system.dumat[None]
         u_norm = 1.0e99
 
+        # Iterations since the last linearization. Starting at the lag forces
+        # a linearization on the first iteration.
+        n_lagged = jacobian_lag
+        f_norm_prev = f_norm
+
         # Can't have the system trying to FD itself when it also contains Newton.
         save_type = system.deriv_options['type']
         system.deriv_options.locked = False
@@ -180,15 +233,28 @@ class Newton(NonLinearSolver):
         while self.iter_count < maxiter and f_norm > atol and \
                 f_norm/f_norm0 > rtol and u_norm > utol:
 
-            # Linearize Model with partial derivatives
-            system._sys_linearize(params, unknowns, resids, total_derivs=False)
-
-            # Calculate direction to take step
-            arg.vec[:] = -resids.vec
-            with system._dircontext:
-                system.solve_linear(system.dumat, system.drmat,
-                                    [None], mode='fwd', solver=self.ln_solver,
-                                    rel_inputs=self.rel_inputs)
+            if matrix_free:
+                with system._dircontext:
+                    result.vec[:] = self._matrix_free_step(params, unknowns,
+                                                           resids, system)
+
+            else:
+                # Linearize Model with partial derivatives, unless the last
+                # linearization is still good enough.
+                if n_lagged >= jacobian_lag or f_norm > lag_rate*f_norm_prev:
+                    system._sys_linearize(params, unknowns, resids, total_derivs=False)
+                    self.linearize_count += 1
+                    n_lagged = 0
+                n_lagged += 1
+
+                # Calculate direction to take step
+                arg.vec[:] = -resids.vec
+                with system._dircontext:
+                    system.solve_linear(system.dumat, system.drmat,
+                                        [None], mode='fwd', solver=self.ln_solver,
+                                        rel_inputs=self.rel_inputs)
+
+            f_norm_prev = f_norm
 
             # Keeping this commented-out line here. This was a brute-force
             # fix to a problem with subsystem linear solvers being corrupted
@@ -241,6 +307,7 @@ class Newton(NonLinearSolver):
                                   alpha_scalar, alpha, base_u, base_norm,
                                   f_norm, f_norm0, metadata)
 
+            self._log_norm(system, self.iter_count, f_norm)
 
         # Final residual print if you only want the last one
         if iprint == 1:
@@ -267,6 +334,83 @@ class Newton(NonLinearSolver):
             raise AnalysisError("Solve in '%s': Newton %s" % (system.pathname,
                                                               msg))
 
+    def _matrix_free_step(self, params, unknowns, resids, system):
+        """ Solves for the Newton step with GMRES, approximating each product
+        of the Jacobian with a vector by a forward difference of the
+        residuals along that vector.
+
+        Args
+        ----
+        params : `VecWrapper`
+            `VecWrapper` containing parameters. (p)
+
+        unknowns : `VecWrapper`
+            `VecWrapper` containing outputs and states. (u)
+
+        resids : `VecWrapper`
+            `VecWrapper` containing residuals. (r)
+
+        system : `System`
+            Parent `System` object.
+
+        Returns
+        -------
+        ndarray
+            The Newton step.
+        """
+        u_vec = unknowns.vec
+        r_vec = resids.vec
+        u_base = u_vec.copy()
+        step = self.options['mf_step'] * (1.0 + np.linalg.norm(u_base))
+
+        # Explicit components normally skip apply_nonlinear, but every
+        # residual has to be differenced here.
+        run_apply = [(sub, sub._run_apply) for sub in
+                     system.subsystems(recurse=True, local=True)]
+        for sub, _ in run_apply:
+            sub._run_apply = True
+
+        def matvec(vec):
+            vec_norm = np.linalg.norm(vec)
+            if vec_norm == 0.0:
+                return np.zeros(len(vec))
+
+            delta = step / vec_norm
+            u_vec[:] = u_base + delta*vec
+            system.apply_nonlinear(params, unknowns, resids)
+
+            return (r_vec - r_base) / delta
+
+        try:
+            system.apply_nonlinear(params, unknowns, resids)
+            r_base = r_vec.copy()
+
+            n_edge = len(u_vec)
+            A = LinearOperator((n_edge, n_edge), matvec=matvec, dtype=float)
+            du, info = gmres(A, -r_base, tol=self.options['mf_rtol'])
+
+        finally:
+            for sub, flag in run_apply:
+                sub._run_apply = flag
+
+            u_vec[:] = u_base
+
+        r_vec[:] = r_base
+
+        if info != 0:
+            if info > 0:
+                msg = 'FAILED to converge after %d iterations' % info
+            else:
+                msg = 'broke down'
+            msg = "Solve in '%s': Newton matrix-free GMRES %s" % \
+                  (system.pathname, msg)
+
+            if self.options['err_on_maxiter']:
+                raise AnalysisError(msg)
+            warnings.warn(msg, RuntimeWarning)
+
+        return du
+
     def print_all_convergence(self, level=2):
         """ Turns on iprint for this solver and all subsolvers. Override if
         your solver has subsolvers.
@@ -1,11 +1,14 @@
 """ Gauss Seidel non-linear solver."""
 
 from math import isnan
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
-from openmdao.core.system import AnalysisError
+from openmdao.core.mpi_wrap import MPI
+from openmdao.core.system import AnalysisError, _DummyContext
 from openmdao.solvers.solver_base import error_wrap_nl, NonLinearSolver
+from openmdao.util.options import _print_deprecation
 from openmdao.util.record_util import update_local_meta, create_local_meta
 
 
@@ -17,6 +20,9 @@ class NLGaussSeidel(NonLinearSolver):
 
     Options
     -------
+    options['acceleration'] :  NoneType(None)
+        Acceleration of the fixed point iteration: None, 'aitken' or
+        'anderson'.
     options['atol'] :  float(1e-06)
         Absolute convergence tolerance.
     options['err_on_maxiter'] : bool(False)
@@ -29,14 +35,23 @@ class NLGaussSeidel(NonLinearSolver):
         Maximum number of iterations.
     options['rtol'] :  float(1e-06)
         Relative convergence tolerance.
+    options['threads'] :  int(1)
+        Number of threads used to run independent subsystems at the same
+        time. Only worthwhile when they release the GIL, for example in
+        numpy or while waiting on an external code. Not used under MPI.
     options['utol'] :  float(1e-12)
         Convergence tolerance on the change in the unknowns.
     options['use_aitken'] : bool(False)
-        Set to True to use Aitken acceleration.
+        Deprecated. Set acceleration to 'aitken' instead.
     options['aitken_alpha_min'] : float(0.25)
         Lower limit for Aitken relaxation factor.
     options['aitken_alpha_max'] : float(2.0)
         Upper limit for Aitken relaxation factor.
+    options['anderson_depth'] : int(5)
+        Number of previous iterations used by Anderson acceleration.
+    options['anderson_beta'] : float(1.0)
+        Mixing factor for Anderson acceleration. Values below 1.0 damp the
+        update.
 
     """
 
@@ -44,6 +59,10 @@ class NLGaussSeidel(NonLinearSolver):
         super(NLGaussSeidel, self).__init__()
 
         opt = self.options
+        opt.add_option('acceleration', None,
+                       values=[None, 'aitken', 'anderson'],
+                       desc="Acceleration of the fixed point iteration: None, "
+                       "'aitken' or 'anderson'.")
         opt.add_option('atol', 1e-6, lower=0.0,
                        desc='Absolute convergence tolerance.')
         opt.add_option('rtol', 1e-6, lower=0.0,
@@ -53,16 +72,44 @@ class NLGaussSeidel(NonLinearSolver):
         opt.add_option('maxiter', 100, lower=0,
                        desc='Maximum number of iterations.')
         opt.add_option('use_aitken', False,
-                       desc='Set to True to use Aitken acceleration.')
+                       desc="Deprecated. Set acceleration to 'aitken' instead.")
         opt.add_option('aitken_alpha_min', 0.25,
                        desc='Lower limit for Aitken relaxation factor.')
         opt.add_option('aitken_alpha_max', 2.0,
                        desc='Upper limit for Aitken relaxation factor.')
+        opt.add_option('anderson_depth', 5, lower=1,
+                       desc='Number of previous iterations used by Anderson '
+                       'acceleration.')
+        opt.add_option('anderson_beta', 1.0, lower=0.0,
+                       desc='Mixing factor for Anderson acceleration. Values '
+                       'below 1.0 damp the update.')
+        opt.add_option('threads', 1, lower=1,
+                       desc='Number of threads used to run independent '
+                       'subsystems at the same time. Only worthwhile when they '
+                       'release the GIL, for example in numpy or while waiting '
+                       'on an external code. Not used under MPI.')
 
         self.print_name = 'NLN_GS'
         self.delta_u_n_1 = 'None' # delta_u_n-1 for Aitken acc.
         self.aitken_alpha = 1.0 # Initial Aitken relaxation factor 
 
+        # Ring buffers of the changes in the iterates and in the fixed point
+        # residuals for Anderson acc.
+        self._anderson_dg = None
+        self._anderson_df = None
+
+        # Thread pool for the subsystems of each level, and its number of
+        # threads. It is closed in setup and cleanup.
+        self._pool = None
+        self._pool_threads = 0
+
+    def __getstate__(self):
+        """ Returns state as a dict, without the thread pool."""
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        state['_pool_threads'] = 0
+        return state
+
     def setup(self, sub):
         """ Initialize this solver.
 
@@ -71,9 +118,41 @@ class NLGaussSeidel(NonLinearSolver):
         sub: `System`
             System that owns this solver.
         """
+        self._close_pool()
+
+        if self.options['use_aitken']:
+            _print_deprecation('use_aitken', 'acceleration')
+        self._get_acceleration()
+
         if sub.is_active():
             self.unknowns_cache = np.empty(sub.unknowns.vec.shape)
 
+    def cleanup(self):
+        """ Clean up resources prior to exit. """
+        self._close_pool()
+        super(NLGaussSeidel, self).cleanup()
+
+    def _get_acceleration(self):
+        """ Returns the acceleration, which is 'aitken' if the deprecated
+        use_aitken option is set."""
+        acceleration = self.options['acceleration']
+
+        if self.options['use_aitken']:
+            if acceleration not in (None, 'aitken'):
+                raise ValueError("Options 'use_aitken' and acceleration='%s' "
+                                 "can't be used together." % acceleration)
+            return 'aitken'
+
+        return acceleration
+
+    def _close_pool(self):
+        """ Stops the threads of the pool, if there is one. """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_threads = 0
+
     @error_wrap_nl
     def solve(self, params, unknowns, resids, system, metadata=None):
         """ Solves the system using Gauss Seidel.
@@ -112,7 +191,7 @@ class NLGaussSeidel(NonLinearSolver):
         update_local_meta(local_meta, (self.iter_count,))
 
         # Initial Solve
-        system.children_solve_nonlinear(local_meta)
+        self._children_solve(system, local_meta)
 
         self.recorders.record_iteration(system, local_meta)
 
@@ -123,12 +202,18 @@ class NLGaussSeidel(NonLinearSolver):
         resids = system.resids
         unknowns_cache = np.zeros(unknowns.vec.shape)
 
+        acceleration = self._get_acceleration()
+        if acceleration == 'anderson':
+            self._anderson_start(len(unknowns.vec))
+
         # Evaluate Norm
         system.apply_nonlinear(params, unknowns, resids)
         normval = resids.norm()
         basenorm = normval if normval > atol else 1.0
         u_norm = 1.0e99
 
+        self._log_norm(system, 1, normval)
+
         if iprint == 2:
             self.print_norm(self.print_name, system, 1, normval, basenorm)
 
@@ -143,7 +228,7 @@ class NLGaussSeidel(NonLinearSolver):
             unknowns_cache[:] = unknowns.vec
 
             # Runs an iteration
-            system.children_solve_nonlinear(local_meta)
+            self._children_solve(system, local_meta)
             self.recorders.record_iteration(system, local_meta)
 
             # Evaluate Norm
@@ -151,7 +236,7 @@ class NLGaussSeidel(NonLinearSolver):
             normval = resids.norm()
             u_norm = np.linalg.norm(unknowns.vec - unknowns_cache)
 
-            if self.options['use_aitken']: # If Aitken acceleration is enabled
+            if acceleration == 'aitken': # If Aitken acceleration is enabled
                 
                 # This method is used by Kenway et al. in "Scalable Parallel  
                 # Approach for High-Fidelity Steady-State Aeroelastic Analysis 
@@ -191,6 +276,12 @@ class NLGaussSeidel(NonLinearSolver):
                     # by the following vector
                     self.delta_u_n_1 = unknowns.vec - unknowns_cache 
 
+            elif acceleration == 'anderson' and normval > atol and \
+                    normval/basenorm > rtol and u_norm > utol:
+                unknowns.vec[:] = self._anderson_mix(unknowns_cache, unknowns.vec)
+
+            self._log_norm(system, self.iter_count, normval)
+
             if iprint == 2:
                 self.print_norm(self.print_name, system, self.iter_count, normval,
                                 basenorm, u_norm=u_norm)
@@ -216,3 +307,106 @@ class NLGaussSeidel(NonLinearSolver):
         if fail and self.options['err_on_maxiter']:
             raise AnalysisError("Solve in '%s': NLGaussSeidel %s" %
                                 (system.pathname, msg))
+
+    def _children_solve(self, system, metadata):
+        """ Runs one sweep over the subsystems. With more than one thread,
+        the subsystems of each level from `Group._get_sys_levels` are
+        solved at the same time, after the params of the whole level have
+        been transferred.
+
+        Args
+        ----
+        system : `System`
+            Parent `System` object.
+
+        metadata : dict
+            Dictionary containing execution metadata (e.g. iteration coordinate).
+        """
+        threads = self.options['threads']
+        if threads < 2 or MPI:
+            system.children_solve_nonlinear(metadata)
+            return
+
+        if self._pool is None or self._pool_threads != threads:
+            self._close_pool()
+            self._pool = ThreadPool(threads)
+            self._pool_threads = threads
+
+        def solve_sub(sub):
+            system._solve_subsystem(sub, metadata)
+
+        for level in system._get_sys_levels():
+            for sub in level:
+                system._transfer_data(sub.name)
+
+            subs = [sub for sub in level if sub.is_active()]
+
+            # Changing directory affects every thread.
+            if len(subs) > 1 and \
+               all(isinstance(s._dircontext, _DummyContext)
+                   for sub in subs
+                   for s in sub.subsystems(recurse=True, include_self=True)):
+                self._pool.map(solve_sub, subs, chunksize=1)
+            else:
+                for sub in subs:
+                    solve_sub(sub)
+
+    def _anderson_start(self, size):
+        """ Clears the Anderson acceleration history.
+
+        Args
+        ----
+        size : int
+            Size of the unknowns vector.
+        """
+        depth = self.options['anderson_depth']
+        if self._anderson_dg is None or self._anderson_dg.shape != (size, depth):
+            self._anderson_dg = np.empty((size, depth))
+            self._anderson_df = np.empty((size, depth))
+
+        self._anderson_count = 0
+        self._anderson_g = None
+        self._anderson_f = None
+
+    def _anderson_mix(self, u_in, g):
+        """ Computes the next iterate with Anderson acceleration, which
+        combines the last iterations so that the fixed point residual
+        g(u) - u is minimized in the least squares sense.
+
+        Args
+        ----
+        u_in : ndarray
+            Unknowns at the start of the last iteration.
+
+        g : ndarray
+            Unknowns at the end of the last iteration.
+
+        Returns
+        -------
+        ndarray
+            The next iterate.
+        """
+        beta = self.options['anderson_beta']
+        dg = self._anderson_dg
+        df = self._anderson_df
+        depth = dg.shape[1]
+
+        f = g - u_in
+
+        if self._anderson_f is not None:
+            # Oldest entries are overwritten once the buffers are full.
+            col = self._anderson_count % depth
+            dg[:, col] = g - self._anderson_g
+            df[:, col] = f - self._anderson_f
+            self._anderson_count += 1
+
+        self._anderson_g = g.copy()
+        self._anderson_f = f
+
+        ncols = min(self._anderson_count, depth)
+        if ncols == 0:
+            return u_in + beta*f
+
+        gamma = np.linalg.lstsq(df[:, :ncols], f, rcond=-1)[0]
+
+        return g - (1.0 - beta)*f - (dg[:, :ncols] - (1.0 - beta)*df[:, :ncols]).dot(gamma)
@@ -106,6 +106,7 @@ class Monitor(object):
 
         ksp = self._ksp
         ksp.iter_count += 1
+        ksp._log_norm(ksp.system, ksp.iter_count, norm)
 
         if ksp.options['iprint'] == 2:
             ksp.print_norm(ksp.print_name, ksp.system, ksp.iter_count,
@@ -330,6 +331,7 @@ class PetscKSP(LinearSolver):
 
         system = self.system
         mode = self.mode
+        self.matvec_count += 1
 
         voi = self.voi
         if mode == 'fwd':
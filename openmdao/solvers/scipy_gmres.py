@@ -5,7 +5,7 @@ from __future__ import print_function
 from six import iteritems
 
 import numpy as np
-from scipy.sparse.linalg import gmres, LinearOperator
+from scipy.sparse.linalg import gmres, gcrotmk, LinearOperator
 
 from openmdao.core.system import AnalysisError
 from openmdao.solvers.solver_base import MultLinearSolver
@@ -32,9 +32,17 @@ class ScipyGMRES(MultLinearSolver):
     options['mode'] :  str('auto')
         Derivative calculation mode, set to 'fwd' for forward mode, 'rev' for reverse
         mode, or 'auto' to let OpenMDAO determine the best mode.
+    options['recycle'] :  int(0)
+        Number of Krylov vectors kept between solves for the same variable of
+        interest and mode. If greater than 0, scipy's GCROT(m,k) is used instead
+        of GMRES, and iter_count counts matrix-vector products.
     options['restart'] :  int(20)
         Number of iterations between restarts. Larger values increase iteration cost,
         but may be necessary for convergence
+    options['warm_start'] :  bool(False)
+        Set to True to start each solve from the previous solution for the
+        same variable of interest and mode, if its right-hand side had the
+        same nonzero pattern. Only the previous solution is kept.
     """
 
     def __init__(self):
@@ -53,6 +61,16 @@ class ScipyGMRES(MultLinearSolver):
                        desc='Number of iterations between restarts. Larger values ' +
                        'increase iteration cost, but may be necessary for convergence',
                        lock_on_setup=True)
+        opt.add_option('recycle', 0, lower=0,
+                       desc='Number of Krylov vectors kept between solves for the '
+                       'same variable of interest and mode. If greater than 0, '
+                       "scipy's GCROT(m,k) is used instead of GMRES, and "
+                       'iter_count counts matrix-vector products.')
+        opt.add_option('warm_start', False,
+                       desc='Set to True to start each solve from the previous '
+                       'solution for the same variable of interest and mode, '
+                       'if its right-hand side had the same nonzero pattern. '
+                       'Only the previous solution is kept.')
 
         # These are defined whenever we call solve to provide info we need in
         # the callback.
@@ -67,6 +85,13 @@ class ScipyGMRES(MultLinearSolver):
         # User can specify another linear solver to use as a preconditioner
         self.preconditioner = None
 
+        self.supports['multi_rhs'] = True
+
+        # Recycled subspaces, and the previous solution with the nonzero
+        # pattern of its rhs, keyed on (voi, mode).
+        self._recycled = {}
+        self._last_sol = {}
+
     def setup(self, sub):
         """ Initialize sub solvers.
 
@@ -75,6 +100,9 @@ class ScipyGMRES(MultLinearSolver):
         sub: `System`
             System that owns this solver.
         """
+        self._recycled = {}
+        self._last_sol = {}
+
         if self.preconditioner:
             self.preconditioner.setup(sub)
 
@@ -101,7 +129,8 @@ class ScipyGMRES(MultLinearSolver):
         rhs_mat : dict of ndarray
             Dictionary containing one ndarry per top level quantity of
             interest. Each array contains the right-hand side for the linear
-            solve.
+            solve, or a 2D array with one right-hand side per column, which
+            are solved together with block GMRES.
 
         system : `System`
             Parent `System` object.
@@ -121,30 +150,44 @@ class ScipyGMRES(MultLinearSolver):
         unknowns_mat = OrderedDict()
         for voi, rhs in iteritems(rhs_mat):
 
-            # Scipy can only handle one right-hand-side at a time.
             self.voi = voi
+            self.system = system
+            self.iter_count = 0
 
-            n_edge = len(rhs)
-            A = LinearOperator((n_edge, n_edge),
-                               matvec=self.mult,
-                               dtype=float)
+            x0 = None
+            if options['warm_start']:
+                pattern = (rhs.shape, np.flatnonzero(rhs).tobytes())
+                last = self._last_sol.get((voi, mode))
+                if last is not None and last[0] == pattern:
+                    x0 = last[1]
+
+            if options['recycle'] > 0:
+                if rhs.ndim == 2:
+                    d_unknowns = np.empty(rhs.shape)
+                    info = 0
+                    for j in range(rhs.shape[1]):
+                        d_unknowns[:, j], jinfo = \
+                            self._recycled_solve(rhs[:, j],
+                                                 None if x0 is None else x0[:, j])
+                        info = max(info, jinfo)
+                else:
+                    d_unknowns, info = self._recycled_solve(rhs, x0)
+
+            # Scipy can only handle one right-hand-side at a time, so we use
+            # our own block GMRES for multiple right-hand sides.
+            elif rhs.ndim == 2 and rhs.shape[1] > 1:
+                d_unknowns, info = self._block_gmres(rhs, x0)
+
+            elif rhs.ndim == 2:
+                d_unknowns, info = self._gmres(rhs[:, 0],
+                                               None if x0 is None else x0[:, 0])
+                d_unknowns = d_unknowns.reshape(rhs.shape)
 
-            # Support a preconditioner
-            if self.preconditioner:
-                M = LinearOperator((n_edge, n_edge),
-                                   matvec=self._precon,
-                                   dtype=float)
             else:
-                M = None
+                d_unknowns, info = self._gmres(rhs, x0)
 
-            # Call GMRES to solve the linear system
-            self.system = system
-            self.iter_count = 0
-            d_unknowns, info = gmres(A, rhs, M=M,
-                                     tol=options['atol'],
-                                     maxiter=options['maxiter'],
-                                     restart=options['restart'],
-                                     callback=self.monitor)
+            if options['warm_start']:
+                self._last_sol[voi, mode] = (pattern, d_unknowns.copy())
             self.system = None
 
             # Final residual print if you only want the last one
@@ -179,6 +222,229 @@ class ScipyGMRES(MultLinearSolver):
 
         return unknowns_mat
 
+    def _gmres(self, rhs, x0):
+        """ Solves for a single right-hand side with scipy's GMRES.
+
+        Args
+        ----
+        rhs : ndarray
+            Right-hand side.
+
+        x0 : ndarray or None
+            Initial guess.
+
+        Returns
+        -------
+        ndarray, int
+            The solution and the info flag returned by GMRES.
+        """
+        options = self.options
+        n_edge = len(rhs)
+        A = LinearOperator((n_edge, n_edge),
+                           matvec=self.mult,
+                           dtype=float)
+
+        # Support a preconditioner
+        if self.preconditioner:
+            M = LinearOperator((n_edge, n_edge),
+                               matvec=self._precon,
+                               dtype=float)
+        else:
+            M = None
+
+        # Call GMRES to solve the linear system
+        return gmres(A, rhs, x0=x0, M=M,
+                     tol=options['atol'],
+                     maxiter=options['maxiter'],
+                     restart=options['restart'],
+                     callback=self.monitor)
+
+    def _recycled_solve(self, rhs, x0):
+        """ Solves with GCROT(m,k), keeping the recycled vectors for the
+        next solve with the same voi and mode. When the model has been
+        linearized since, only the search directions are reused and their
+        products with the new operator are recomputed.
+
+        Args
+        ----
+        rhs : ndarray
+            Right-hand side.
+
+        x0 : ndarray or None
+            Initial guess.
+
+        Returns
+        -------
+        ndarray : Solution vector
+
+        int : Exit code from gcrotmk
+        """
+        system = self.system
+        options = self.options
+
+        lin_count = sum(s._linearize_count for s in
+                        system.subsystems(recurse=True, include_self=True))
+
+        key = (self.voi, self.mode)
+        try:
+            CU, old_count = self._recycled[key]
+        except KeyError:
+            CU = []
+        else:
+            if old_count != lin_count:
+                CU[:] = [(None, u) for c, u in CU]
+        self._recycled[key] = (CU, lin_count)
+
+        # gcrotmk keeps the products, and mult returns a view of our vector.
+        def matvec(arg):
+            self.iter_count += 1
+            return self.mult(arg).copy()
+
+        n_edge = len(rhs)
+        A = LinearOperator((n_edge, n_edge), matvec=matvec, dtype=float)
+
+        # Support a preconditioner
+        if self.preconditioner:
+            M = LinearOperator((n_edge, n_edge), matvec=self._precon,
+                               dtype=float)
+        else:
+            M = None
+
+        return gcrotmk(A, rhs, x0=x0, M=M, tol=options['atol'], atol=0.0,
+                       maxiter=options['maxiter'], m=options['restart'],
+                       k=options['recycle'], CU=CU)
+
+    def _block_gmres(self, rhs, x0=None):
+        """ Restarted block GMRES, which solves all columns of rhs in one
+        shared Krylov subspace. The preconditioner, if any, is applied from
+        the right. Like scipy's gmres, a column is converged when its residual
+        norm falls below options['atol'] times the norm of its right-hand
+        side.
+
+        Args
+        ----
+        rhs : ndarray
+            2D array with one right-hand side per column.
+
+        x0 : ndarray, optional
+            2D array with an initial guess for each column.
+
+        Returns
+        -------
+        ndarray
+            2D array with one solution per column.
+
+        int
+            0 if all columns converged, otherwise the number of iterations.
+        """
+        options = self.options
+        tol = options['atol']
+        maxiter = options['maxiter']
+        restart = max(options['restart'], 1)
+
+        n_edge, nrhs = rhs.shape
+
+        bnorm = np.linalg.norm(rhs, axis=0)
+        bnorm[bnorm == 0.0] = 1.0
+        limit = tol * bnorm
+
+        # Residual columns that still need work.
+        if x0 is None:
+            sol = np.zeros((n_edge, nrhs))
+            resid = rhs.copy()
+        else:
+            sol = x0.copy()
+            resid = rhs - self._block_apply(self.mult, sol)
+        active = np.flatnonzero(np.linalg.norm(resid, axis=0) > limit)
+
+        while len(active) > 0:
+            if self.iter_count >= maxiter:
+                return sol, self.iter_count
+
+            nact = len(active)
+            V, S = np.linalg.qr(resid[:, active])
+            basis = [V]
+            H = np.zeros(((restart+1)*nact, restart*nact))
+
+            for j in range(restart):
+                W = self._block_mult(basis[j])
+
+                # Block modified Gram-Schmidt
+                for i in range(j+1):
+                    Hij = basis[i].T.dot(W)
+                    H[i*nact:(i+1)*nact, j*nact:(j+1)*nact] = Hij
+                    W -= basis[i].dot(Hij)
+
+                V, Hn = np.linalg.qr(W)
+                H[(j+1)*nact:(j+2)*nact, j*nact:(j+1)*nact] = Hn
+                basis.append(V)
+
+                # Small least squares problem for the update coefficients.
+                Hj = H[:(j+2)*nact, :(j+1)*nact]
+                E = np.zeros(((j+2)*nact, nact))
+                E[:nact] = S
+                Y = np.linalg.lstsq(Hj, E, rcond=-1)[0]
+                res = np.linalg.norm(E - Hj.dot(Y), axis=0)
+                self.monitor(res)
+
+                # A (near) rank deficient block means the subspace is
+                # invariant, so we can't extend it.
+                breakdown = np.abs(np.diag(Hn)).min() <= 1e-14 * np.abs(S).max()
+
+                if breakdown or np.all(res <= limit[active]) or \
+                   self.iter_count >= maxiter:
+                    break
+
+            update = np.hstack(basis[:j+1]).dot(Y)
+            if self.preconditioner:
+                update = self._block_apply(self._precon, update)
+            sol[:, active] += update
+
+            # Restart from the true residual
+            resid[:, active] = rhs[:, active] - \
+                self._block_apply(self.mult, sol[:, active])
+            norms = np.linalg.norm(resid[:, active], axis=0)
+            active = active[norms > limit[active]]
+
+        return sol, 0
+
+    def _block_mult(self, V):
+        """ Applies the (right preconditioned) operator to each column of V.
+
+        Args
+        ----
+        V : ndarray
+            2D array of incoming vectors.
+
+        Returns
+        -------
+        ndarray : 2D array of results.
+        """
+        if self.preconditioner:
+            V = self._block_apply(self._precon, V)
+        return self._block_apply(self.mult, V)
+
+    def _block_apply(self, func, V):
+        """ Applies a vector callback to each column of V.
+
+        Args
+        ----
+        func : function
+            Callback that takes and returns a single vector.
+
+        V : ndarray
+            2D array of incoming vectors.
+
+        Returns
+        -------
+        ndarray : 2D array of results.
+        """
+        # Callbacks return views of system vectors, so copy each one.
+        result = np.empty(V.shape)
+        for j in range(V.shape[1]):
+            result[:, j] = func(V[:, j])
+        return result
+
     def _precon(self, arg):
         """ GMRES Callback: applies a preconditioner by calling
         solve_linear on this system's children.
@@ -245,7 +511,7 @@ class ScipyGMRES(MultLinearSolver):
         # every time monitor is called.
         self.iter_count += 1
 
-        if self.options['iprint'] > 0:
+        if self.options['iprint'] > 0 or self.history is not None:
             f_norm = np.linalg.norm(res)
             self._norm = f_norm
             if self.iter_count == 1:
@@ -254,6 +520,8 @@ class ScipyGMRES(MultLinearSolver):
                 else:
                     self._norm0 = 1.0
 
+            self._log_norm(self.system, self.iter_count, f_norm)
+
         if self.options['iprint'] == 2:
             self.print_norm(self.print_name, self.system, self.iter_count,
                             f_norm, self._norm0, indent=1, solver='LN')
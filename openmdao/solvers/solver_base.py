@@ -4,6 +4,7 @@ from __future__ import print_function
 
 from functools import wraps
 import sys
+import time
 from six import reraise
 
 import numpy as np
@@ -66,6 +67,65 @@ def error_wrap_nl(fn):
     return wrapper
 
 
+class ConvergenceHistory(object):
+    """ Preallocated ring buffer that keeps the last `size` iterations of a
+    solver. Each record holds the iteration number, the residual norm, the
+    wall time and the number of matrix-vector products done so far. Once
+    the buffer is full, the oldest records are overwritten.
+
+    Args
+    ----
+    size : int(1000)
+        Number of records kept.
+    """
+
+    dtype = np.dtype([('iteration', int), ('norm', float), ('time', float),
+                      ('matvecs', int)])
+
+    def __init__(self, size=1000):
+        self._data = np.zeros(size, dtype=self.dtype)
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, len(self._data))
+
+    def append(self, iteration, norm, matvecs):
+        """ Adds a record, overwriting the oldest one if the buffer is full.
+
+        Args
+        ----
+        iteration : int
+            Iteration number.
+
+        norm : float
+            Norm of the residual.
+
+        matvecs : int
+            Number of matrix-vector products done so far.
+        """
+        self._data[self.count % len(self._data)] = (iteration, norm, time.time(),
+                                                    matvecs)
+        self.count += 1
+
+    def get(self):
+        """
+        Returns
+        -------
+        ndarray
+            Structured array with the kept records, oldest first.
+        """
+        size = len(self._data)
+        if self.count <= size:
+            return self._data[:self.count].copy()
+
+        start = self.count % size
+        return np.concatenate((self._data[start:], self._data[:start]))
+
+    def clear(self):
+        """ Discards all records."""
+        self.count = 0
+
+
 class SolverBase(object):
     """ Common base class for Linear and Nonlinear solver. Should not be used
     by users. Always inherit from `LinearSolver` or `NonlinearSolver`."""
@@ -83,6 +143,45 @@ class SolverBase(object):
         self.recorders = RecordingManager()
         self.local_meta = None
 
+        # Convergence history, if requested, and the number of
+        # matrix-vector products done by this solver.
+        self.history = None
+        self.matvec_count = 0
+
+    def record_history(self, size=1000):
+        """ Keeps the iteration, residual norm, wall time and matrix-vector
+        product count of the last `size` iterations of this solver in
+        `self.history`, a `ConvergenceHistory`.
+
+        Args
+        ----
+        size : int(1000)
+            Number of iterations kept.
+        """
+        self.history = ConvergenceHistory(size)
+
+    def _log_norm(self, system, iteration, norm):
+        """ Adds an iteration to the convergence history, if there is one.
+
+        Args
+        ----
+        system: `System`
+            Parent system.
+
+        iteration: int
+            Current iteration number.
+
+        norm: float
+            Norm of the residual.
+        """
+        if self.history is not None:
+            self.history.append(iteration, norm, self._get_matvec_count(system))
+
+    def _get_matvec_count(self, system):
+        """ Number of matrix-vector products done for this solver.
+        """
+        return self.matvec_count
+
     def setup(self, sub):
         """ Solvers override to define post-setup initiailzation.
 
@@ -223,6 +322,10 @@ class LinearSolver(SolverBase):
         # Solver needs to communicate local relevancy into calls to sys_apply_linear.
         self.rel_inputs = None
 
+        # What this solver supports
+        self.supports = OptionsDictionary(read_only=True)
+        self.supports.add_option('multi_rhs', False)
+
     def add_recorder(self, recorder):
         """Appends the given recorder to this solver's list of recorders.
 
@@ -242,7 +345,8 @@ class LinearSolver(SolverBase):
         ----
         rhs : ndarray
             Array containing the right-hand side for the linear solve. Also
-            possibly a 2D array with multiple right-hand sides.
+            possibly a 2D array with multiple right-hand sides (one per
+            column), if the solver supports 'multi_rhs'.
 
         system : `System`
             Parent `System` object.
@@ -284,9 +388,21 @@ class MultLinearSolver(LinearSolver):
         else:
             sol_vec, rhs_vec = system.drmat[voi], system.dumat[voi]
 
+        self.matvec_count += 1
+
         # Set incoming vector
         sol_vec.vec[:] = arg
 
+        # A single product with the fused Jacobian, if the system has one.
+        if voi is None and not self.rel_inputs:
+            jac = system._fused_jacobian()
+            if jac is not None:
+                if mode == 'fwd':
+                    rhs_vec.vec[:] = jac.dot(arg)
+                else:
+                    rhs_vec.vec[:] = jac.T.dot(arg)
+                return rhs_vec.vec
+
         # Start with a clean slate
         rhs_vec.vec[:] = 0.0
         system.clear_dparams()
@@ -318,6 +434,13 @@ class NonLinearSolver(SolverBase):
         self.supports = OptionsDictionary(read_only=True)
         self.supports.add_option('uses_derivatives', False)
 
+    def _get_matvec_count(self, system):
+        """ Number of matrix-vector products done by the linear solver that
+        this solver uses.
+        """
+        ln_solver = getattr(self, 'ln_solver', None) or system.ln_solver
+        return ln_solver.matvec_count
+
     def add_recorder(self, recorder):
         """Appends the given recorder to this solver's list of recorders.
 
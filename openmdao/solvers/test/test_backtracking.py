@@ -8,6 +8,7 @@ import numpy as np
 from openmdao.api import Problem, Group, NonLinearSolver, IndepVarComp, \
                          Component, AnalysisError
 from openmdao.solvers.backtracking import BackTracking
+from openmdao.solvers.ln_direct import DirectSolver
 from openmdao.solvers.newton import Newton
 from openmdao.solvers.scipy_gmres import ScipyGMRES
 from openmdao.test.sellar import SellarStateConnection
@@ -52,6 +53,38 @@ class TrickyComp(Component):
         return J
 
 
+class CubicComp(Component):
+    """ A state that depends on x, for a subsystem solved by Newton."""
+
+    def __init__(self):
+        super(CubicComp, self).__init__()
+
+        self.add_param('x', 1.0)
+        self.add_state('z', 1.0)
+
+        self.eval_count = 0
+
+    def apply_nonlinear(self, params, unknowns, resids):
+        """ Don't solve; just calculate the residual."""
+
+        self.eval_count += 1
+        z = unknowns['z']
+        resids['z'] = z**3 + z - 5.0*params['x']
+
+    def solve_nonlinear(self, params, unknowns, resids):
+        """ The state is solved by the Newton of the parent group."""
+        pass
+
+    def linearize(self, params, unknowns, resids):
+        """Analytical derivatives."""
+
+        J = {}
+        J[('z', 'x')] = -5.0
+        J[('z', 'z')] = 3.0*unknowns['z']**2 + 1.0
+
+        return J
+
+
 class TestBackTracking(unittest.TestCase):
 
     def test_newton_with_backtracking(self):
@@ -76,6 +109,108 @@ class TestBackTracking(unittest.TestCase):
 
         assert_rel_error(self, top['comp.x'], .3968459, .0001)
 
+    def _tricky(self, **options):
+        top = Problem()
+        root = top.root = Group()
+        root.add('comp', TrickyComp())
+        root.add('p', IndepVarComp('y', 1.2278849186466743))
+        root.connect('p.y', 'comp.y')
+
+        root.nl_solver = Newton()
+        root.ln_solver = ScipyGMRES()
+        root.nl_solver.line_search = BackTracking()
+        root.nl_solver.line_search.options['maxiter'] = 100
+        for name, val in options.items():
+            root.nl_solver.line_search.options[name] = val
+        root.nl_solver.options['alpha'] = 10.0
+
+        top.setup(check=False)
+        top['comp.x'] = 1.0
+        return top
+
+    def test_newton_with_cubic_backtracking(self):
+        evals = []
+        for interp in ('none', 'cubic'):
+            top = self._tricky(interpolation=interp)
+            top.run()
+
+            assert_rel_error(self, top['comp.x'], .3968459, .0001)
+
+            newton = top.root.nl_solver
+            evals.append(newton.iter_count + newton.line_search.eval_count)
+
+        # Model evaluations for the Newton steps and the line searches.
+        self.assertLess(evals[1], evals[0])
+
+    def test_interpolate(self):
+        ls = BackTracking()
+
+        # Quadratic model of a residual that is linear along the step.
+        assert_rel_error(self, ls._interpolate(2.0, 0.2, 1.6, None, None), 0.1, 1e-12)
+
+        # Exact minimum of a cubic f, limited to [rho_min, rho] of the step.
+        f = lambda a: 2.0 - 4.0*a + 3.0*a**2 + a**3
+        fnorm = lambda a: np.sqrt(2.0*f(a))
+        amin = (-6.0 + np.sqrt(36.0 + 48.0))/6.0
+        assert_rel_error(self, ls._interpolate(2.0, 1.2, fnorm(1.2), 1.5, fnorm(1.5)),
+                         amin, 1e-12)
+        assert_rel_error(self, ls._interpolate(2.0, 1.0, fnorm(1.0), 1.5, fnorm(1.5)),
+                         0.5, 1e-12)
+
+    def test_cache_states(self):
+        # With c=1 no step is accepted, and the full step is the best one.
+        resids = []
+        for cache in (False, True):
+            top = self._tricky(maxiter=2, c=1.0, cache_states=cache)
+            top.root.nl_solver.options['alpha'] = 1.0
+            top.root.nl_solver.options['maxiter'] = 1
+            top.run()
+
+            self.assertEqual(top.root.nl_solver.line_search.iter_count, 2)
+            resids.append(top.root.resids['comp.x'])
+
+            # The residual matches the model at the final point.
+            top.root.apply_nonlinear(top.root.params, top.root.unknowns,
+                                     top.root.resids)
+            assert_rel_error(self, top.root.resids['comp.x'], resids[-1], 1e-12)
+
+        assert_rel_error(self, resids[0], 0.97265085, 1e-6)
+        assert_rel_error(self, resids[1], 0.18013925, 1e-6)
+
+    def test_cache_states_warm_start(self):
+        # Trials start the subsystem Newton closer to its solution.
+        evals = []
+        for cache in (False, True):
+            top = Problem()
+            root = top.root = Group()
+            root.add('comp', TrickyComp())
+            root.add('p', IndepVarComp('y', 1.2278849186466743))
+            root.connect('p.y', 'comp.y')
+
+            sub = root.add('sub', Group())
+            sub.add('cubic', CubicComp())
+            root.connect('comp.x', 'sub.cubic.x')
+            sub.nl_solver = Newton()
+            sub.nl_solver.options['atol'] = 1e-12
+            sub.ln_solver = DirectSolver()
+
+            root.nl_solver = Newton()
+            root.ln_solver = DirectSolver()
+            root.nl_solver.line_search = BackTracking()
+            root.nl_solver.line_search.options['maxiter'] = 100
+            root.nl_solver.line_search.options['cache_states'] = cache
+            root.nl_solver.options['alpha'] = 10.0
+
+            top.setup(check=False)
+            top['comp.x'] = 1.0
+            top.run()
+
+            assert_rel_error(self, top['comp.x'], .3968459, .0001)
+            assert_rel_error(self, top['sub.cubic.z'], .9960489, .0001)
+            evals.append(sub.cubic.eval_count)
+
+        self.assertLess(evals[1], evals[0])
+
     def test_newton_with_backtracking_analysis_error(self):
 
         top = Problem()
@@ -7,7 +7,8 @@ from six import iteritems
 import numpy as np
 from scipy.optimize import brentq
 
-from openmdao.api import Group, Problem, Component, Brent, ScipyGMRES, ExecComp, AnalysisError
+from openmdao.api import Group, Problem, Component, Brent, ScipyGMRES, ExecComp, AnalysisError, \
+     IndepVarComp
 
 from openmdao.test.util import assert_rel_error
 
@@ -65,6 +66,29 @@ class IndexCompTest(Component):
         r['x'][2] = p['a'] * fact + p['b'] * x - p['c']
 
 
+class VectorCompTest(Component):
+    """ Same as CompTest, with a different value of c for each entry of a
+    vector state."""
+
+    def __init__(self, size):
+        super(VectorCompTest, self).__init__()
+        self.add_param('a', val=1.)
+        self.add_param('b', val=1.)
+        self.add_param('c', val=np.linspace(1., 50., size))
+        self.add_param('n', val=77.0/27.0)
+
+        self.add_state('x', val=2.0*np.ones(size))
+
+    def solve_nonlinear(self, p, u, r):
+        pass
+
+    def apply_nonlinear(self, p, u, r):
+        x = u['x']
+        fact = np.sign(x) * np.abs(x)**p['n']
+
+        r['x'] = p['a'] * fact + p['b'] * x - p['c']
+
+
 class TestBrentSolver(unittest.TestCase):
 
     def setUp(self):
@@ -208,6 +232,60 @@ class TestBrentSolver(unittest.TestCase):
         assert_rel_error(self, p.root.resids['x'][2], 0, .0001)
         assert_rel_error(self, p.root.unknowns['x'][2], 2.06720359226, .0001)
 
+    def _vector_prob(self, size):
+        p = Problem()
+        p.root = Group()
+        p.root.add('comp', VectorCompTest(size), promotes=['a','x','n','b','c'])
+        p.root.nl_solver = Brent()
+        p.root.nl_solver.options['state_var'] = 'x'
+        p.root.nl_solver.options['vectorize'] = True
+        p.root.ln_solver = ScipyGMRES()
+        return p
+
+    def test_brent_vectorized(self):
+        size = 20
+        p = self._vector_prob(size)
+        p.setup(check=False)
+        p.run()
+
+        def func(x, c):
+            return np.sign(x) * np.abs(x)**(77.0/27.0) + x - c
+
+        expected = [brentq(func, 0., 100., args=(c,)) for c in np.linspace(1., 50., size)]
+        assert_rel_error(self, p['x'], np.array(expected), 1e-10)
+        assert_rel_error(self, p.root.resids['x'], np.zeros(size), 1e-8)
+
+        # One model evaluation per iteration for all the entries.
+        self.assertLess(p.root.nl_solver.iter_count, 30)
+
+    def test_brent_vectorized_array_bounds(self):
+        p = self._vector_prob(3)
+        p.root.add('bounds', IndepVarComp([('low', np.array([0., 1., 2.])),
+                                           ('high', np.array([2., 3., 4.]))]),
+                   promotes=['low', 'high'])
+        p.root.add('dummy', ExecComp('d=low+high', low=np.zeros(3), high=np.zeros(3),
+                                     d=np.zeros(3)),
+                   promotes=['low', 'high'])
+        p.root.nl_solver.options['var_lower_bound'] = 'low'
+        p.root.nl_solver.options['var_upper_bound'] = 'high'
+        p.setup(check=False)
+        p['c'] = np.array([2., 4., 10.])
+        p.run()
+
+        expected = [brentq(lambda x: x**(77.0/27.0) + x - c, 0., 4.) for c in (2., 4., 10.)]
+        assert_rel_error(self, p['x'], np.array(expected), 1e-10)
+
+        # Entry 0 of the bracket [1.5, 3] has no sign change.
+        p['low'] = np.array([1.5, 1., 2.])
+        p['high'] = np.array([3., 3., 4.])
+        try:
+            p.run()
+        except ValueError as err:
+            self.assertEqual(str(err), "f(a) and f(b) must have different signs "
+                             "for entries [0] of 'x'")
+        else:
+            self.fail("expected ValueError")
+
 
 class BracketTestComponent(Component):
 
@@ -0,0 +1,111 @@
+""" Unit test for the Broyden nonlinear solver. """
+
+import unittest
+
+import numpy as np
+
+from openmdao.api import Group, Problem, IndepVarComp, Broyden, ExecComp, \
+    ScipyGMRES, DirectSolver, AnalysisError
+from openmdao.test.sellar import SellarDerivativesGrouped, \
+                                 SellarNoDerivatives, SellarStateConnection
+from openmdao.test.util import assert_rel_error
+
+
+class TestBroyden(unittest.TestCase):
+
+    def test_sellar_grouped(self):
+
+        prob = Problem()
+        prob.root = SellarDerivativesGrouped()
+        prob.root.mda.nl_solver = Broyden()
+
+        prob.setup(check=False)
+        prob.run()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        # Only the first step needs derivatives.
+        solver = prob.root.mda.nl_solver
+        self.assertLess(solver.iter_count, 10)
+        self.assertEqual(solver.linearize_count, solver.restart_count)
+        self.assertLess(solver.linearize_count, solver.iter_count)
+
+    def test_sellar_no_derivatives(self):
+
+        prob = Problem()
+        prob.root = SellarNoDerivatives()
+        prob.root.nl_solver = Broyden()
+        prob.root.nl_solver.options['newton_restart'] = False
+
+        prob.setup(check=False)
+        prob.run()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+
+        self.assertLess(prob.root.nl_solver.iter_count, 15)
+        self.assertEqual(prob.root.nl_solver.linearize_count, 0)
+
+    def test_sellar_state_connection(self):
+
+        prob = Problem()
+        prob.root = SellarStateConnection()
+        prob.root.nl_solver = Broyden()
+        prob.root.ln_solver = DirectSolver()
+        prob.setup(check=False)
+        prob.run()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['state_eq.y2_command'], 12.05848819, .00001)
+
+        self.assertLess(prob.root.nl_solver.iter_count, 10)
+
+    def test_linear_system(self):
+
+        # On a linear system, the updates converge to the exact inverse
+        # Jacobian in a few steps.
+        A = np.array([[1.0, 2.0, 0.0],
+                      [0.0, 1.0, 3.0],
+                      [1.0, 0.0, 1.0]])
+        b = np.array([1.0, 2.0, 3.0])
+
+        prob = Problem()
+        root = prob.root = Group()
+        root.add('p', IndepVarComp('b', b), promotes=['b'])
+        root.add('c1', ExecComp('x = 0.2*A.dot(z) + b', A=A, x=np.zeros(3),
+                                z=np.zeros(3), b=np.zeros(3)),
+                 promotes=['b', 'x', 'z'])
+        root.add('c2', ExecComp('z = 0.5*x', x=np.zeros(3), z=np.zeros(3)),
+                 promotes=['x', 'z'])
+        root.ln_solver = ScipyGMRES()
+        root.nl_solver = Broyden()
+        root.nl_solver.options['newton_restart'] = False
+        root.nl_solver.options['atol'] = 1e-12
+        root.nl_solver.options['rtol'] = 1e-14
+        prob.setup(check=False)
+        prob.run()
+
+        expected = np.linalg.solve(np.eye(3) - 0.1*A, b)
+        assert_rel_error(self, prob['x'], expected, 1e-10)
+        self.assertLessEqual(root.nl_solver.iter_count, 8)
+
+    def test_err_on_maxiter(self):
+
+        prob = Problem()
+        prob.root = SellarNoDerivatives()
+        prob.root.nl_solver = Broyden()
+        prob.root.nl_solver.options['maxiter'] = 1
+        prob.root.nl_solver.options['newton_restart'] = False
+        prob.root.nl_solver.options['err_on_maxiter'] = True
+        prob.setup(check=False)
+
+        with self.assertRaises(AnalysisError) as cm:
+            prob.run()
+
+        msg = "Solve in '': Broyden FAILED to converge after 1 iterations"
+        self.assertEqual(str(cm.exception), msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
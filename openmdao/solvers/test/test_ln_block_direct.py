@@ -0,0 +1,101 @@
+""" Unit test for the BlockDirectSolver linear solver. """
+
+import unittest
+
+import numpy as np
+
+from openmdao.api import Problem, ScipyGMRES, BlockDirectSolver
+from openmdao.test.converge_diverge import ConvergeDivergeGroups
+from openmdao.test.sellar import SellarDerivativesGrouped
+from openmdao.test.util import assert_rel_error
+
+
+class TestBlockDirectSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.Jbase = {}
+        self.Jbase['con1'] = {}
+        self.Jbase['con1']['x'] = -0.98061433
+        self.Jbase['con1']['z'] = np.array([-9.61002285, -0.78449158])
+        self.Jbase['con2'] = {}
+        self.Jbase['con2']['x'] = 0.09692762
+        self.Jbase['con2']['z'] = np.array([1.94989079, 1.0775421 ])
+        self.Jbase['obj'] = {}
+        self.Jbase['obj']['x'] = 2.98061392
+        self.Jbase['obj']['z'] = np.array([9.61001155, 1.78448534])
+
+    def _check_sellar(self, prob):
+        indep_list = ['x', 'z']
+        unknown_list = ['obj', 'con1', 'con2']
+
+        for mode in ('fwd', 'rev'):
+            J = prob.calc_gradient(indep_list, unknown_list, mode=mode,
+                                   return_format='dict')
+            for key1, val1 in self.Jbase.items():
+                for key2, val2 in val1.items():
+                    assert_rel_error(self, J[key1][key2], val2, .00001)
+
+    def test_sellar_precon(self):
+
+        for sweep in ('gs', 'jacobi'):
+            prob = Problem()
+            prob.root = SellarDerivativesGrouped()
+            prob.root.mda.nl_solver.options['atol'] = 1e-12
+
+            prob.root.ln_solver = ScipyGMRES()
+            precon = prob.root.ln_solver.preconditioner = BlockDirectSolver()
+            precon.options['sweep'] = sweep
+
+            prob.setup(check=False)
+            prob.run()
+
+            self._check_sellar(prob)
+
+            # The mda block is an exact solve, so GMRES needs only a few
+            # iterations.
+            self.assertLessEqual(prob.root.ln_solver.iter_count, 6)
+
+            # Factored once per linearization and mode.
+            mda = prob.root.mda
+            self.assertEqual(precon._factored['mda'], (mda._linearize_count, 'rev'))
+            self.assertTrue(mda._jacobian_changed)
+
+    def test_sellar_csc_blocks(self):
+
+        prob = Problem()
+        prob.root = SellarDerivativesGrouped()
+        prob.root.mda.nl_solver.options['atol'] = 1e-12
+
+        prob.root.ln_solver = ScipyGMRES()
+        precon = prob.root.ln_solver.preconditioner = BlockDirectSolver()
+        precon.options['jacobian_format'] = 'csc'
+
+        prob.setup(check=False)
+        prob.run()
+
+        self._check_sellar(prob)
+
+    def test_jacobi_iterations(self):
+
+        prob = Problem()
+        prob.root = ConvergeDivergeGroups()
+        prob.root.ln_solver = BlockDirectSolver()
+        prob.root.ln_solver.options['sweep'] = 'jacobi'
+        prob.root.ln_solver.options['maxiter'] = 20
+
+        prob.setup(check=False)
+        prob.run()
+
+        indep_list = ['p.x']
+        unknown_list = ['comp7.y1']
+
+        for mode in ('fwd', 'rev'):
+            J = prob.calc_gradient(indep_list, unknown_list, mode=mode,
+                                   return_format='dict')
+            assert_rel_error(self, J['comp7.y1']['p.x'][0][0], -40.75, 1e-6)
+
+        self.assertLess(prob.root.ln_solver.iter_count, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
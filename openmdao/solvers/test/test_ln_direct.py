@@ -340,6 +340,32 @@ class TestDirectSolver(unittest.TestCase):
         J = p.calc_gradient(['a'], ['f'], mode='rev')
         assert_rel_error(self, J[0][0], 1.57735, 1e-6)
 
+    def test_multi_rhs_single_solve(self):
+        prob = Problem()
+        prob.root = SellarStateConnection()
+        prob.root.ln_solver = DirectSolver()
+        prob.root.nl_solver.options['atol'] = 1e-12
+        prob.setup(check=False)
+        prob.run()
+
+        solver = prob.root.ln_solver
+        calls = []
+        solve = solver.solve
+
+        def counting_solve(rhs_mat, system, mode):
+            calls.append([rhs.shape for rhs in rhs_mat.values()])
+            return solve(rhs_mat, system, mode)
+
+        solver.solve = counting_solve
+
+        J = prob.calc_gradient(['z'], ['obj', 'con1'], mode='fwd', return_format='dict')
+        assert_rel_error(self, J['obj']['z'], np.array([[9.61001155, 1.78448534]]), .00001)
+        assert_rel_error(self, J['con1']['z'], np.array([[-9.61002285, -0.78449158]]), .00001)
+
+        # Both indices of 'z' are solved in one call.
+        n = len(prob.root.unknowns.vec)
+        self.assertEqual(calls, [[(n, 2)]])
+
 
 class TestDirectSolverAssemble(unittest.TestCase):
     """ Tests the DirectSolver using the method that assembles a Jacobian."""
@@ -772,5 +798,153 @@ class TestDirectSolverAssemble(unittest.TestCase):
         J = p.calc_gradient(['p.x'], ['comp.y1'], mode='fwd')
         assert_rel_error(self, J[0][0], 1.5, 1e-6)
 
+
+class TestDirectSolverSparse(unittest.TestCase):
+    """ Tests the DirectSolver using a sparse (csc) Jacobian."""
+
+    def test_array2D(self):
+        group = Group()
+        group.add('x_param', IndepVarComp('x', np.ones((2, 2))), promotes=['*'])
+        group.add('mycomp', ArrayComp2D(), promotes=['x', 'y'])
+
+        prob = Problem()
+        prob.root = group
+        prob.root.ln_solver = DirectSolver()
+        prob.root.ln_solver.options['jacobian_method'] = 'assemble'
+        prob.root.ln_solver.options['jacobian_format'] = 'csc'
+        prob.setup(check=False)
+        prob.run()
+
+        J = prob.calc_gradient(['x'], ['y'], mode='fwd', return_format='dict')
+        Jbase = prob.root.mycomp._jacobian_cache
+        diff = np.linalg.norm(J['y']['x'] - Jbase['y', 'x'])
+        assert_rel_error(self, diff, 0.0, 1e-8)
+
+        J = prob.calc_gradient(['x'], ['y'], mode='rev', return_format='dict')
+        diff = np.linalg.norm(J['y']['x'] - Jbase['y', 'x'])
+        assert_rel_error(self, diff, 0.0, 1e-8)
+
+    def test_matches_dense(self):
+        prob = Problem()
+        prob.root = SellarStateConnection()
+        prob.setup(check=False)
+        prob.run()
+
+        root = prob.root
+        root._sys_linearize(root.params, root.unknowns, root.resids)
+
+        for mode in ('fwd', 'rev'):
+            dense, _ = root.assemble_jacobian(mode=mode)
+            sparse, _ = root.assemble_jacobian(mode=mode, jacobian_format='csc')
+            self.assertEqual(sparse.format, 'csc')
+            diff = np.linalg.norm(sparse.toarray() - dense)
+            assert_rel_error(self, diff, 0.0, 1e-12)
+
+        # Layout is kept, so reassembly only refills the data.
+        pattern = root._jac_pattern
+        root.assemble_jacobian(mode='rev', jacobian_format='csc')
+        self.assertTrue(root._jac_pattern is pattern)
+
+        # A column permutation is applied during assembly.
+        col_perm = np.arange(dense.shape[0])[::-1]
+        pattern.permute_columns(col_perm)
+        sparse, _ = root.assemble_jacobian(mode='rev', jacobian_format='csc')
+        diff = np.linalg.norm(sparse.toarray() - dense[:, col_perm])
+        assert_rel_error(self, diff, 0.0, 1e-12)
+
+    def test_reuse_ordering_newton(self):
+        prob = Problem()
+        prob.root = SellarStateConnection()
+        prob.root.nl_solver = Newton()
+        prob.root.nl_solver.options['atol'] = 1e-12
+        prob.root.ln_solver = DirectSolver()
+        prob.root.ln_solver.options['jacobian_method'] = 'assemble'
+        prob.root.ln_solver.options['jacobian_format'] = 'csc'
+        prob.setup(check=False)
+        prob.run()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['state_eq.y2_command'], 12.05848819, .00001)
+
+        # Ordering from the first factorization is kept for later ones.
+        pattern = prob.root._jac_pattern
+        self.assertTrue(pattern.col_perm is not None)
+        self.assertTrue(prob.root.ln_solver.col_perm is pattern.col_perm)
+
+        J = prob.calc_gradient(['x', 'z'], ['obj'], mode='fwd', return_format='dict')
+        assert_rel_error(self, J['obj']['x'][0][0], 2.98061392, .00001)
+        assert_rel_error(self, J['obj']['z'][0], np.array([9.61001155, 1.78448534]), .00001)
+        self.assertTrue(prob.root._jac_pattern is pattern)
+
+    def test_sellar_derivs(self):
+
+        for method in ('assemble', 'MVP'):
+            for solve_method in ('LU', 'solve'):
+                prob = Problem()
+                prob.root = SellarStateConnection()
+                prob.root.ln_solver = DirectSolver()
+                prob.root.ln_solver.options['jacobian_method'] = method
+                prob.root.ln_solver.options['jacobian_format'] = 'csc'
+                prob.root.ln_solver.options['solve_method'] = solve_method
+
+                prob.root.nl_solver.options['atol'] = 1e-12
+                prob.setup(check=False)
+                prob.run()
+
+                indep_list = ['x', 'z']
+                unknown_list = ['obj', 'con1', 'con2']
+
+                Jbase = {}
+                Jbase['con1'] = {}
+                Jbase['con1']['x'] = -0.98061433
+                Jbase['con1']['z'] = np.array([-9.61002285, -0.78449158])
+                Jbase['con2'] = {}
+                Jbase['con2']['x'] = 0.09692762
+                Jbase['con2']['z'] = np.array([1.94989079, 1.0775421 ])
+                Jbase['obj'] = {}
+                Jbase['obj']['x'] = 2.98061392
+                Jbase['obj']['z'] = np.array([9.61001155, 1.78448534])
+
+                J = prob.calc_gradient(indep_list, unknown_list, mode='fwd', return_format='dict')
+                for key1, val1 in Jbase.items():
+                    for key2, val2 in val1.items():
+                        assert_rel_error(self, J[key1][key2], val2, .00001)
+
+                J = prob.calc_gradient(indep_list, unknown_list, mode='rev', return_format='dict')
+                for key1, val1 in Jbase.items():
+                    for key2, val2 in val1.items():
+                        assert_rel_error(self, J[key1][key2], val2, .00001)
+
+    def test_implicit_solve_linear(self):
+
+        p = Problem()
+        p.root = Group()
+
+        dvars = ( ('a', 3.), ('b', 10.))
+        p.root.add('desvars', IndepVarComp(dvars), promotes=['a', 'b'])
+
+        sg = p.root.add('sg', Group(), promotes=["*"])
+        sg.add('si', SimpleImplicitSL(), promotes=['a', 'b', 'x'])
+
+        p.root.add('func', ExecComp('f = 2*x0+a'), promotes=['f', 'x0', 'a'])
+        p.root.connect('x', 'x0', src_indices=[1])
+
+        p.driver.add_objective('f')
+        p.driver.add_desvar('a')
+
+        p.root.nl_solver = Newton()
+        p.root.nl_solver.options['rtol'] = 1e-10
+        p.root.nl_solver.options['atol'] = 1e-10
+        p.root.ln_solver = DirectSolver()
+        p.root.ln_solver.options['jacobian_method'] = 'assemble'
+        p.root.ln_solver.options['jacobian_format'] = 'csc'
+
+        p.setup(check=False)
+        p['x'] = np.array([1.5, 2.])
+
+        p.run()
+        J = p.calc_gradient(['a'], ['f'], mode='rev')
+        assert_rel_error(self, J[0][0], 1.57735, 1e-6)
+
 if __name__ == "__main__":
     unittest.main()
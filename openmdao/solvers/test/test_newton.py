@@ -1,6 +1,7 @@
 """ Unit test for the Newton nonlinear solver. """
 
 import unittest
+import warnings
 from six import iteritems
 
 import numpy as np
@@ -218,5 +219,81 @@ class TestNewton(unittest.TestCase):
                              msg='Should get there pretty quick because of utol.')
 
 
+    def test_jacobian_lag(self):
+
+        prob = Problem()
+        prob.root = SellarStateConnection()
+        prob.root.nl_solver = Newton()
+        prob.root.nl_solver.options['jacobian_lag'] = 4
+        prob.root.nl_solver.options['lag_rate'] = 1.0
+        prob.setup(check=False)
+        prob.run()
+
+        assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+        assert_rel_error(self, prob['state_eq.y2_command'], 12.05848819, .00001)
+
+        solver = prob.root.nl_solver
+        self.assertLess(solver.iter_count, 12)
+        self.assertLess(solver.linearize_count, solver.iter_count)
+
+        # With a zero rate, every iteration counts as too slow.
+        prob = Problem()
+        prob.root = SellarStateConnection()
+        prob.root.nl_solver = Newton()
+        prob.root.nl_solver.options['jacobian_lag'] = 4
+        prob.root.nl_solver.options['lag_rate'] = 0.0
+        prob.setup(check=False)
+        prob.run()
+
+        assert_rel_error(self, prob['state_eq.y2_command'], 12.05848819, .00001)
+
+        solver = prob.root.nl_solver
+        self.assertEqual(solver.linearize_count, solver.iter_count)
+
+    def test_matrix_free(self):
+
+        for root in (SellarStateConnection(), SellarNoDerivatives()):
+            prob = Problem()
+            prob.root = root
+            prob.root.nl_solver = Newton()
+            prob.root.nl_solver.options['matrix_free'] = True
+            prob.setup(check=False)
+            prob.run()
+
+            assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+            assert_rel_error(self, prob['con2'], 12.05848819 - 24.0, .00001)
+
+            # Make sure we aren't iterating like crazy
+            self.assertLess(prob.root.nl_solver.iter_count, 8)
+            self.assertEqual(prob.root.nl_solver.linearize_count, 0)
+
+    def test_matrix_free_gmres_failure(self):
+        prob = Problem()
+        prob.root = SellarNoDerivatives()
+        prob.root.nl_solver = Newton()
+        prob.root.nl_solver.options['matrix_free'] = True
+        prob.root.nl_solver.options['maxiter'] = 2
+        prob.root.nl_solver.options['iprint'] = -1
+
+        # GMRES can't reach a zero tolerance
+        prob.root.nl_solver.options['mf_rtol'] = 0.0
+        prob.setup(check=False)
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            prob.run()
+
+        msgs = [str(wi.message) for wi in w
+                if issubclass(wi.category, RuntimeWarning)]
+        self.assertEqual(len(msgs), 2)
+        self.assertIn("Solve in '': Newton matrix-free GMRES FAILED", msgs[0])
+
+        prob.root.nl_solver.options['err_on_maxiter'] = True
+        prob.setup(check=False)
+        with self.assertRaises(AnalysisError) as cm:
+            prob.run()
+        self.assertIn('matrix-free GMRES FAILED', str(cm.exception))
+
+
 if __name__ == "__main__":
     unittest.main()
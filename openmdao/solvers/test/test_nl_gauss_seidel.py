@@ -1,16 +1,38 @@
 """ Unit test for the Nonlinear Gauss Seidel nonlinear solver. """
 
 import sys
+import threading
+import time
 import unittest
+import warnings
 
+import numpy as np
 from six.moves import cStringIO
 
-from openmdao.api import Problem, NLGaussSeidel, AnalysisError, Group, ScipyGMRES
+from openmdao.api import Problem, NLGaussSeidel, AnalysisError, Group, ScipyGMRES, \
+     IndepVarComp, ExecComp, Component
 from openmdao.test.paraboloid import Paraboloid
 from openmdao.test.sellar import SellarNoDerivatives, SellarDerivativesGrouped
+from openmdao.test.simple_comps import FanOut
 from openmdao.test.util import assert_rel_error
 
 
+class SleepComp(Component):
+    """ Waits a little, without holding the GIL, and records the thread it
+    ran on."""
+
+    def __init__(self):
+        super(SleepComp, self).__init__()
+        self.add_param('x', 0.0)
+        self.add_output('y', 0.0)
+        self.threads = set()
+
+    def solve_nonlinear(self, params, unknowns, resids):
+        self.threads.add(threading.current_thread().ident)
+        time.sleep(0.1)
+        unknowns['y'] = 2.0*params['x']
+
+
 class TestNLGaussSeidel(unittest.TestCase):
 
     def test_sellar(self):
@@ -137,7 +159,7 @@ class TestNLGaussSeidel(unittest.TestCase):
         prob.root = SellarNoDerivatives()
         prob.root.nl_solver = NLGaussSeidel()
 
-        prob.root.nl_solver.options['use_aitken'] = True
+        prob.root.nl_solver.options['acceleration'] = 'aitken'
         prob.root.cycle.set_order(['d1', 'd2'])
 
         prob.setup(check=False)
@@ -150,5 +172,170 @@ class TestNLGaussSeidel(unittest.TestCase):
         self.assertTrue(prob.root.nl_solver.iter_count == 4)
 
 
+    def test_use_aitken_deprecated(self):
+
+        prob = Problem()
+        prob.root = SellarNoDerivatives()
+        prob.root.nl_solver = NLGaussSeidel()
+        prob.root.nl_solver.options['use_aitken'] = True
+        prob.root.cycle.set_order(['d1', 'd2'])
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            prob.setup(check=False)
+
+        self.assertEqual(str(w[0].message), "Option 'use_aitken' is "
+                         "deprecated. Use 'acceleration' instead.")
+
+        prob.run()
+        assert_rel_error(self, prob.root.nl_solver.aitken_alpha, 0.980998467864, .00001)
+        self.assertEqual(prob.root.nl_solver.iter_count, 4)
+
+        # Only one kind of acceleration can be used.
+        prob.root.nl_solver.options['acceleration'] = 'anderson'
+        with self.assertRaises(ValueError) as cm:
+            prob.setup(check=False)
+
+        self.assertEqual(str(cm.exception), "Options 'use_aitken' and "
+                         "acceleration='anderson' can't be used together.")
+
+    def test_sellar_with_Anderson(self):
+
+        iters = []
+        for anderson in (False, True):
+            prob = Problem()
+            prob.root = SellarNoDerivatives()
+            prob.root.nl_solver = NLGaussSeidel()
+            prob.root.nl_solver.options['atol'] = 1e-12
+            prob.root.nl_solver.options['rtol'] = 1e-12
+            if anderson:
+                prob.root.nl_solver.options['acceleration'] = 'anderson'
+
+            prob.setup(check=False)
+            prob.run()
+
+            assert_rel_error(self, prob['y1'], 25.58830273, .00001)
+            assert_rel_error(self, prob['y2'], 12.05848819, .00001)
+            iters.append(prob.root.nl_solver.iter_count)
+
+        self.assertLess(iters[1], iters[0])
+
+    def test_linear_with_Anderson(self):
+
+        # Fixed point iteration that contracts slowly.
+        M = np.array([[0.5, 0.3, 0.0, 0.1],
+                      [0.2, 0.4, 0.2, 0.0],
+                      [0.0, 0.3, 0.3, 0.3],
+                      [0.1, 0.0, 0.4, 0.4]])
+        b = np.array([1.0, -2.0, 0.5, 3.0])
+        expected = np.linalg.solve(np.eye(4) - M, b)
+
+        iters = []
+        for depth in (None, 1, 4):
+            prob = Problem()
+            root = prob.root = Group()
+            root.add('p', IndepVarComp('b', b), promotes=['b'])
+            root.add('c1', ExecComp('x = M.dot(z) + b', M=M, x=np.zeros(4),
+                                    z=np.zeros(4), b=np.zeros(4)),
+                     promotes=['b', 'x', 'z'])
+            root.add('c2', ExecComp('z = 1.0*x', x=np.zeros(4), z=np.zeros(4)),
+                     promotes=['x', 'z'])
+            root.ln_solver = ScipyGMRES()
+            root.nl_solver = NLGaussSeidel()
+            root.nl_solver.options['atol'] = 1e-10
+            root.nl_solver.options['rtol'] = 1e-12
+            root.nl_solver.options['maxiter'] = 500
+            if depth:
+                root.nl_solver.options['acceleration'] = 'anderson'
+                root.nl_solver.options['anderson_depth'] = depth
+
+            prob.setup(check=False)
+            prob.run()
+
+            assert_rel_error(self, prob['x'], expected, 1e-8)
+            iters.append(root.nl_solver.iter_count)
+
+        self.assertLess(iters[1], iters[0])
+        self.assertLess(iters[2], iters[1])
+
+        # A full history on a linear map converges in a few more iterations
+        # than there are unknowns.
+        self.assertLessEqual(iters[2], 12)
+
+    def test_threads_levels(self):
+        prob = Problem()
+        prob.root = FanOut()
+        prob.root.nl_solver = NLGaussSeidel()
+        prob.root.nl_solver.options['threads'] = 2
+        prob.setup(check=False)
+        prob.run()
+
+        levels = [[sub.name for sub in level]
+                  for level in prob.root._get_sys_levels()]
+        self.assertEqual(levels, [['p'], ['comp1'], ['comp2', 'comp3']])
+
+        assert_rel_error(self, prob['comp2.y'], -6.0, 1e-12)
+        assert_rel_error(self, prob['comp3.y'], 15.0, 1e-12)
+
+    def test_threads_sellar(self):
+        # Running independent subsystems together must not change the
+        # Gauss Seidel iterates.
+        results = []
+        for threads in (1, 3):
+            prob = Problem()
+            prob.root = SellarNoDerivatives()
+            prob.root.nl_solver = NLGaussSeidel()
+            prob.root.nl_solver.options['atol'] = 1e-12
+            prob.root.nl_solver.options['threads'] = threads
+            prob.setup(check=False)
+            prob.run()
+
+            results.append((prob.root.nl_solver.iter_count, prob['y1'],
+                            prob['y2'], prob['obj']))
+
+        self.assertEqual(results[0], results[1])
+
+    def test_threads_concurrent(self):
+        prob = Problem()
+        root = prob.root = Group()
+        root.nl_solver = NLGaussSeidel()
+        root.nl_solver.options['threads'] = 3
+        root.add('p', IndepVarComp('x', 1.0), promotes=['x'])
+        for i in range(3):
+            root.add('c%d' % i, SleepComp(), promotes=['x'])
+        prob.setup(check=False)
+
+        start = time.time()
+        prob.run()
+
+        self.assertLess(time.time() - start, 0.25)
+        self.assertEqual(len(set().union(*(root.find_subsystem('c%d' % i).threads
+                                           for i in range(3)))), 3)
+        for i in range(3):
+            assert_rel_error(self, prob['c%d.y' % i], 2.0, 1e-12)
+
+    def test_threads_cleanup(self):
+        prob = Problem()
+        prob.root = FanOut()
+        prob.root.nl_solver = NLGaussSeidel()
+        prob.root.nl_solver.options['threads'] = 2
+        nthreads = threading.active_count()
+
+        prob.setup(check=False)
+        prob.run()
+        npool = threading.active_count()
+        self.assertTrue(npool > nthreads)
+
+        # setting up again closes the pool of the previous setup
+        for i in range(2):
+            prob.setup(check=False)
+            prob.run()
+            self.assertEqual(threading.active_count(), npool)
+
+        prob.cleanup()
+        self.assertEqual(prob.root.nl_solver._pool, None)
+        self.assertEqual(threading.active_count(), nthreads)
+
+
 if __name__ == "__main__":
     unittest.main()
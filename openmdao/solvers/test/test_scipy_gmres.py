@@ -7,7 +7,7 @@ from openmdao.api import Group, Problem, IndepVarComp, ScipyGMRES, \
     DirectSolver, ExecComp, LinearGaussSeidel, AnalysisError
 from openmdao.test.converge_diverge import ConvergeDiverge, SingleDiamond, \
                                            ConvergeDivergeGroups, SingleDiamondGrouped
-from openmdao.test.sellar import SellarDerivativesGrouped
+from openmdao.test.sellar import SellarDerivativesGrouped, SellarStateConnection
 from openmdao.test.simple_comps import SimpleCompDerivMatVec, FanOut, FanIn, \
                                        FanOutGrouped, DoubleArrayComp, \
                                        FanInGrouped, ArrayComp2D, FanOutAllGrouped
@@ -407,6 +407,223 @@ class TestScipyGMRES(unittest.TestCase):
                 assert_rel_error(self, J[key1][key2], val2, .00001)
 
 
+    def test_block_rhs(self):
+
+        prob = Problem()
+        prob.root = SellarDerivativesGrouped()
+        prob.root.mda.nl_solver.options['atol'] = 1e-12
+        prob.root.mda.ln_solver = DirectSolver()
+        prob.setup(check=False)
+        prob.run()
+
+        root = prob.root
+        root._sys_linearize(root.params, root.unknowns, root.resids)
+        solver = root.ln_solver
+
+        n = len(root.unknowns.vec)
+        rhs = np.zeros((n, 3))
+        rhs[0, 0] = -1.0
+        rhs[1, 1] = -1.0
+        rhs[n-1, 2] = -1.0
+
+        for precon in (None, LinearGaussSeidel()):
+            solver.preconditioner = precon
+            solver.setup(root)
+
+            for mode in ('fwd', 'rev'):
+                block = solver.solve({None: rhs}, root, mode)[None]
+                self.assertEqual(block.shape, (n, 3))
+
+                for j in range(3):
+                    single = solver.solve({None: rhs[:, j].copy()}, root, mode)[None]
+                    diff = np.linalg.norm(block[:, j] - single)
+                    assert_rel_error(self, diff, 0.0, 1e-8)
+
+                    # a single column goes through scipy's gmres
+                    col = solver.solve({None: rhs[:, j:j+1].copy()}, root, mode)[None]
+                    self.assertEqual(col.shape, (n, 1))
+                    np.testing.assert_array_equal(col[:, 0], single)
+
+
+class TestScipyGMRESFused(unittest.TestCase):
+    """ Tests ScipyGMRES on Groups with a fused Jacobian."""
+
+    def _unit_model(self):
+        prob = Problem(root=Group())
+        root = prob.root
+        root.ln_solver = ScipyGMRES()
+
+        root.add('p', IndepVarComp('x', np.array([1.0, 2.0, 3.0]), units='m'),
+                 promotes=['x'])
+        root.add('c1', ExecComp('y = 2.0*x + x**2', x=np.zeros(2), y=np.zeros(2),
+                                units={'x': 'cm', 'y': 'cm'}))
+        root.add('c2', ExecComp('z = y[0]*y[1] + 3.0*x[1]', y=np.zeros(2),
+                                x=np.zeros(3)),
+                 promotes=['x'])
+        root.connect('x', 'c1.x', src_indices=[2, 0])
+        root.connect('c1.y', 'c2.y')
+
+        prob.setup(check=False)
+        prob.run()
+        return prob
+
+    def _state_model(self):
+        prob = Problem(root=SellarStateConnection())
+        prob.setup(check=False)
+        prob.run()
+        return prob
+
+    def _jacobians(self, prob, group):
+        """ Builds the linear operator of a group column by column, with
+        and without the fused Jacobian."""
+        root = prob.root
+        root._sys_linearize(root.params, root.unknowns, root.resids)
+
+        # Inputs from outside of the group don't take part in its products.
+        root.clear_dparams()
+
+        solver = group.ln_solver
+        solver.system = group
+        solver.voi = None
+        n = len(group.unknowns.vec)
+
+        jacs = []
+        for fuse in (False, True):
+            group.deriv_options['fuse_jacobian'] = fuse
+            group._fused_stale = True
+            for mode in ('fwd', 'rev'):
+                solver.mode = mode
+                jac = np.empty((n, n))
+                for i in range(n):
+                    jac[:, i] = solver.mult(np.eye(n)[:, i])
+                jacs.append(jac)
+
+        return jacs
+
+    def test_matches_apply_linear(self):
+        for prob, group in ((self._unit_model(), None),
+                            (self._state_model(), 'sub'),
+                            (self._state_model(), 'sub.state_eq_group')):
+            group = prob.root if group is None else prob.root.find_subsystem(group)
+            fwd, rev, fused_fwd, fused_rev = self._jacobians(prob, group)
+
+            self.assertTrue(group._fused_jac is not None)
+            assert_rel_error(self, fused_fwd, fwd, 1e-12)
+            assert_rel_error(self, fused_rev, rev, 1e-12)
+            assert_rel_error(self, rev, fwd.T, 1e-12)
+
+    def test_sellar_state_connection(self):
+        prob = Problem(root=SellarStateConnection())
+        prob.root.deriv_options['fuse_jacobian'] = True
+        prob.root.ln_solver = ScipyGMRES()
+        prob.setup(check=False)
+        prob.run()
+
+        indep_list = ['x', 'z']
+        unknown_list = ['obj', 'con1', 'con2']
+
+        for mode in ('fwd', 'rev'):
+            J = prob.calc_gradient(indep_list, unknown_list, mode=mode,
+                                   return_format='dict')
+            assert_rel_error(self, J['obj']['z'][0][0], 9.61001056, .00001)
+            assert_rel_error(self, J['obj']['z'][0][1], 1.78448534, .00001)
+            assert_rel_error(self, J['con1']['x'][0][0], -0.98061433, .00001)
+            assert_rel_error(self, J['con2']['z'][0][0], 1.94989079, .00001)
+
+        self.assertTrue(prob.root._fused_jac is not None)
+
+    def test_apply_linear_not_fused(self):
+        prob = Problem(root=Group())
+        prob.root.ln_solver = ScipyGMRES()
+        prob.root.deriv_options['fuse_jacobian'] = True
+        prob.root.add('p', IndepVarComp('x', 1.0))
+        prob.root.add('c', SimpleCompDerivMatVec())
+        prob.root.connect('p.x', 'c.x')
+        prob.setup(check=False)
+        prob.run()
+
+        J = prob.calc_gradient(['p.x'], ['c.y'], mode='fwd', return_format='dict')
+        assert_rel_error(self, J['c.y']['p.x'][0][0], 2.0, 1e-6)
+        self.assertTrue(prob.root._fused_jac is None)
+
+
+class TestScipyGMRESRecycle(unittest.TestCase):
+    """ Tests ScipyGMRES with recycled Krylov vectors and warm starts."""
+
+    def _sellar(self, recycle, warm_start):
+        prob = Problem()
+        prob.root = SellarDerivativesGrouped()
+        prob.root.mda.nl_solver.options['atol'] = 1e-12
+        prob.root.ln_solver.options['recycle'] = recycle
+        prob.root.ln_solver.options['warm_start'] = warm_start
+        prob.setup(check=False)
+        prob.run()
+        return prob
+
+    def _check_sellar(self, prob):
+        indep_list = ['x', 'z']
+        unknown_list = ['obj', 'con1', 'con2']
+
+        for mode in ('fwd', 'rev'):
+            J = prob.calc_gradient(indep_list, unknown_list, mode=mode,
+                                   return_format='dict')
+            assert_rel_error(self, J['obj']['x'][0][0], 2.98061392, .00001)
+            assert_rel_error(self, J['obj']['z'][0][0], 9.61001155, .00001)
+            assert_rel_error(self, J['con1']['x'][0][0], -0.98061433, .00001)
+            assert_rel_error(self, J['con1']['z'][0][1], -0.78449158, .00001)
+            assert_rel_error(self, J['con2']['z'][0][0], 1.94989079, .00001)
+
+    def test_recycle(self):
+        prob = self._sellar(3, False)
+
+        # Repeated gradients, with the subspaces kept in between.
+        for i in range(2):
+            self._check_sellar(prob)
+
+        recycled = prob.root.ln_solver._recycled
+        self.assertTrue(len(recycled) > 0)
+        for CU, lin_count in recycled.values():
+            self.assertTrue(len(CU) > 0)
+
+    def test_warm_start(self):
+        prob = self._sellar(0, True)
+        self._check_sellar(prob)
+
+        # Without a new linearization, the stored solution is already
+        # converged.
+        root = prob.root
+        solver = root.ln_solver
+        rhs = np.zeros(len(root.unknowns.vec))
+        rhs[0] = 1.0
+
+        solver.solve({None: rhs}, root, 'fwd')
+        sol = solver.solve({None: rhs}, root, 'fwd')
+        self.assertEqual(solver.iter_count, 0)
+
+        # only the previous solution for each voi and mode is kept
+        self.assertEqual(set(solver._last_sol),
+                         set([(None, 'fwd'), (None, 'rev')]))
+
+        # a different rhs pattern starts from zero
+        rhs2 = np.zeros(len(root.unknowns.vec))
+        rhs2[1] = 1.0
+        solver.solve({None: rhs2}, root, 'fwd')
+        self.assertTrue(solver.iter_count > 0)
+
+        solver.options['warm_start'] = False
+        cold = solver.solve({None: rhs}, root, 'fwd')
+        self.assertTrue(solver.iter_count > 0)
+        assert_rel_error(self, sol[None], cold[None], 1e-9)
+
+        prob.setup(check=False)
+        self.assertEqual(solver._last_sol, {})
+
+    def test_recycle_and_warm_start(self):
+        prob = self._sellar(2, True)
+        for i in range(2):
+            self._check_sellar(prob)
+
+
 class TestScipyGMRESPreconditioner(unittest.TestCase):
 
     def test_sellar_derivs_grouped_precon(self):
@@ -0,0 +1,103 @@
+""" Tests for the convergence histories of solvers."""
+
+import os
+import unittest
+from tempfile import mkdtemp
+from shutil import rmtree
+
+import numpy as np
+
+from openmdao.api import Problem, Newton, ScipyGMRES
+from openmdao.solvers.solver_base import ConvergenceHistory
+from openmdao.test.sellar import SellarDerivativesGrouped, SellarStateConnection
+from openmdao.test.util import assert_rel_error
+
+
+class TestConvergenceHistory(unittest.TestCase):
+
+    def test_ring_buffer(self):
+        hist = ConvergenceHistory(3)
+        self.assertEqual(len(hist.get()), 0)
+
+        for i in range(5):
+            hist.append(i, 10.0**-i, 2*i)
+
+        self.assertEqual(len(hist), 3)
+        self.assertEqual(hist.count, 5)
+
+        data = hist.get()
+        self.assertEqual(list(data['iteration']), [2, 3, 4])
+        self.assertEqual(list(data['matvecs']), [4, 6, 8])
+        assert_rel_error(self, data['norm'], np.array([1e-2, 1e-3, 1e-4]), 1e-12)
+        self.assertTrue(np.all(np.diff(data['time']) >= 0.0))
+
+        hist.clear()
+        self.assertEqual(len(hist), 0)
+
+
+class TestSolverHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = mkdtemp()
+
+    def tearDown(self):
+        try:
+            rmtree(self.tmpdir)
+        except OSError:
+            pass
+
+    def test_sellar_grouped(self):
+        prob = Problem()
+        prob.root = SellarDerivativesGrouped()
+        prob.root.mda.nl_solver.options['atol'] = 1e-12
+        prob.setup(check=False)
+        prob.root.record_solver_history(size=100)
+        prob.run()
+
+        prob.calc_gradient(['x', 'z'], ['obj', 'con1', 'con2'], mode='fwd')
+
+        history = prob.root.get_solver_history()
+        self.assertEqual(list(history.keys()),
+                         ['root.nl_solver', 'root.ln_solver',
+                          'root.mda.nl_solver', 'root.mda.ln_solver'])
+
+        # NLGaussSeidel records every iteration, and converges.
+        nl = history['root.mda.nl_solver']
+        self.assertEqual(len(nl), prob.root.mda.nl_solver.iter_count)
+        self.assertEqual(list(nl['iteration']), list(range(1, len(nl) + 1)))
+        self.assertLess(nl['norm'][-1], 1e-6*nl['norm'][0])
+
+        # RunOnce has nothing to record.
+        self.assertEqual(len(history['root.nl_solver']), 0)
+
+        ln = history['root.ln_solver']
+        self.assertTrue(len(ln) > 0)
+        self.assertTrue(np.all(np.diff(ln['matvecs']) >= 0))
+        self.assertLessEqual(ln['matvecs'][-1], prob.root.ln_solver.matvec_count)
+
+        fname = os.path.join(self.tmpdir, 'history.npz')
+        prob.root.save_solver_history(fname)
+        with np.load(fname) as data:
+            self.assertEqual(sorted(data.files), sorted(history.keys()))
+            np.testing.assert_array_equal(data['root.mda.nl_solver'], nl)
+
+    def test_newton_matvecs(self):
+        prob = Problem()
+        prob.root = SellarStateConnection()
+        prob.root.nl_solver = Newton()
+        prob.root.ln_solver = ScipyGMRES()
+        prob.setup(check=False)
+        prob.root.record_solver_history()
+        prob.run()
+
+        # The nonlinear history counts the products of the linear solver
+        # used for the Newton steps.
+        nl = prob.root.nl_solver.history.get()
+        self.assertEqual(len(nl), prob.root.nl_solver.iter_count + 1)
+        self.assertEqual(nl['matvecs'][0], 0)
+        self.assertTrue(np.all(np.diff(nl['matvecs']) > 0))
+        self.assertEqual(nl['matvecs'][-1], prob.root.ln_solver.matvec_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -75,3 +75,38 @@ def to_slice(idxs):
     # set the upper bound to idxs[-1]+stride instead of idxs[-1]+1 because
     # later, we compare upper and lower bounds when collapsing slices
     return slice(idxs[0], idxs[-1]+stride, stride)
+
+
+def get_column_coloring(sparsity):
+    """
+    Partition the columns of a sparsity pattern into groups (colors) such
+    that no two columns in the same group have a nonzero in the same row.
+    Columns are colored greedily, densest first.
+
+    Args
+    ----
+    sparsity : ndarray
+        2D boolean array that is True wherever the matrix may be nonzero.
+
+    Returns
+    -------
+    list of ndarray
+        Sorted column indices for each color.
+    """
+    sparsity = np.asarray(sparsity, dtype=bool)
+    order = np.argsort(-sparsity.sum(axis=0), kind='mergesort')
+
+    colors = []
+    used_rows = []
+    for col in order:
+        rows = sparsity[:, col]
+        for i, used in enumerate(used_rows):
+            if not np.any(used & rows):
+                colors[i].append(col)
+                used |= rows
+                break
+        else:
+            colors.append([col])
+            used_rows.append(rows.copy())
+
+    return [np.array(sorted(c), dtype=int) for c in colors]